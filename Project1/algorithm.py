@@ -1,212 +1,374 @@
-import datetime as t
 import math as m
+import heapq
+from collections import deque
+import gridgraph as gg
+import pathview as pv
+import timing as tm
+import searchstats as ss
 
 
 # These algorithms are used to find the shortest path for the agent to reach till destination hopefully
 
 
 # Breadth First Search, Source and Destination with the created graph is passed as arguments
-# First we created a queue to store the visited nodes, dictionary to store the path
-# Storing total time taken in timetaken variable
-# Using while loop until the queue is empty and popping out the node in 'FIFO' manner
-# Checked the neighbors of a specific node, if not visited and not in queue then add to the queue.
+# The search runs over flat node indices (see gridgraph.indexed) so that membership is O(1):
+# 'seen' is a bytearray flagging every node already put in the queue and 'parent' holds the parent index.
+# Storing total time taken (ns, timing.py) in timetaken variable, 'timer' collects the search and path phases
+# Using while loop until the deque is empty and popping out the node in 'FIFO' manner
+# Checked the neighbors of a specific node, if not seen then add to the queue.
 # This function returns Success(S)/Failure(F) for finding the path.
-def bfs(graph, src, dest):
-    start_time = t.datetime.now()
-    visited = []  # keep track of visited nodes
-    queue = [src]  # queue for implementing BFS; add src node to the queue
-    path = {}
+# 'stats' (searchstats.SearchStats) is filled with the work done
+def bfs(graph, src, dest, timer=None, stats=None):
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()
     if src == dest:  # Checking source as destination
-        timetaken = (t.datetime.now() - start_time).microseconds
-        return ["S", dest, path[dest], timetaken]
+        timetaken = timer.since(start_time)
+        if stats is not None:
+            stats.record(1, 1, 0, 1)
+        return ["S", dest, pv.single(dest), timetaken]
+    ig = gg.indexed(graph)
+    srci, desti = ig.index(src), ig.index(dest)
+    seen = bytearray(ig.num_cells)  # keep track of discovered nodes
+    parent = [-1] * ig.num_cells
+    seen[srci] = 1
+    queue = deque([srci])  # queue for implementing BFS; add src node to the queue
+    neighbour_indices = ig.neighbour_indices
+    track, peak = stats is not None, 1
     # Run until the queue is empty
     while queue:
-        # Remove one node from the queue and check if it has been visited or not
-        node = queue.pop(0)
-        if node == dest:
-            path = get_path(path, src, dest)
-            timetaken = (t.datetime.now() - start_time).microseconds
-            return ["S", node, path, timetaken]
-        # get neighbors
-        neighbors = graph.get(node)
-        for neighbor in neighbors:
-            if neighbor not in visited and neighbor not in queue:
+        if track and len(queue) > peak:
+            peak = len(queue)
+        node = queue.popleft()
+        if node == desti:
+            timer.lap("search")
+            path = get_index_path(parent, srci, desti, ig)
+            timer.lap("path")
+            timetaken = timer.since(start_time)
+            if track:
+                record_seen(stats, seen, parent, queue, peak)
+            return ["S", dest, path, timetaken]
+        for neighbor in neighbour_indices(node):
+            if not seen[neighbor]:
                 # visit neighbors and add to queue
+                seen[neighbor] = 1
+                parent[neighbor] = node
                 queue.append(neighbor)
-                path[neighbor] = node
-        visited.append(node)
-    timetaken = (t.datetime.now() - start_time).microseconds
+    timer.lap("search")
+    timetaken = timer.since(start_time)
+    if track:
+        record_seen(stats, seen, parent, queue, peak)
     return ["F", None, [], timetaken]
 
 
 # Depth First Search, Source and Destination with the created graph is passed as arguments
-# First we created a stack for storing the visited nodes, dictionary to store the path
-# Storing total time taken in timetaken variable
+# Same bookkeeping as bfs ('seen' bytearray and 'parent' list over node indices) with a stack as frontier
+# Storing total time taken (ns, timing.py) in timetaken variable, 'timer' collects the search and path phases
 # Using while loop until the stack is empty and popping out the node in 'LIFO' manner
-# Checked the neighbors of a specific node, if not visited and not in queue then add to the Stack.
+# Checked the neighbors of a specific node, if not seen then add to the Stack.
 # This function returns Success(S)/Failure(F) for finding the path.
-def dfs(graph, src, dest):
-    start_time = t.datetime.now()
-    visited = []  # keep track of visited nodes
-    stack = [src]  # stack for implementing DFS; add src node to the stack
-    path = {}
+# 'stats' (searchstats.SearchStats) is filled with the work done
+def dfs(graph, src, dest, timer=None, stats=None):
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()
     if src == dest:  # Checking source as destination
-        timetaken = (t.datetime.now() - start_time).microseconds
-        return ["S", dest, path[dest], timetaken]
-    # Run until the queue is empty
+        timetaken = timer.since(start_time)
+        if stats is not None:
+            stats.record(1, 1, 0, 1)
+        return ["S", dest, pv.single(dest), timetaken]
+    ig = gg.indexed(graph)
+    srci, desti = ig.index(src), ig.index(dest)
+    seen = bytearray(ig.num_cells)  # keep track of discovered nodes
+    parent = [-1] * ig.num_cells
+    seen[srci] = 1
+    stack = [srci]  # stack for implementing DFS; add src node to the stack
+    neighbour_indices = ig.neighbour_indices
+    track, peak = stats is not None, 1
+    # Run until the stack is empty
     while stack:
-        # Remove one node from the stack and check if it has been visited or not
+        if track and len(stack) > peak:
+            peak = len(stack)
         node = stack.pop()
-        if node == dest:  # Checking node as destination
-            path = get_path(path, src, dest)
-            timetakem = (t.datetime.now() - start_time).microseconds
-            return ["S", node, path, timetakem]
-        # get neighbors
-        neighbors = graph[node]
-        for neighbor in neighbors:  # Checking for neighbors
-            if neighbor not in visited and neighbor not in stack:
-                # visit neighbors and add to queue
+        if node == desti:  # Checking node as destination
+            timer.lap("search")
+            path = get_index_path(parent, srci, desti, ig)
+            timer.lap("path")
+            timetaken = timer.since(start_time)
+            if track:
+                record_seen(stats, seen, parent, stack, peak)
+            return ["S", dest, path, timetaken]
+        for neighbor in neighbour_indices(node):  # Checking for neighbors
+            if not seen[neighbor]:
+                # visit neighbors and add to stack
+                seen[neighbor] = 1
+                parent[neighbor] = node
                 stack.append(neighbor)
-                path[neighbor] = node
-        visited.append(node)
-    timetaken = (t.datetime.now() - start_time).microseconds
+    timer.lap("search")
+    timetaken = timer.since(start_time)
+    if track:
+        record_seen(stats, seen, parent, stack, peak)
     return ["F", None, [], timetaken]
 
 
-# Iterative DFS is not computing for large maes so we have dropped
-# Iterative Depth First Search, Source and Destination with the created graph is passed as arguments
-# 'maxDepth' variable is used to search for the required depth needed and to not waste the extra loops to find the dest
-def callidfs(graph, src, des):
+# Fills 'stats' for bfs and dfs: every node flagged in 'seen' was pushed once and expanded unless still in 'frontier'
+def record_seen(stats, seen, parent, frontier, peak):
+    pushes = seen.count(1)
+    stats.record(pushes - len(frontier), pushes, 0, peak, ss.container_bytes((seen, parent), peak))
 
-    start_time = t.datetime.now()
 
-    def idfs(gr, s, tar, maxDepth):                  # gr is graph, s is source, tar is destination
-        currentnode = s
-        if currentnode == tar:
-            return True
+# Iterative deepening searches, Source and Destination with the created graph is passed as arguments
+# Depth first searches under a bound which grows at every iteration until dest is reached: iddfs bounds the depth
+# of a node, idastar bounds f = depth + estimate of the distance left (manhattan, chebyshev on a diagonal GridGraph).
+# Both run with an explicit stack over node indices, so there is no recursion and any maze size works.
+# The transposition table is kept between iterations: 'depth' holds the smallest depth each node was reached at and
+# 'parent' the node it was reached from. A node reached again no shallower than before is not searched again, and
+# an iteration does not restart from src but resumes from the nodes cut off by the previous bound (the 'fringe'),
+# every other node having already been searched as deep as the bound allowed. An iteration only pays for its new
+# layer instead of the whole tree again (as in Fringe Search).
+# The next bound is the smallest f cut off by the current one, the first is the estimate of src: with a consistent
+# estimate the path returned is a shortest path.
+# timetaken is registered (ns), 'timer' collects the search and path phases
+# 'stats' (searchstats.SearchStats) gets the iterations and the work over all of them
+def iddfs(graph, src, dest, timer=None, stats=None):
+    return deepening(graph, src, dest, lambda node: 0, timer, stats)
 
-        # If reached the maximum depth, stop recursing.
-        elif maxDepth <= 0:
-            return False
-        else:
-            if currentnode not in vv:                     # Recursive call to find the destination till required depth
-                for i in gr[currentnode]:
-                    if i not in vv:
-                        path[i] = currentnode
-                        vv.add(currentnode)
-                        if idfs(gr, i, tar, maxDepth - 1):
-                            return True
-        return False
-    try:
-        for j in range(get_step(len(graph.keys())), len(graph.keys()), get_step(len(graph.keys()))):
-            vv = set([])
-            path = {}
-            sol = idfs(graph, src, des, j)
-            if sol:
-                timetaken = (t.datetime.now() - start_time).microseconds
-                return ["S", des, get_path(path, src, des), timetaken]
-
-    except RecursionError:
-        timetaken = (t.datetime.now() - start_time).microseconds
+
+def idastar(graph, src, dest, timer=None, stats=None):
+    return deepening(graph, src, dest, None, timer, stats)
+
+
+# Common loop of iddfs and idastar, 'estimate' gives the distance left from a node index (None is manhattan)
+def deepening(graph, src, dest, estimate, timer, stats):
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()
+    ig = gg.indexed(graph)
+    srci, desti = ig.index(src), ig.index(dest)
+    if estimate is None:
+        estimate = distance_left(ig, dest)
+    depth = [-1] * ig.num_cells  # transposition table, -1 is not reached
+    parent = [-1] * ig.num_cells
+    depth[srci] = 0
+    fringe = [(srci, 0)]         # (node, depth it was pushed at)
+    bound = estimate(srci)
+    neighbour_indices = ig.neighbour_indices
+    found = False
+    track, peak = stats is not None, 1
+    iterations = expanded = pushes = reopens = 0
+    # Run until dest is reached or no node was cut off (nothing left to deepen)
+    while fringe and not found:
+        iterations += 1
+        stack, fringe, nextbound = fringe, [], m.inf
+        while stack:
+            if track and len(stack) + len(fringe) > peak:
+                peak = len(stack) + len(fringe)
+            node, d = stack.pop()
+            if d != depth[node]:
+                continue         # reached shallower since it was pushed
+            f = d + estimate(node)
+            if f > bound:        # cut off, searched again by the next iteration
+                fringe.append((node, d))
+                if f < nextbound:
+                    nextbound = f
+                continue
+            expanded += 1
+            if node == desti:
+                found = True
+                break
+            d += 1
+            for neighbor in neighbour_indices(node):
+                if depth[neighbor] == -1 or d < depth[neighbor]:
+                    if depth[neighbor] != -1:
+                        reopens += 1
+                    depth[neighbor] = d
+                    parent[neighbor] = node
+                    stack.append((neighbor, d))
+                    pushes += 1
+        bound = nextbound
+    timer.lap("search")
+    path = get_index_path(parent, srci, desti, ig) if found else None
+    timer.lap("path")
+    timetaken = timer.since(start_time)
+    if track:
+        stats.record(expanded, pushes + 1, reopens, peak, ss.container_bytes((depth, parent), peak), iterations)
+    if path is None:
         return ["F", None, [], timetaken]
-    timetaken = (t.datetime.now() - start_time).microseconds
-    return ["F", None, [], timetaken]
+    return ["S", dest, path, timetaken]
+
+
+# Estimate of the distance left to dest from a node index, used by idastar
+def distance_left(ig, dest):
+    coord = ig.coord
+    di, dj = dest
+    diagonal = getattr(ig, "diagonal", False)
+
+    def left(node):
+        i, j = coord(node)
+        if diagonal:
+            return max(abs(i - di), abs(j - dj))  # chebyshev, a diagonal step costs 1
+        return abs(i - di) + abs(j - dj)          # manhattan
+    return left
 
 
 # Bidirectional Breadth First Search, Source and Destination with the created graph is passed as arguments
-# 2 queues are used to travel from source and destination and to find the common link in between
-# Bidirectional BFS
-# Mainting 2 queues, 1 for start point path and another for end point path
-# timetaken is registered
-def bibfs(graph, src, dest):
-    start_time = t.datetime.now()
-    # keep track of visited nodes
-    fvisited = []
-    bvisited = []
-    path = []
-    # queue for implementing BFS; add src node to the queue
-    f_queue, b_queue = [src], [dest]
-
-    fpath = {}                          # Forward path
-    bpath = {}                          # Backward path
+# Two BFS run over node indices, one from src and one from dest, each keeping the distance and the parent of every
+# node it reached. At each round the side with the smaller frontier expands one whole level. A meeting is detected
+# when a node is inserted that the other side already reached (O(1) check on the other side's distance list).
+# The level is finished and the meeting with the smallest total distance is kept, so the path is a shortest path.
+# The path (pathview.PathView) reads both parent lists in place when it is read.
+# timetaken is registered (ns), 'timer' collects the search and path phases
+# 'stats' (searchstats.SearchStats) is filled with the work done, the frontier is both sides together
+def bibfs(graph, src, dest, timer=None, stats=None):
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()
     if src == dest:
-        timetaken = (t.datetime.now() - start_time).microseconds
-        return ["S", dest, path[dest], timetaken]
-    # Run until the queue is empty
-    while f_queue and b_queue:
-        # Remove one node from the queue and check if it has been visited or not
-        search(f_queue, fvisited, fpath, graph)
-        search(b_queue, bvisited, bpath, graph)
-        if set(fvisited) & set(bvisited):
-            tpath1 = get_path(fpath, src, list(set(fvisited) & set(bvisited)).pop())
-            tpath2 = get_path(bpath, dest, list(set(fvisited) & set(bvisited)).pop())
-            tpath2.pop()
-            tpath2.reverse()
-            path = tpath1 + tpath2
-            timetaken = (t.datetime.now() - start_time).microseconds
+        timetaken = timer.since(start_time)
+        if stats is not None:
+            stats.record(1, 1, 0, 1)
+        return ["S", dest, pv.single(dest), timetaken]
+    ig = gg.indexed(graph)
+    srci, desti = ig.index(src), ig.index(dest)
+    fdist, bdist = [-1] * ig.num_cells, [-1] * ig.num_cells      # distances from src / dest, -1 is not reached
+    fparent, bparent = [-1] * ig.num_cells, [-1] * ig.num_cells  # Forward path / Backward path
+    fdist[srci], bdist[desti] = 0, 0
+    ffrontier, bfrontier = [srci], [desti]
+    neighbour_indices = ig.neighbour_indices
+    track, peak, expanded = stats is not None, 2, 0
+    # Run until one of the frontiers is empty
+    while ffrontier and bfrontier:
+        if track:
+            peak = max(peak, len(ffrontier) + len(bfrontier))
+            expanded += min(len(ffrontier), len(bfrontier))
+        if len(ffrontier) <= len(bfrontier):
+            ffrontier, meet = expand_level(ffrontier, fdist, fparent, bdist, neighbour_indices)
+        else:
+            bfrontier, meet = expand_level(bfrontier, bdist, bparent, fdist, neighbour_indices)
+        if meet != -1:
+            timer.lap("search")
+            # src -> meet read backwards from the forward parents, then meet -> dest straight along the backward ones
+            tail = bparent[meet] if meet != desti else -1
+            path = pv.PathView(fparent, srci, meet, ig.coord, bparent, tail, desti)
+            timer.lap("path")
+            timetaken = timer.since(start_time)
+            if track:
+                record_bibfs(stats, expanded, fdist, bdist, fparent, bparent, peak)
             return ["S", dest, path, timetaken]
 
-    timetaken = (t.datetime.now() - start_time).microseconds
+    timer.lap("search")
+    timetaken = timer.since(start_time)
+    if track:
+        record_bibfs(stats, expanded, fdist, bdist, fparent, bparent, peak)
     return ["F", None, [], timetaken]
 
 
-# Search function to find the neighbors and add to the queue
-def search(queue, visited, path, graph):
-    node = queue.pop(0)
-    neighbors = graph.get(node)
-    if neighbors is not None:
-        for neighbor in neighbors:
-            if neighbor not in visited and neighbor not in queue:
-                # visit neighbors and add to queue
-                queue.append(neighbor)
-                path[neighbor] = node
-        visited.append(node)
+# Fills 'stats' for bibfs, every node reached by a side was pushed once by that side
+def record_bibfs(stats, expanded, fdist, bdist, fparent, bparent, peak):
+    pushes = 2 * len(fdist) - fdist.count(-1) - bdist.count(-1)
+    stats.record(expanded, pushes, 0, peak, ss.container_bytes((fdist, bdist, fparent, bparent), peak))
+
+
+# Expands one whole BFS level of one side of bibfs
+# Returns the next frontier and the meeting node with the smallest src-dest distance found (-1 if none)
+def expand_level(frontier, dist, parent, otherdist, neighbour_indices):
+    nextfrontier = []
+    meet, best = -1, m.inf
+    for node in frontier:
+        nd = dist[node] + 1
+        for neighbor in neighbour_indices(node):
+            if dist[neighbor] == -1:
+                dist[neighbor] = nd
+                parent[neighbor] = node
+                nextfrontier.append(neighbor)
+                if otherdist[neighbor] != -1 and nd + otherdist[neighbor] < best:
+                    meet, best = neighbor, nd + otherdist[neighbor]
+    return nextfrontier, meet
 
 
 # Dijkastra
-# processed variable is used as visited nodes and prev variable us used to store the parent key
-# distance mapping is initialized to zero and priority queue is maintained
-def dijkstra(graph, src, dest):
-    start_time = t.datetime.now()
-    dist = {}
-    processed = {}                  # visited
-    prev = {}                       # parent key
-    for v in graph.keys():
-        dist[v] = m.inf                   # distance mapping
-        processed[v] = False
-        prev[v] = None
-
-    dist[src] = 0
-    pqueue = [{src: dist[src]}]
-    prev[src] = src
-
-# popping out elements from priority queue as First out
+# Binary heap of (distance, node index) entries. Decrease-key is done by lazy deletion: a better distance just
+# pushes a new entry and stale entries are skipped when popped (already processed). The search stops as soon as
+# dest is popped. dist, processed and prev are preallocated over node indices.
+# 'cost' is optional: None means every step costs 1, otherwise it is either a function cost(u, v) giving the cost
+# of the step from u to v, or a per cell cost map indexed by node (e.g. a numpy array shaped like the maze or a
+# dict) giving the cost of entering that cell. Costs must not be negative.
+# 'timer' (timing.Timer) collects the search and path phases, timetaken is in ns
+# 'stats' (searchstats.SearchStats) is filled with the work done, a reopen is a decrease-key
+def dijkstra(graph, src, dest, cost=None, timer=None, stats=None):
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()
+    ig = gg.indexed(graph)
+    weight = get_weight(ig, cost)
+    srci, desti = ig.index(src), ig.index(dest)
+    dist = [m.inf] * ig.num_cells                  # distance mapping
+    processed = bytearray(ig.num_cells)            # visited
+    prev = [-1] * ig.num_cells                     # parent index
+    dist[srci] = 0
+    pqueue = [(0, srci)]
+    neighbour_indices = ig.neighbour_indices
+    track, peak, pushes = stats is not None, 1, 1
+
+    # popping out elements from priority queue with the minimum distance first
     while pqueue:
-        node = pqueue.pop(0)
-        v = list(node.keys())[0]
-        d = node.get(v)
-        if not (processed.get(v)):
-            for u in graph.get(v):
-                if d + 1 < dist[u]:
-                    dist[u] = d + 1
-                    addupdatepqueue(pqueue, u, dist[u])
-                    prev[u] = v
-        processed[v] = True
-    path = get_path(prev, src, dest)
-    timetaken = (t.datetime.now() - start_time).microseconds
+        if track and len(pqueue) > peak:
+            peak = len(pqueue)
+        d, v = heapq.heappop(pqueue)
+        if processed[v]:
+            continue                               # stale entry left behind by a decrease-key
+        processed[v] = 1
+        if v == desti:
+            break
+        for u in neighbour_indices(v):
+            nd = d + (1 if weight is None else weight(v, u))
+            if nd < dist[u]:
+                dist[u] = nd
+                prev[u] = v
+                heapq.heappush(pqueue, (nd, u))
+                pushes += 1
+    timer.lap("search")
+    path = get_index_path(prev, srci, desti, ig)
+    timer.lap("path")
+    timetaken = timer.since(start_time)
+    if track:
+        reached = len(dist) - dist.count(m.inf)
+        stats.record(processed.count(1), pushes, pushes - reached, peak,
+                     ss.container_bytes((dist, processed, prev), peak))
     if path is None:
         return "F", None, [], timetaken
     else:
         return "S", dest, path, timetaken
 
 
-# dijkstra, c is cost, n is nodes
-def addupdatepqueue(pqueue, n, c):
-    for item in pqueue:
-        if n in list(item.keys()):
-            item[n] = c
-            break
-    pqueue.append({n: c})
+# Builds the weight(u, v) function over node indices used by dijkstra from its 'cost' argument
+def get_weight(ig, cost):
+    if cost is None:
+        return None
+    if callable(cost):
+        coord = ig.coord
+        return lambda u, v: cost(coord(u), coord(v))
+    if isinstance(ig, gg.GridGraph) and hasattr(cost, "shape"):
+        # cost map shaped like the maze, flattened once so lookups are plain list indexing
+        flat = cost.reshape(ig.num_cells).tolist()
+        return lambda u, v: flat[v]
+    coord = ig.coord
+    return lambda u, v: cost[coord(v)]
+
+
+# Breadth first distances from src to every node of the graph in one pass
+# Returns the list of distances over node indices (-1 where src cannot be reached) and the indexed graph
+# used for the indices (gridgraph.indexed), so ig.coord(i) gives the node of dist[i]
+def bfs_distances(graph, src):
+    ig = gg.indexed(graph)
+    dist = [-1] * ig.num_cells
+    srci = ig.index(src)
+    dist[srci] = 0
+    queue = deque([srci])
+    neighbour_indices = ig.neighbour_indices
+    while queue:
+        node = queue.popleft()
+        nd = dist[node] + 1
+        for neighbor in neighbour_indices(node):
+            if dist[neighbor] == -1:
+                dist[neighbor] = nd
+                queue.append(neighbor)
+    return dist, ig
 
 
 # Function to find the path until the parent is source
@@ -230,19 +392,10 @@ def get_path(path, src, dest):
     return pathtaken
 
 
-# Function to select a particular size for iterative maxDepth as the maze size increases
-# keys represent the number of keys in the maze
-def get_step(keys):
-    if keys <= 10:
-        return 2
-    elif 10 < keys <= 30:
-        return 5
-    elif 30 < keys <= 50:
-        return 10
-    elif 50 < keys <= 70:
-        return 15
-    elif 70 < keys <= 100:
-        return 20
-    else:
-        return 25
-
+# Same as get_path but over the 'parent' index list used by the index searches
+# Returns a pathview.PathView of (i, j) nodes reading 'parent' in place (None if dest was never reached), the
+# searches build their parent lists as trees rooted at srci so a parent set on dest leads back to src
+def get_index_path(parent, srci, desti, ig):
+    if desti != srci and parent[desti] == -1:
+        return None
+    return pv.PathView(parent, srci, desti, ig.coord)
@@ -2,33 +2,39 @@ import statistics
 import createmaze as mz
 import algorithm as al
 import visualisation as vis
+import seeding as sd
+import timing as tm
+import searchstats as ss
 import matplotlib.pyplot as plt
 
 
 # This method is used to generate sample mazes for given size
-def generate_sample():
+# Sizes go from startsize to endsize by step
+# seed is the master seed (seeding.py), maze x of a size and probability comes from stream (size, probability index, x)
+def generate_sample(startsize, endsize, step, seed=None):
     prob_list = [0.1, 0.3, 0.5]
-    startsize = int(input("Enter the Start size "))
-    endsize = int(input("Enter the End size "))
-    step = int(input("Enter the growth size "))
 
     for size in range(startsize, endsize + step, step):
-        for prob in prob_list:
+        for pindex, prob in enumerate(prob_list):
             print("Sample mazes of " + str(size) + " with " + str(prob) + " will be generated")
             for x in range(0, 2):  # 2 Iterations and mean results
-                maze = mz.create_maze(size, prob)
+                maze = mz.create_maze(size, prob, sd.generator(seed, size, pindex, x))
                 vis.display_maze(maze, size, "Maze with size " + str(size) + " and probability of " + str(prob))
 
 
 # Generating dictionary with probability from 0.1 to 0.9 and value holds another dictionary with keys as size and
-# value as success count, total cost and time taken for 10 iterations of each search algorithm.
-def letsfind():
-    startsize = int(input("Enter the starting  size "))
-    endsize = int(input("Enter the max size "))
-    step = int(input("Enter the growth size "))
+# value as success count, total cost and time taken (ns) for 10 iterations of each search algorithm, and the time
+# taken to build the graph.
+# Nodes expanded (<algo>_expansions) and the other searchstats counters (<algo>_stats) are kept for every search,
+# the deepening iterations of iddfs and idastar are in their stats.
+# Sizes go from startsize to endsize by step, the figures are drawn when plot is True
+# seed is the master seed, maze x of a size and probability comes from stream (size, probability index, x)
+# 'corpus' (mazecorpus.MazeCorpus) gives the mazes instead: the first two of each size and probability are read
+# Returns the dictionary
+def letsfind(startsize, endsize, step, seed=None, plot=True, corpus=None):
     data = {}  # The main dictionary
     probability_list = [0.1, 0.3, 0.5, 0.7, ]  # Probability list
-    for probability in probability_list:  # Looping for each probability
+    for pindex, probability in enumerate(probability_list):  # Looping for each probability
         subdict = {}
         for size in range(startsize, endsize + step, step):  # Looping for each size defined
             successcount = 0  # Initializations
@@ -36,43 +42,79 @@ def letsfind():
             paths_dfs = []
             paths_dijk = []
             paths_bibfs = []
+            paths_iddfs = []
+            paths_idastar = []
             time_bfs = []
             time_dfs = []
             time_dijk = []
             time_bibfs = []
+            time_iddfs = []
+            time_idastar = []
+            time_graph = []
+            stats = {algo: ss.StatsAggregate()                              # work of each search
+                     for algo in ("bfs", "dfs", "dijk", "bibfs", "iddfs", "idastar")}
+
+            records = None if corpus is None else corpus.take(size, probability, 2)
 
             for x in range(0, 2):                                       # 10 Iterations and mean results
-                maze = mz.create_maze(size, probability)
+                if corpus is None:
+                    maze = mz.create_maze(size, probability, sd.generator(seed, size, pindex, x))
+                else:
+                    maze = corpus[records[x]]
                 print("Maze Moving to Next")
 
-                graph = mz.create_graph(maze)                            # Create graph through maze
+                buildstart = tm.now()
+                graph = mz.create_gridgraph(maze)                            # Create graph through maze
+                time_graph.append(tm.now() - buildstart)
                 print("Graph Moving to Next")
 
                 start = (0, 0)                                           # start point
                 end = ((maze.shape[0] - 1), (maze.shape[0] - 1))         # End point
 
-                bfs_sol = al.bfs(graph, start, end)  # BFS
+                run = ss.SearchStats()
+                bfs_sol = al.bfs(graph, start, end, stats=run)  # BFS
+                stats["bfs"].add(run)
                 print("BFS  Moving to Next")
                 paths_bfs.append(len(bfs_sol[2]))
                 time_bfs.append(bfs_sol[3])
                 if bfs_sol[0] == "S":
                     successcount = successcount + 1  # Success count incrementing
 
-                dfs_sol = al.dfs(graph, start, end)  # DFS
+                run = ss.SearchStats()
+                dfs_sol = al.dfs(graph, start, end, stats=run)  # DFS
+                stats["dfs"].add(run)
                 print("DFS  Moving to Next")
                 paths_dfs.append(len(dfs_sol[2]))
                 time_dfs.append(dfs_sol[3])
 
-                dijk_sol = al.dijkstra(graph, start, end)  # DIJKSTRA
+                run = ss.SearchStats()
+                dijk_sol = al.dijkstra(graph, start, end, stats=run)  # DIJKSTRA
+                stats["dijk"].add(run)
                 print("Dijkstra Moving to Next")
                 paths_dijk.append(len(dijk_sol[2]))
                 time_dijk.append(dijk_sol[3])
 
-                bibfs_sol = al.bibfs(graph, start, end)  # BI-BFS
+                run = ss.SearchStats()
+                bibfs_sol = al.bibfs(graph, start, end, stats=run)  # BI-BFS
+                stats["bibfs"].add(run)
                 print("BiBFS Moving to Next")
                 paths_bibfs.append(len(bibfs_sol[2]))
                 time_bibfs.append(bibfs_sol[3])
 
+                run = ss.SearchStats()
+                iddfs_sol = al.iddfs(graph, start, end, stats=run)  # Iterative deepening DFS
+                stats["iddfs"].add(run)
+                print("IDDFS Moving to Next")
+                paths_iddfs.append(len(iddfs_sol[2]))
+                time_iddfs.append(iddfs_sol[3])
+
+                run = ss.SearchStats()
+                idastar_sol = al.idastar(graph, start, end, stats=run)  # IDA*
+                stats["idastar"].add(run)
+                print("IDA* Moving to Next")
+                paths_idastar.append(len(idastar_sol[2]))
+                time_idastar.append(idastar_sol[3])
+
             # Dictionary holding size as keys and Means results of each algorithm
             subdict[size] = {
                 "TotalSuccessRate": successcount,
@@ -83,20 +125,33 @@ def letsfind():
                 "dijk_path": statistics.mean(paths_dijk),
                 "dijk_time": statistics.mean(time_dijk),
                 "bibfs_path": statistics.mean(paths_bibfs),
-                "bibfs_time": statistics.mean(time_bibfs)}
+                "bibfs_time": statistics.mean(time_bibfs),
+                "iddfs_path": statistics.mean(paths_iddfs),
+                "iddfs_time": statistics.mean(time_iddfs),
+                "idastar_path": statistics.mean(paths_idastar),
+                "idastar_time": statistics.mean(time_idastar),
+                "graph_time": statistics.mean(time_graph)}
+            for algo, aggregate in stats.items():
+                subdict[size][algo + "_expansions"] = aggregate.mean("expansions")
+                subdict[size][algo + "_stats"] = aggregate.summary()
 
         data[probability] = subdict  # Adding Probability as keys and Values as the sub dictionary
 
-    vis.disp_stats_for_probab(data, startsize, endsize, step, probability_list)           # success rate vs size
-    vis.disp_time_for_probab3(data, startsize, endsize, step)                             # time vs size
-    vis.disp_path_for_probab3(data, startsize, endsize, step)                             # Path vs size
+    if plot:
+        vis.disp_stats_for_probab(data, startsize, endsize, step, probability_list)       # success rate vs size
+        vis.disp_time_for_probab3(data, startsize, endsize, step)                         # time vs size
+        vis.disp_path_for_probab3(data, startsize, endsize, step)                         # Path vs size
+    return data
 
 
-# Function calling for Analysis results
-letsfind()
+if __name__ == '__main__':
+    # Function calling for Analysis results
+    letsfind(int(input("Enter the starting  size ")), int(input("Enter the max size ")),
+             int(input("Enter the growth size ")))
 
-# Two sample maze of given size and probability
-generate_sample()
+    # Two sample maze of given size and probability
+    generate_sample(int(input("Enter the Start size ")), int(input("Enter the End size ")),
+                    int(input("Enter the growth size ")))
 
-# To show the figures
-plt.show()
+    # To show the figures
+    plt.show()
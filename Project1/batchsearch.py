@@ -0,0 +1,109 @@
+import numpy as np
+import gridgraph as gg
+import timing as tm
+
+# Searches over a batch of mazes in lockstep
+# The mazes of an (n, size, size) array (createmaze.create_mazes) are searched together: every step is a few numpy
+# operations over the frontiers of all the mazes, so the Python overhead is paid per step instead of per node and per
+# maze. As in distancefield, the cells of the batch get flat indices (maze * size * size + i * size + j) and one
+# neighbour bitmask each (gridgraph layout, 4-connected), and the frontier is an array of flat indices with their
+# costs g. At every step each maze expands all its frontier cells of the smallest f = g + h together and pushes their
+# neighbours with g + 1 where that improves their cost (entries left with an older cost are dropped).
+# With h the manhattan distance to dest this is A* expanding a whole f level at once (the cells of an f level are
+# expanded together instead of in heap order, so the last level may count a few more expansions than a
+# one-node-at-a-time A*), with h = 0 it is a BFS wavefront.
+# A maze is done when dest is expanded (success) or its frontier is empty (failure), its entries then leave the
+# frontier.
+#
+#     success, pathlength, expansions, timetaken = batch_astar(mz.create_mazes(100, 50, 0.3, rng))
+#     success.sum(), pathlength[success].mean(), expansions.mean()
+
+BIG = np.iinfo(np.int32).max  # cost of cells not reached
+
+
+# BFS wavefront over a batch, see lockstep
+def batch_bfs(mazes, src=(0, 0), dest=None, timer=None):
+    return lockstep(mazes, src, dest, False, timer)
+
+
+# A* (manhattan) over a batch, see lockstep
+def batch_astar(mazes, src=(0, 0), dest=None, timer=None):
+    return lockstep(mazes, src, dest, True, timer)
+
+
+# Neighbour bitmasks of every cell of a batch of open masks, flattened (bit k is gridgraph.STEPS[k])
+def batch_bits(opened):
+    n, height, width = opened.shape
+    padded = np.zeros((n, height + 2, width + 2), dtype=bool)
+    padded[:, 1:-1, 1:-1] = opened
+    bits = np.zeros(opened.shape, dtype=np.uint8)
+    for k in range(4):
+        di, dj = gg.STEPS[k]
+        bits |= padded[:, 1 + di:height + 1 + di, 1 + dj:width + 1 + dj].astype(np.uint8) << k
+    bits[~opened] = 0
+    return bits.reshape(-1)
+
+
+# Searches every maze of 'mazes' from src to dest (default the far corner)
+# Returns numpy arrays over the mazes: success (bool), pathlength (nodes of the path found, 0 on failure) and
+# expansions (cells expanded), and the time taken for the whole batch (ns, timing.py)
+# 'timer' (timing.Timer) collects the search phase
+def lockstep(mazes, src, dest, heuristic, timer=None):
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()
+    mazes = np.asarray(mazes)
+    opened = gg.open_cells(mazes.reshape(-1, mazes.shape[-1])).reshape(mazes.shape)  # stacked rows of all mazes
+    n, height, width = opened.shape
+    cells = height * width
+    if dest is None:
+        dest = (height - 1, width - 1)
+    srcflat, destflat = src[0] * width + src[1], dest[0] * width + dest[1]
+    success = np.zeros(n, dtype=bool)
+    pathlength = np.zeros(n, dtype=np.int64)
+    expansions = np.zeros(n, dtype=np.int64)
+    rows, cols = np.divmod(np.arange(cells), width)
+    h = np.abs(rows - dest[0]) + np.abs(cols - dest[1]) if heuristic else np.zeros(cells, dtype=np.int64)
+    bits = batch_bits(opened)
+    offsets = np.array([di * width + dj for (di, dj) in gg.STEPS[:4]], dtype=np.int64)
+
+    g = np.full(n * cells, BIG, dtype=np.int32)
+    live = np.ones(n, dtype=bool)  # mazes still searching
+    frontier = np.flatnonzero(opened[:, src[0], src[1]] & opened[:, dest[0], dest[1]]) * cells + srcflat
+    frontierg = np.zeros(len(frontier), dtype=np.int32)
+    g[frontier] = 0
+    while len(frontier):
+        maze = frontier // cells
+        f = frontierg + h[frontier - maze * cells]
+        fmin = np.full(n, BIG, dtype=np.int64)
+        np.minimum.at(fmin, maze, f)
+        chosen = f == fmin[maze]
+        expanded, expandedg = frontier[chosen], frontierg[chosen]
+        expansions += np.bincount(maze[chosen], minlength=n)
+        # mazes which expanded dest succeed and stop
+        reached = expanded[expanded - (expanded // cells) * cells == destflat]
+        success[reached // cells] = True
+        pathlength[reached // cells] = g[reached] + 1
+        live[reached // cells] = False
+        keep = live[expanded // cells]
+        expanded, expandedg = expanded[keep], expandedg[keep]
+        # neighbours of the expanded cells, cost g + 1, the cheapest of each cell is kept
+        expandedbits = bits[expanded]
+        children, childreng = [], []
+        for k in range(4):
+            has = (expandedbits >> k) & 1 == 1
+            children.append(expanded[has] + offsets[k])
+            childreng.append(expandedg[has] + 1)
+        child, childg = np.concatenate(children), np.concatenate(childreng)
+        better = childg < g[child]
+        child, childg = child[better], childg[better]
+        order = np.lexsort((childg, child))
+        child, first = np.unique(child[order], return_index=True)
+        childg = childg[order][first]
+        g[child] = childg
+        # the frontier keeps the entries not expanded, of live mazes and still at their cell's cost
+        rest, restg = frontier[~chosen], frontierg[~chosen]
+        keep = live[rest // cells] & (restg == g[rest])
+        frontier = np.concatenate((rest[keep], child))
+        frontierg = np.concatenate((restg[keep], childg))
+    timer.lap("search")
+    return success, pathlength, expansions, timer.since(start_time)
@@ -0,0 +1,368 @@
+import os
+os.environ.setdefault("MPLBACKEND", "Agg")  # the modules under test import pyplot, never open a figure
+
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+import numpy as np
+import createmaze as mz
+import algorithm as al
+import maze_thinning as mt
+import solutions as so
+import hpa
+import batchsearch as bs
+import seeding as sd
+
+# Benchmark suite. Nothing here opens a figure or asks for input so it runs headless (CI, servers):
+#     python benchmark.py                                   every case at its default sizes and densities
+#     python benchmark.py --cases "search.*" --sizes 100 200 --output new.json
+#     python benchmark.py --output new.json --baseline old.json     exit status 1 if a case got slower
+#     python benchmark.py --baseline benchmark_baseline.json        against the committed baseline
+#     python benchmark.py --legacy                          the scaling tables below
+#
+# A case is registered with @case: its setup function gets (size, density, seed), builds the instance (maze, graph,
+# fire start...) outside the timing and returns the function which is timed. Results are a JSON file with one record
+# per (case, size, density) and the best, median and mean of the repeats in seconds. compare() matches two result
+# files on (case, size, density) and flags the cases whose median grew by more than the threshold.
+# benchmark_baseline.json is a run of every case at its defaults (the machine is in its "meta"). Timings only compare
+# on the same machine: rewrite it with --output benchmark_baseline.json before comparing on another one.
+
+PROJECT2 = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Project2")
+
+MAZE_SIZES = (50, 100, 200)
+MAZE_DENSITIES = (0.2, 0.3)
+FIRE_SIZES = (30, 70)
+FLAMABILITY = 0.3
+MINESWEEPER_SIZES = (8, 10)
+MINE_DENSITIES = (0.2, 0.4)
+
+CASES = {}  # name -> (setup, default sizes, default densities, fixed)
+
+
+# Registers the decorated setup function as a benchmark case
+# A 'fixed' case always runs at its own sizes and densities, the --sizes and --densities overrides are meant for mazes
+def case(name, sizes=MAZE_SIZES, densities=MAZE_DENSITIES, fixed=False):
+    def register(setup):
+        CASES[name] = (setup, sizes, densities, fixed)
+        return setup
+    return register
+
+
+# Solvable maze of a case and its graph, the same for every case with the same size, density and seed
+def instance(size, density, seed):
+    maze = mz.sample_solvable_maze(size, density, sd.generator(seed, size, int(round(density * 1000))))[0]
+    return maze, mz.create_gridgraph(maze)
+
+
+# ---- maze generation and graph build ----
+
+@case("maze.create")
+def setup_create_maze(size, density, seed):
+    return lambda: mz.create_maze(size, density, seed)
+
+
+@case("maze.sample_solvable")
+def setup_sample_solvable(size, density, seed):
+    return lambda: mz.sample_solvable_maze(size, density, seed)
+
+
+@case("graph.gridgraph")
+def setup_gridgraph(size, density, seed):
+    maze = instance(size, density, seed)[0]
+    return lambda: mz.create_gridgraph(maze)
+
+
+@case("graph.dict")
+def setup_dictgraph(size, density, seed):
+    maze = instance(size, density, seed)[0]
+    return lambda: mz.create_graph(maze)
+
+
+@case("graph.hpa")
+def setup_hpagraph(size, density, seed):
+    graph = instance(size, density, seed)[1]
+    return lambda: hpa.HPAGraph(graph)
+
+
+# ---- uninformed searches (algorithm.py) ----
+
+def search_case(name, search):
+    @case(name)
+    def setup(size, density, seed):
+        graph = instance(size, density, seed)[1]
+        return lambda: search(graph, (0, 0), (size - 1, size - 1))
+    return setup
+
+
+for searchname, searchfn in [("bfs", al.bfs), ("dfs", al.dfs), ("bibfs", al.bibfs), ("dijkstra", al.dijkstra),
+                             ("iddfs", al.iddfs), ("idastar", al.idastar)]:
+    search_case("search." + searchname, searchfn)
+
+
+# ---- A* heuristics (maze_thinning.py) ----
+
+def astar_case(name, option):
+    @case(name)
+    def setup(size, density, seed):
+        graph = instance(size, density, seed)[1]
+        return lambda: mt.astar(graph, (0, 0), (size - 1, size - 1), option)
+    return setup
+
+
+astar_case("astar.manhattan", "M")
+astar_case("astar.euclidean", "E")
+astar_case("astar.jps", "J")
+
+
+@case("astar.thinning")
+def setup_astar_thinning(size, density, seed):
+    maze, graph = instance(size, density, seed)
+    thinned = mz.create_gridgraph(mz.maze_thinning(0.5, maze.copy(), seed))
+
+    def run():
+        mt.clear_heuristic_cache()  # the heuristic table is part of the cost
+        return mt.astarthinning(thinned, graph, (0, 0), (size - 1, size - 1))
+    return run
+
+
+@case("astar.diagonal")
+def setup_astar_diagonal(size, density, seed):
+    maze, graph = instance(size, density, seed)
+    relaxed = mz.create_relaxedgridgraph(maze)
+
+    def run():
+        mt.clear_heuristic_cache()
+        return mt.astardiagonal(relaxed, graph, (0, 0), (size - 1, size - 1))
+    return run
+
+
+@case("astar.hpa")
+def setup_astar_hpa(size, density, seed):
+    hgraph = hpa.HPAGraph(instance(size, density, seed)[1])
+    hpa.hpastar(hgraph, (0, 0), (size - 1, size - 1))  # fills the distance tables along the corridor
+    return lambda: hpa.hpastar(hgraph, (0, 0), (size - 1, size - 1))
+
+
+# ---- batched searches (batchsearch.py), 100 mazes per run ----
+
+BATCH = 100
+
+
+def batch_case(name, search):
+    @case(name)
+    def setup(size, density, seed):
+        mazes = mz.create_mazes(BATCH, size, density, sd.generator(seed, size, int(round(density * 1000))))
+        return lambda: search(mazes)
+    return setup
+
+
+batch_case("batch.bfs", bs.batch_bfs)
+batch_case("batch.astar", bs.batch_astar)
+
+
+# ---- fire strategies (solutions.py) ----
+
+def fire_case(name, strategy):
+    @case(name, FIRE_SIZES)
+    def setup(size, density, seed):
+        maze, graph = instance(size, density, seed)
+        firestart = so.let_there_be_fire(graph, (0, 0), (size - 1, size - 1), rng=seed)
+
+        def run():
+            return strategy(maze.copy(), size, graph.copy(), (0, 0), (size - 1, size - 1), firestart, FLAMABILITY,
+                            False, sd.generator(seed, 1))
+        return run
+    return setup
+
+
+for firename, firefn in [("sol1", so.sol1), ("sol2", so.sol2), ("sol3", so.sol3), ("sol4", so.sol4)]:
+    fire_case("fire." + firename, firefn)
+
+
+# ---- Minesweeper agents (Project2), size is the board size and density the mine density ----
+# Fixed cases: the agents are far slower per cell than the searches, a board of a maze size does not finish
+
+def minesweeper_case(name, module, cls, agent=None):
+    @case(name, MINESWEEPER_SIZES, MINE_DENSITIES, fixed=True)
+    def setup(size, density, seed):
+        if PROJECT2 not in sys.path:
+            sys.path.insert(0, PROJECT2)
+        play = getattr(__import__(module), cls)
+        args = (size, density, "A") if agent is None else (size, density, agent, "A")
+        return lambda: play(*args, seed=seed).letsplay()
+    return setup
+
+
+minesweeper_case("minesweeper.basic", "MineSweeper1", "MineSweeperPlay")
+minesweeper_case("minesweeper.knowledge", "MineSweeper2", "MineSweeper2Play")
+minesweeper_case("minesweeper.probabilistic", "MineSweeper3", "MineSweeper3Play", "P")
+minesweeper_case("minesweeper.improved", "MineSweeper3", "MineSweeper3Play", "IP")
+
+
+# ---- runner ----
+
+# Times fn 'repeat' times, returns the list of durations in seconds
+def measure(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+# Runs the cases matching 'patterns' (fnmatch, e.g. "search.*") at their default sizes and densities, or at the
+# given ones (except for the fixed cases), and returns the records
+def run_benchmarks(patterns=("*",), sizes=None, densities=None, repeat=5, seed=0, verbose=True):
+    records = []
+    for name in sorted(CASES):
+        if not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
+        setup, casesizes, casedensities, fixed = CASES[name]
+        for size in casesizes if fixed else sizes or casesizes:
+            for density in casedensities if fixed else densities or casedensities:
+                times = measure(setup(size, density, seed), repeat)
+                record = {"case": name, "size": size, "density": density, "best": min(times),
+                          "median": statistics.median(times), "mean": statistics.mean(times), "repeat": repeat}
+                records.append(record)
+                if verbose:
+                    print("%-28s %-6d %-8.3f %-12.6f %-12.6f" % (name, size, density, record["best"],
+                                                                 record["median"]))
+    return records
+
+
+def save_results(path, records, seed=0):
+    meta = {"python": platform.python_version(), "numpy": np.__version__, "platform": platform.platform(),
+            "seed": seed, "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": records}, f, indent=1)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+# Matches records with the baseline on (case, size, density)
+# Returns the list of (key, baseline median, new median, ratio) where the median grew by more than 'threshold' times
+def compare(records, baseline, threshold=1.25, verbose=True):
+    old = {(r["case"], r["size"], r["density"]): r for r in baseline}
+    regressions = []
+    for record in records:
+        key = (record["case"], record["size"], record["density"])
+        if key not in old:
+            continue
+        before = old[key]["median"]
+        ratio = record["median"] / before if before > 0 else float("inf")
+        flag = ratio > threshold
+        if flag:
+            regressions.append((key, before, record["median"], ratio))
+        if verbose:
+            print("%-28s %-6d %-8.3f %-12.6f %-12.6f %-7.2f %s" % (key + (before, record["median"], ratio,
+                                                                         "REGRESSION" if flag else "")))
+    return regressions
+
+
+# Times bfs and dfs on growing mazes and prints the time per open cell.
+# The destination is made unreachable so both searches have to visit the whole component of the source,
+# if they scale linearly the ns/cell column stays flat as the size grows.
+def bench_search_scaling(sizes=(250, 500, 1000, 2000), prob=0.3, seed=0):
+    np.random.seed(seed)
+    print("%-6s %-10s %-6s %-12s %-10s" % ("size", "open", "algo", "time(s)", "ns/cell"))
+    for size in sizes:
+        maze = mz.create_maze(size, prob)
+        maze[0, :] = 0  # open corridors along the borders so the source joins the big open component
+        maze[:, 0] = 0
+        maze[size - 2][size - 1] = 1  # wall the destination in so the search covers the whole component
+        maze[size - 1][size - 2] = 1
+        graph = mz.create_gridgraph(maze)
+        opencells = len(graph)
+        for name, search in [("bfs", al.bfs), ("dfs", al.dfs)]:
+            start = time.perf_counter()
+            search(graph, (0, 0), (size - 1, size - 1))
+            elapsed = time.perf_counter() - start
+            print("%-6d %-10d %-6s %-12.4f %-10.1f" % (size, opencells, name, elapsed, elapsed * 1e9 / opencells))
+
+
+# The list based queue maze_thinning used before the heap version, kept here only to compare against
+class ListPriorityQueue(object):
+    def __init__(self):
+        self.pqueue = []
+
+    def isempty(self):
+        return len(self.pqueue) == 0
+
+    def add(self, item, priority):
+        self.pqueue.append((item, priority))
+
+    def popmin(self):
+        mini = 0
+        for i in range(len(self.pqueue)):
+            if self.pqueue[i][1] < self.pqueue[mini][1]:
+                mini = i
+        mininode = self.pqueue[mini][0]
+        del self.pqueue[mini]
+        return mininode
+
+
+# Pushes n random priorities then pops them all, for the old list queue and the heap queue (plain and indexed).
+# The list queue is quadratic so it is only run up to 'listlimit' pushes.
+def bench_priority_queue(counts=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), listlimit=10 ** 4, seed=0):
+    rng = np.random.default_rng(seed)
+    print("%-9s %-10s %-12s" % ("pushes", "queue", "time(s)"))
+    for n in counts:
+        priorities = rng.integers(0, n, n).tolist()
+        queues = [("heap", lambda: mt.PriorityQueue()), ("indexed", lambda: mt.PriorityQueue(indexed=True))]
+        if n <= listlimit:
+            queues.insert(0, ("list", ListPriorityQueue))
+        for name, make in queues:
+            queue = make()
+            start = time.perf_counter()
+            for item, priority in enumerate(priorities):
+                queue.add(item, priority)
+            while not queue.isempty():
+                queue.popmin()
+            print("%-9d %-10s %-12.4f" % (n, name, time.perf_counter() - start))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite of Project1 and Project2")
+    parser.add_argument("--cases", nargs="+", default=["*"], help="fnmatch patterns of the cases to run")
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        help="sizes for every maze case (default: per case, the Minesweeper cases keep theirs)")
+    parser.add_argument("--densities", nargs="+", type=float,
+                        help="densities for every maze case (default: per case, the Minesweeper cases keep theirs)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="median ratio flagged as a regression")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument("--legacy", action="store_true", help="run the scaling tables instead")
+    args = parser.parse_args(argv)
+    if args.list:
+        for name in sorted(CASES):
+            print(name)
+        return 0
+    if args.legacy:
+        bench_search_scaling()
+        bench_priority_queue()
+        return 0
+    print("%-28s %-6s %-8s %-12s %-12s" % ("case", "size", "density", "best(s)", "median(s)"))
+    records = run_benchmarks(args.cases, args.sizes, args.densities, args.repeat, args.seed)
+    if args.output:
+        save_results(args.output, records, args.seed)
+    if args.baseline:
+        print("%-28s %-6s %-8s %-12s %-12s %-7s" % ("case", "size", "density", "baseline(s)", "median(s)", "ratio"))
+        regressions = compare(records, load_results(args.baseline), args.threshold)
+        print("%d regression(s)" % len(regressions))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,26 +1,108 @@
-import datetime as t
 import numpy as np
 import math as m
+import gridgraph as gg
 
 
 # Function creates a maze with a specific probability of blockages.
-def create_maze(size, prob):
-    num = [[np.random.choice(np.arange(2), 1, p=[1 - prob, prob]) for i in range(size)] for j in range(size)]
-    num_arr = np.array(num)
-    num_arr[0][0] = 0  # Start point initialized
-    num_arr[size - 1][size - 1] = 0  # Goal point initialized
+# The whole (size, size) uint8 grid is drawn at once, 1 is blocked and 0 is open.
+# 'rng' is a numpy Generator or a seed, None uses the global np.random state
+def create_maze(size, prob, rng=None):
+    return create_mazes(None, size, prob, rng)
+
+
+# Function creates 'n' mazes at once as a (n, size, size) uint8 array, n=None gives a single (size, size) maze
+def create_mazes(n, size, prob, rng=None):
+    shape = (size, size) if n is None else (n, size, size)
+    draw = np.random.random(shape) if rng is None else np.random.default_rng(rng).random(shape)
+    num_arr = (draw < prob).astype(np.uint8)
+    num_arr[..., 0, 0] = 0  # Start point initialized
+    num_arr[..., size - 1, size - 1] = 0  # Goal point initialized
     return num_arr
 
 
+# Labels the connected open cells of a maze (or of every maze of a (n, size, size) batch) in a few vectorized passes
+# Every open cell starts as its own component. Each pass hooks, for every edge between open cells, the larger of the
+# two component roots onto the smaller one and then compresses the parent pointers until every cell points at its
+# root (pointer jumping). Returns an int array shaped like the maze with the component of every cell, -1 if blocked.
+def label_maze(maze, diagonal=False):
+    maze = np.asarray(maze)
+    opened = (maze != 1) & (maze != 3)  # 1 is blockage , 3 is fire
+    index = np.arange(maze.size).reshape(maze.shape)
+    pairs = [(np.s_[..., :-1, :], np.s_[..., 1:, :]), (np.s_[..., :, :-1], np.s_[..., :, 1:])]
+    if diagonal:
+        pairs += [(np.s_[..., :-1, :-1], np.s_[..., 1:, 1:]), (np.s_[..., :-1, 1:], np.s_[..., 1:, :-1])]
+    a, b = [], []
+    for first, second in pairs:
+        both = opened[first] & opened[second]
+        a.append(index[first][both])
+        b.append(index[second][both])
+    a, b = np.concatenate(a), np.concatenate(b)
+    parent = index.reshape(-1).copy()
+    while True:
+        pa, pb = parent[a], parent[b]
+        differ = pa != pb
+        if not differ.any():
+            break
+        np.minimum.at(parent, np.maximum(pa, pb)[differ], np.minimum(pa, pb)[differ])  # hook roots
+        while True:  # pointer jumping
+            jumped = parent[parent]
+            if (jumped == parent).all():
+                break
+            parent = jumped
+    labels = parent.reshape(maze.shape)
+    labels[~opened] = -1
+    return labels
+
+
+# Checks if dest can be reached from src (default corners) for a maze, or for every maze of a batch
+def is_solvable(maze, src=(0, 0), dest=None):
+    labels = label_maze(maze)
+    if dest is None:
+        dest = (labels.shape[-2] - 1, labels.shape[-1] - 1)
+    start, goal = labels[..., src[0], src[1]], labels[..., dest[0], dest[1]]
+    return (start >= 0) & (start == goal)
+
+
+# Draws 'n' solvable mazes, rejected mazes are only labelled, never turned into graphs or searched
+# Returns the (n, size, size) mazes and the rejection rate (share of the drawn mazes which had no path)
+def sample_solvable_mazes(n, size, prob, rng=None, maxdraws=100000):
+    rng = None if rng is None else np.random.default_rng(rng)  # a seed must give one stream, not the same draw
+    accepted = []
+    found, drawn = 0, 0
+    while found < n:
+        if drawn >= maxdraws:
+            raise RuntimeError("no solvable maze of size %d with probability %s after %d draws" % (size, prob, drawn))
+        acceptance = (found + 1) / (drawn + 2)  # rough estimate of the share of solvable mazes so far
+        batch = create_mazes(min(int((n - found) / acceptance) + 1, 4096), size, prob, rng)
+        keep = np.flatnonzero(is_solvable(batch))[:n - found]
+        # mazes after the last one needed are not counted as drawn
+        drawn += int(keep[-1]) + 1 if len(keep) == n - found else len(batch)
+        accepted.append(batch[keep])
+        found += len(keep)
+    return np.concatenate(accepted), 1 - n / drawn
+
+
+# Draws one solvable maze, returns the maze and the number of mazes rejected before it
+def sample_solvable_maze(size, prob, rng=None, maxdraws=100000):
+    rng = None if rng is None else np.random.default_rng(rng)  # a seed must give one stream, not the same draw
+    for rejected in range(maxdraws):
+        maze = create_maze(size, prob, rng)
+        if is_solvable(maze):
+            return maze, rejected
+    raise RuntimeError("no solvable maze of size %d with probability %s after %d draws" % (size, prob, maxdraws))
+
+
 # Function creates a thinned maze with thinning factor p.
-def maze_thinning(p, maze):
+# 'rng' is a numpy Generator or a seed, None uses the global np.random state
+def maze_thinning(p, maze, rng=None):
     blocked = []
     for i in range(len(maze)):
         for j in range(len(maze[i])):
             if maze[i][j] == 1:
                 blocked.append((i, j))
     num_obstacles_to_remove = m.floor(p * len(blocked))
-    indexlist = np.random.choice(np.arange(len(blocked)), num_obstacles_to_remove, replace=False)
+    rng = np.random if rng is None else np.random.default_rng(rng)
+    indexlist = rng.choice(np.arange(len(blocked)), num_obstacles_to_remove, replace=False)
     for i in indexlist:
         maze[blocked[i][0]][blocked[i][1]] = 0
     return maze
@@ -29,7 +111,6 @@ def maze_thinning(p, maze):
 # Creating graph with maze cells
 def create_graph(maze):
     # dictionary for graphs
-    start_time = t.datetime.now()
     graph = {}
     for i in range(maze.shape[0]):
         for j in range(maze.shape[1]):
@@ -166,3 +247,13 @@ def check_right(i, j, maze):
         return True
     else:
         return False
+
+
+# Creating array backed graph with maze cells, same neighbours as create_graph but built in one vectorized pass
+def create_gridgraph(maze):
+    return gg.GridGraph(maze)
+
+
+# Creating array backed relaxed (diagonal) graph, same neighbours as create_relaxedgraph
+def create_relaxedgridgraph(maze):
+    return gg.GridGraph(maze, diagonal=True)
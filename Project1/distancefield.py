@@ -0,0 +1,86 @@
+import numpy as np
+import gridgraph as gg
+
+# BFS distance fields over a maze grid
+# distance_field computes, for every cell, the number of steps to the nearest of one or many sources and the cell it
+# is reached from, in one BFS wavefront. The frontier is an array of flat cell indices and a whole level is expanded
+# with a few numpy operations using the neighbour bitmasks of gridgraph.GridGraph, so the work is proportional to the
+# number of open cells and the Python overhead to the number of levels. distance_fields runs one BFS per source the
+# same way, all of them in a single wavefront.
+# Any path or heuristic (distance to dest, reachability of a cell, nearest fire...) is then a lookup:
+#
+#     dist, pred = distance_field(maze, [(0, 0)])
+#     dist[node]                      # steps from (0, 0), -1 if unreachable
+#     field_path(dist, pred, node)    # path from (0, 0) to node
+
+
+# maze is a numpy maze or a GridGraph (diagonal is then taken from the graph), sources a node or a list of nodes
+# Returns int32 arrays shaped like the maze: dist (-1 where no source can be reached) and pred (flat index of the
+# previous cell on a shortest path from the nearest source, -1 for sources and unreachable cells)
+def distance_field(maze, sources, diagonal=False):
+    graph = maze if isinstance(maze, gg.GridGraph) else gg.GridGraph(maze, diagonal)
+    if isinstance(sources, tuple):
+        sources = [sources]
+    width = graph.width
+    bits = graph.bits
+    offsets = np.array(graph.offsets, dtype=np.int64)
+    directions = 8 if graph.diagonal else 4
+    dist = np.full(graph.num_cells, -1, dtype=np.int32)
+    pred = np.full(graph.num_cells, -1, dtype=np.int32)
+    frontier = np.unique(np.array([i * width + j for (i, j) in sources if graph.isopen((i, j))], dtype=np.int64))
+    dist[frontier] = 0
+    level = 0
+    while len(frontier):
+        level += 1
+        parents, children = [], []
+        frontierbits = bits[frontier]
+        for k in range(directions):
+            has = frontier[(frontierbits >> k) & 1 == 1]
+            parents.append(has)
+            children.append(has + offsets[k])
+        parent, child = np.concatenate(parents), np.concatenate(children)
+        new = dist[child] == -1
+        child, first = np.unique(child[new], return_index=True)  # a cell reached twice keeps its first parent
+        dist[child] = level
+        pred[child] = parent[new][first]
+        frontier = child
+    return dist.reshape(graph.shape), pred.reshape(graph.shape)
+
+
+# Distance fields from many single sources at once, one field per source: an (n, height, width) int32 array
+# All the BFS run in the same wavefront: a frontier entry is k * num_cells + cell for the search from source k, so
+# the n searches are a single search over n copies of the grid and every level is expanded for all of them together.
+def distance_fields(maze, sources, diagonal=False):
+    graph = maze if isinstance(maze, gg.GridGraph) else gg.GridGraph(maze, diagonal)
+    cells, width = graph.num_cells, graph.width
+    bits = graph.bits
+    offsets = np.array(graph.offsets, dtype=np.int64)
+    directions = 8 if graph.diagonal else 4
+    dist = np.full(len(sources) * cells, -1, dtype=np.int32)
+    frontier = np.array([k * cells + i * width + j for k, (i, j) in enumerate(sources) if graph.isopen((i, j))],
+                        dtype=np.int64)
+    dist[frontier] = 0
+    level = 0
+    while len(frontier):
+        level += 1
+        frontierbits = bits[frontier % cells]
+        child = np.concatenate([frontier[(frontierbits >> k) & 1 == 1] + offsets[k] for k in range(directions)])
+        child = np.unique(child[dist[child] == -1])
+        dist[child] = level
+        frontier = child
+    return dist.reshape((len(sources),) + graph.shape)
+
+
+# Path from the nearest source to node read from the arrays of distance_field, None if node is unreachable
+def field_path(dist, pred, node):
+    width = pred.shape[1]
+    flatpred = pred.reshape(-1)
+    if dist[node] < 0:
+        return None
+    idx = node[0] * width + node[1]
+    path = [idx]
+    while flatpred[idx] != -1:
+        idx = int(flatpred[idx])
+        path.append(idx)
+    path.reverse()
+    return [divmod(i, width) for i in path]
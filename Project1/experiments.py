@@ -0,0 +1,166 @@
+import os
+os.environ.setdefault("MPLBACKEND", "Agg")  # workers never open a figure, do not require a display
+
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import createmaze as mz
+import solutions as so
+import seeding as sd
+
+# Batch runner for the maze on fire experiments (what solutions.generate_result does, at scale)
+# Every (maze, flamability, strategy) trial is independent and runs in a process pool. Rows are appended to a CSV
+# file as soon as each trial finishes, so a crashed run is resumed by calling run_experiment again with the same
+# file: trials already in it are skipped. Every row records the corpus its maze came from (empty without one), and a
+# file is only resumed with the corpus it was started with. Every row must also be the trial the experiment has under
+# its number: more mazes can be added to a file, other flamabilities or strategies renumber the trials and are refused.
+#
+# Seeds (seeding.py): the master seed and the maze number give the seed stream of the maze, the maze
+# number and the flamability index give the one of the fire. All strategies of a maze and flamability therefore see
+# the same maze, the same fire start and the same fire, and a trial gives the same result whichever worker runs it
+# and in whatever order.
+# With a corpus (mazecorpus.MazeCorpus) maze number n is the nth solvable maze of the size and density in it instead
+# of a drawn one. The corpus travels to the workers as its path and each worker maps the same file.
+
+STRATEGIES = {1: so.sol1, 2: so.sol2, 3: so.sol3, 4: so.sol4}
+# time is the run time of the strategy in ns (timing.py), corpus the path of the maze corpus (empty without one)
+FIELDS = ["trial", "maze", "flamability", "strategy", "seed", "size", "density", "success", "time", "reexpansions",
+          "corpus"]
+DTYPE = [("trial", np.int64), ("maze", np.int64), ("flamability", np.float64), ("strategy", np.int64),
+         ("seed", np.int64), ("size", np.int64), ("density", np.float64), ("success", np.bool_),
+         ("time", np.int64), ("reexpansions", np.int64), ("corpus", object)]
+
+
+# All trials of an experiment in a fixed order, the position in the list is the trial number
+def make_trials(seed, mazes, flamabilities, strategies=(1, 2, 3), size=70, density=0.3):
+    trials = []
+    for maze in range(mazes):
+        for qindex, q in enumerate(flamabilities):
+            for strategy in strategies:
+                trials.append({"trial": len(trials), "maze": maze, "qindex": qindex, "flamability": q,
+                               "strategy": strategy, "seed": seed, "size": size, "density": density})
+    return trials
+
+
+# Runs one trial in a worker and returns its CSV row
+def run_trial(trial):
+    size, sr = trial["size"], (0, 0)
+    des = (size - 1, size - 1)
+    # maze and fire start are drawn from the maze stream until the maze is solvable
+    mazerng = sd.generator(trial["seed"], trial["maze"])
+    corpus = trial.get("corpus")
+    records = None if corpus is None else corpus.take(size, trial["density"], solvable=True)
+    position = trial["maze"]
+    while True:
+        if corpus is None:
+            maze = mz.sample_solvable_maze(size, trial["density"], mazerng)[0]
+        else:
+            maze = corpus[records[position % len(records)]]
+            position += 1  # next corpus maze if the fire cannot start in this one
+        graph = mz.create_gridgraph(maze)
+        firestart = so.let_there_be_fire(graph, sr, des, rng=mazerng)
+        if firestart is not None:
+            break
+    firerng = sd.generator(trial["seed"], trial["maze"], trial["qindex"])
+    result = STRATEGIES[trial["strategy"]](maze, size, graph, sr, des, firestart, trial["flamability"], False,
+                                           firerng)
+    row = {name: trial[name] for name in FIELDS[:7]}
+    row["success"] = int(bool(result[0]))
+    row["time"] = result[1]
+    row["reexpansions"] = result[2] if len(result) > 2 else 0
+    row["corpus"] = corpus_path(corpus)
+    return row
+
+
+# Path of a corpus as written in the results, empty without one
+def corpus_path(corpus):
+    return "" if corpus is None else corpus.path
+
+
+# Trial numbers already written to the results file. A row cut short by a crash is removed from the file.
+# Raises ValueError if the file holds rows of another corpus or of an older column layout, or, given the 'trials' of
+# the experiment (make_trials), a row whose maze, flamability, strategy, seed, size and density are not the ones of
+# the trial with its number (the file was started with other parameters)
+def completed_trials(path, corpus=None, trials=None):
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+    done = set()
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is not None and reader.fieldnames != FIELDS:
+            raise ValueError("%s has the columns %s, not %s" % (path, reader.fieldnames, FIELDS))
+        for row in reader:
+            if row["corpus"] != corpus_path(corpus):
+                raise ValueError("%s holds trials of corpus '%s', not '%s'"
+                                 % (path, row["corpus"], corpus_path(corpus)))
+            number = int(row["trial"])
+            if trials is not None:
+                check_trial(path, row, trials[number] if number < len(trials) else None)
+            done.add(number)
+    return done
+
+
+# Raises ValueError if a results row is not the trial the experiment has under its number (None when it has none)
+def check_trial(path, row, trial):
+    written = (int(row["maze"]), float(row["flamability"]), int(row["strategy"]), int(row["seed"]), int(row["size"]),
+               float(row["density"]))
+    expected = None if trial is None else tuple(trial[name] for name in FIELDS[1:7])
+    if written != expected:
+        raise ValueError("%s has trial %s as (maze, flamability, strategy, seed, size, density) %s, this experiment %s"
+                         % (path, row["trial"], written, expected))
+
+
+# Runs every trial not already in 'path' over 'workers' processes (None is one per core) and appends the rows
+# 'corpus' is a mazecorpus.MazeCorpus to take the mazes from, None draws them
+def run_experiment(path, seed=0, mazes=10, flamabilities=(0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.5),
+                   strategies=(1, 2, 3), size=70, density=0.3, workers=None, corpus=None):
+    trials = make_trials(seed, mazes, flamabilities, strategies, size, density)
+    for trial in trials:
+        trial["corpus"] = corpus
+    done = completed_trials(path, corpus, trials)
+    todo = [trial for trial in trials if trial["trial"] not in done]
+    print("%d trials, %d already done, %d to run" % (len(trials), len(trials) - len(todo), len(todo)))
+    newfile = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if newfile:
+            writer.writeheader()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(run_trial, trial) for trial in todo]):
+                writer.writerow(future.result())
+                f.flush()
+
+
+# Loads a results file as a numpy structured array (one named column per field)
+# Files written before the corpus column read with an empty corpus
+def load_results(path):
+    with open(path, newline="") as f:
+        rows = [tuple(row.get(name) or "" for name in FIELDS) for row in csv.DictReader(f)]
+    records = [(int(r[0]), int(r[1]), float(r[2]), int(r[3]), int(r[4]), int(r[5]), float(r[6]), r[7] == "1",
+                int(r[8]), int(r[9]), r[10]) for r in rows]
+    return np.array(records, dtype=DTYPE)
+
+
+# Success rate and mean time of the successful runs for every (flamability, strategy)
+def summarize(results):
+    summary = {}
+    for q in np.unique(results["flamability"]):
+        for strategy in np.unique(results["strategy"]):
+            rows = results[(results["flamability"] == q) & (results["strategy"] == strategy)]
+            won = rows[rows["success"]]
+            summary[(float(q), int(strategy))] = {"trials": len(rows),
+                                                  "success_rate": float(np.mean(rows["success"])) if len(rows) else 0,
+                                                  "mean_time": float(np.mean(won["time"])) if len(won) else 0}
+    return summary
+
+
+if __name__ == '__main__':
+    output = sys.argv[1] if len(sys.argv) > 1 else "fire_results.csv"
+    run_experiment(output)
+    for key, value in sorted(summarize(load_results(output)).items()):
+        print(key, value)
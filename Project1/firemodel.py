@@ -0,0 +1,104 @@
+import numpy as np
+import gridgraph as gg
+
+# Fire spreading over the maze
+# The fire is kept as a boolean grid shaped like the maze. Each tick the number of burning neighbours k of every
+# cell is counted with four array shifts, the ignition probability 1 - (1 - q)^k is looked up for the whole grid
+# at once and all cells are sampled with a single call to the random generator, so a tick costs a few numpy
+# operations whatever the number of burning cells.
+# With track_distance(radius) the model also keeps the distance (steps over open cells) from every cell to the nearest
+# burning cell, up to radius. Cells catching fire start a multi-source BFS bounded by radius which only lowers
+# distances, so keeping the grid costs work around the new cells only, and sensing the fire near a cell is one
+# lookup (near_fire) whatever the number of burning cells.
+
+# 4-connected moves, fire spreads the same way the agent moves
+STEPS = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+
+class FireModel(object):
+    # maze is the numpy maze (1 is blockage, 3 already on fire), flamability is q,
+    # protected are the nodes which never catch fire (source and destination),
+    # rng is a numpy Generator or a seed, the same seed always gives the same fire
+    def __init__(self, maze, flamability, protected=(), rng=None):
+        maze = np.asarray(maze)
+        maze = maze.reshape(maze.shape[0], maze.shape[1])
+        self.shape = maze.shape
+        self.flamability = flamability
+        self.open = maze != 1  # cells the fire can burn
+        self.burning = maze == 3
+        self.flammable = self.open.copy()
+        for node in protected:
+            self.flammable[node] = False
+        # ignition probability for 0 to 4 burning neighbours
+        self.probability = 1 - (1 - flamability) ** np.arange(len(STEPS) + 1)
+        self.rng = np.random.default_rng(rng)
+        self.radius = None
+        self.distance = None  # flat distance to the fire, radius + 1 for farther cells, once tracked
+
+    # Sets the given nodes on fire
+    def ignite(self, nodes):
+        for node in nodes:
+            self.burning[node] = True
+        if self.distance is not None:
+            self.update_distance(np.array([node[0] * self.shape[1] + node[1] for node in nodes], dtype=np.int64))
+
+    def isburning(self, node):
+        return bool(self.burning[node])
+
+    # List of the nodes on fire
+    def cells(self):
+        return mask_nodes(self.burning)
+
+    # Number of burning 4-neighbours of every cell
+    def burning_neighbours(self):
+        h, w = self.shape
+        padded = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self.burning
+        count = np.zeros(self.shape, dtype=np.uint8)
+        for di, dj in STEPS:
+            count += padded[1 + di:h + 1 + di, 1 + dj:w + 1 + dj]
+        return count
+
+    # One tick of the fire, returns the mask of the cells which caught fire
+    def spread(self):
+        prob = self.probability[self.burning_neighbours()]
+        catch = (self.rng.random(self.shape) < prob) & self.flammable & ~self.burning
+        self.burning |= catch
+        if self.distance is not None:
+            self.update_distance(np.flatnonzero(catch))
+        return catch
+
+    # Starts keeping the distance to the nearest burning cell, exact up to 'radius' steps
+    def track_distance(self, radius):
+        self.radius = radius
+        self.graph = gg.GridGraph(np.where(self.open, 0, 1))  # open cells, fire or not
+        self.offsets = np.array(self.graph.offsets[:len(STEPS)], dtype=np.int64)
+        self.distance = np.full(self.graph.num_cells, radius + 1, dtype=np.int32)
+        self.update_distance(np.flatnonzero(self.burning))
+
+    # BFS from the cells which caught fire (flat indices), at most radius levels, lowering the distances it improves
+    def update_distance(self, sources):
+        frontier = sources[self.distance[sources] > 0]
+        self.distance[frontier] = 0
+        bits = self.graph.bits
+        for level in range(1, self.radius + 1):
+            if not len(frontier):
+                break
+            frontierbits = bits[frontier]
+            children = np.concatenate([frontier[(frontierbits >> k) & 1 == 1] + self.offsets[k]
+                                       for k in range(len(STEPS))])
+            frontier = np.unique(children[self.distance[children] > level])
+            self.distance[frontier] = level
+
+    # Steps from node to the nearest burning cell, radius + 1 if farther (track_distance must have been called)
+    def distance_to_fire(self, node):
+        return int(self.distance[node[0] * self.shape[1] + node[1]])
+
+    # True if a burning cell is within radius steps of node
+    def near_fire(self, node):
+        return self.distance[node[0] * self.shape[1] + node[1]] <= self.radius
+
+
+# (i, j) nodes of the True cells of a mask, e.g. the mask returned by FireModel.spread
+def mask_nodes(mask):
+    return [tuple(node) for node in np.argwhere(mask).tolist()]
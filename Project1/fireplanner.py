@@ -0,0 +1,117 @@
+import heapq
+import math as m
+import numpy as np
+import distancefield as df
+import firemodel as fm
+import gridgraph as gg
+
+# Fire aware planning from fire arrival times
+# The fire of an episode is summed up once, before the agent moves, by its expected arrival time (ETA) at every cell:
+# the tick at which the cell is expected to catch fire (tick t is the spread after the agent's t-th step, np.inf if
+# the fire cannot reach the cell). Two estimates:
+#
+#     analytic_eta      a cell at fire distance d from the nearest start burns after about d / q ticks, the fire
+#                       taking on average 1 / q ticks to cross a cell from one burning neighbour (in open areas
+#                       cells have several burning neighbours and the real fire comes sooner)
+#     montecarlo_eta    mean first burning tick over simulated fires (firemodel.FireModel rule), a cell which did not
+#                       burn within the horizon of a run counts as burning just after it
+#
+# plan() then runs one A* where the agent's arrival time at a cell is its number of steps: cells the fire is expected
+# to reach no later than 'margin' ticks after the agent stands on them are not entered, and entering a cell costs one
+# step plus 'weight' over the slack (ETA - arrival time), so the path keeps away from the fire front when a detour is
+# short. The planner needs one field and one search per episode, see solutions.sol4.
+
+
+# Fire distance field from the starts, over the cells the fire can burn ('protected' cells never burn)
+def fire_distance(maze, firestarts, protected=()):
+    burnable = fm.FireModel(maze, 0, protected).flammable
+    for node in firestarts:
+        burnable[node] = True
+    return df.distance_field(np.where(burnable, 0, 1), list(firestarts))[0]
+
+
+# Analytic ETA: fire distance over flamability q, np.inf where the fire cannot reach
+# With q = 0 the fire does not spread but the cells already burning keep ETA 0
+def analytic_eta(maze, firestarts, q, protected=()):
+    dist = fire_distance(maze, firestarts, protected)
+    if q > 0:
+        return np.where(dist >= 0, dist / q, np.inf)
+    return np.where(dist == 0, 0, np.inf)
+
+
+# Monte Carlo ETA: mean first burning tick over 'runs' simulated fires of 'horizon' ticks (default twice the
+# half perimeter of the maze, longer than the agent's paths), np.inf where no run reached the cell
+# The runs are stacked into one (runs, height, width) array and spread together with the rule of
+# firemodel.FireModel, so a tick is a few numpy operations for all the runs.
+# 'rng' is a numpy Generator or seed for the simulations, not the one of the real fire
+def montecarlo_eta(maze, firestarts, q, protected=(), runs=20, horizon=None, rng=None):
+    rng = np.random.default_rng(rng)
+    model = fm.FireModel(maze, q, protected)
+    h, w = model.shape
+    if horizon is None:
+        horizon = 2 * (h + w)
+    burning = np.repeat(model.burning[None], runs, axis=0)
+    for node in firestarts:
+        burning[:, node[0], node[1]] = True
+    first = np.where(burning, 0, horizon + 1)
+    padded = np.zeros((runs, h + 2, w + 2), dtype=np.uint8)
+    for tick in range(1, horizon + 1):
+        padded[:, 1:-1, 1:-1] = burning
+        count = np.zeros(burning.shape, dtype=np.uint8)
+        for di, dj in fm.STEPS:
+            count += padded[:, 1 + di:h + 1 + di, 1 + dj:w + 1 + dj]
+        exposed = (count > 0) & model.flammable & ~burning
+        if not exposed.any():
+            break  # every run burnt out
+        catch = (rng.random(burning.shape) < model.probability[count]) & exposed
+        burning |= catch
+        first[catch] = tick
+    reached = (first <= horizon).any(axis=0)
+    return np.where(reached, first.mean(axis=0), np.inf)
+
+
+# A* from src to dest over 'graph' (GridGraph or dict graph) avoiding the fire given by 'eta'
+# Whether a cell may be entered depends on the arrival time, so the states are (cell, arrival time): a state is only
+# expanded if its cell was not expanded before at the same or an earlier time (arriving later never helps, the fire
+# only grows), and a cell reached late on a cheap path can still be reached early on a dearer one.
+# Returns the path as a list of nodes, None if every path meets the fire
+def plan(graph, src, dest, eta, margin=1, weight=2.0):
+    ig = gg.indexed(graph)
+    srci, desti = ig.index(src), ig.index(dest)
+    coord = ig.coord
+    if isinstance(ig, gg.GridGraph):
+        flateta = np.asarray(eta, dtype=float).reshape(-1).tolist()  # plain list indexing in the loop
+    else:
+        flateta = [eta[coord(i)] for i in range(ig.num_cells)]
+
+    def h(node):
+        i, j = coord(node)
+        return abs(i - dest[0]) + abs(j - dest[1])
+
+    cost = {(srci, 0): 0}    # (cell, arrival time) -> cost, the parent state is (parent cell, time - 1)
+    parent = {(srci, 0): -1}
+    earliest = {}            # cell -> earliest arrival time it was expanded at
+    openlist = [(h(srci), 0, srci)]
+    while openlist:
+        f, t, node = heapq.heappop(openlist)
+        if earliest.get(node, m.inf) <= t:
+            continue  # stale entry, or the cell was expanded at an earlier time
+        earliest[node] = t
+        if node == desti:
+            path = [coord(node)]
+            while parent[(node, t)] != -1:
+                node, t = parent[(node, t)], t - 1
+                path.append(coord(node))
+            path.reverse()
+            return path
+        nodecost = cost[(node, t)]
+        for neighbor in ig.neighbour_indices(node):
+            slack = flateta[neighbor] - (t + 1)  # arrival at the neighbour at t + 1
+            if earliest.get(neighbor, m.inf) <= t + 1 or slack <= margin:
+                continue
+            newcost = nodecost + 1 + (weight / slack if slack != m.inf else 0)
+            if newcost < cost.get((neighbor, t + 1), m.inf):
+                cost[(neighbor, t + 1)] = newcost
+                parent[(neighbor, t + 1)] = node
+                heapq.heappush(openlist, (newcost + h(neighbor), t + 1, neighbor))
+    return None
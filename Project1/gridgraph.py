@@ -0,0 +1,164 @@
+import numpy as np
+
+# Compact graph over the maze array.
+# Every cell gets a flat int32 index (i * width + j) and one uint8 bitmask telling which of its
+# (up to 8) neighbours are open, so the whole graph is built with a handful of array shifts instead of
+# one Python list per cell. It also behaves like the dict returned by createmaze.create_graph
+# (get, [], keys, in, len, copy) so every search written against the dict graph works unchanged.
+
+# Neighbour directions, bit k of the mask corresponds to STEPS[k]
+# First four are the 4-connected moves in the same order create_graph uses, last four are the diagonals
+STEPS = [(-1, 0), (0, -1), (0, 1), (1, 0), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+# Cells which can be travelled, 1 is blockage , 3 is fire
+def open_cells(maze):
+    maze = np.asarray(maze)
+    maze = maze.reshape(maze.shape[0], maze.shape[1])  # older mazes are (size, size, 1)
+    return (maze != 1) & (maze != 3)
+
+
+class GridGraph(object):
+    # maze is the numpy maze, diagonal=True gives the 8-connected (relaxed) graph
+    def __init__(self, maze, diagonal=False):
+        self.open = open_cells(maze)
+        self.shape = self.open.shape
+        self.height, self.width = self.shape
+        self.num_cells = self.height * self.width
+        self.diagonal = diagonal
+        self.version = 0  # incremented whenever a cell is blocked or opened
+        # offset of each direction in the flat index
+        self.offsets = [di * self.width + dj for (di, dj) in STEPS]
+        # for every possible mask the tuple of flat offsets it allows, so neighbours are one table lookup
+        self._offsets_for_mask = [tuple(self.offsets[k] for k in range(8) if mask & (1 << k))
+                                  for mask in range(256)]
+        self._steps_for_mask = [tuple(STEPS[k] for k in range(8) if mask & (1 << k)) for mask in range(256)]
+        self.build()
+
+    # Vectorized pass computing the neighbour bitmask of every cell
+    def build(self):
+        h, w = self.shape
+        padded = np.zeros((h + 2, w + 2), dtype=bool)
+        padded[1:-1, 1:-1] = self.open
+        bits = np.zeros(self.shape, dtype=np.uint8)
+        for k in range(8 if self.diagonal else 4):
+            di, dj = STEPS[k]
+            bits |= padded[1 + di:h + 1 + di, 1 + dj:w + 1 + dj].astype(np.uint8) << k
+        bits[~self.open] = 0  # blocked cells have no edges
+        self.bits = bits.reshape(-1)
+        self._bitbytes = self.bits.tobytes()  # bytes indexing is much faster than numpy scalars in loops
+
+    # Flat index of a (i, j) node
+    def index(self, node):
+        return node[0] * self.width + node[1]
+
+    # (i, j) node of a flat index
+    def coord(self, idx):
+        return divmod(idx, self.width)
+
+    # Neighbours of a flat index as flat indices
+    def neighbour_indices(self, idx):
+        return [idx + off for off in self._offsets_for_mask[self._bitbytes[idx]]]
+
+    # Neighbours of a (i, j) node as (i, j) nodes
+    def neighbours(self, node):
+        i, j = node
+        return [(i + di, j + dj) for (di, dj) in self._steps_for_mask[self._bitbytes[i * self.width + j]]]
+
+    def isopen(self, node):
+        return 0 <= node[0] < self.height and 0 <= node[1] < self.width and bool(self.open[node[0], node[1]])
+
+    # Mark cells as blocked (e.g. on fire) or open again and refresh the masks
+    def block(self, nodes):
+        self.setcells(nodes, False)
+
+    def unblock(self, nodes):
+        self.setcells(nodes, True)
+
+    def setcells(self, nodes, value):
+        nodes = list(nodes)
+        if not nodes:
+            return
+        rows, cols = zip(*nodes)
+        self.open[list(rows), list(cols)] = value
+        self.version += 1
+        self.build()
+
+    # CSR layout (indptr, indices) over flat indices for code that wants plain arrays
+    def csr(self):
+        counts = np.zeros(self.num_cells, dtype=np.int32)
+        for k in range(8):
+            counts += (self.bits >> k) & 1
+        indptr = np.zeros(self.num_cells + 1, dtype=np.int32)
+        np.cumsum(counts, out=indptr[1:])
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        fill = indptr[:-1].copy()
+        for k in range(8):
+            has = np.nonzero((self.bits >> k) & 1)[0]
+            indices[fill[has]] = has + self.offsets[k]
+            fill[has] += 1
+        return indptr, indices
+
+    # ---- dict compatible interface (same as the graph from createmaze.create_graph) ----
+    def get(self, node, default=None):
+        if not self.isopen(node):
+            return default
+        return self.neighbours(node)
+
+    def __getitem__(self, node):
+        if not self.isopen(node):
+            raise KeyError(node)
+        return self.neighbours(node)
+
+    def __contains__(self, node):
+        return self.isopen(node)
+
+    def keys(self):
+        rows, cols = np.nonzero(self.open)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self):
+        return [(node, self.neighbours(node)) for node in self.keys()]
+
+    def __len__(self):
+        return int(np.count_nonzero(self.open))
+
+    def copy(self):
+        other = GridGraph.__new__(GridGraph)
+        other.__dict__.update(self.__dict__)
+        other.open = self.open.copy()
+        other.bits = self.bits.copy()
+        return other
+
+
+# Wraps a dict graph (from create_graph / create_relaxedgraph) with the same index interface as GridGraph
+# so searches can run over flat integer indices for either kind of graph
+class IndexedGraph(object):
+    def __init__(self, graph):
+        self.graph = graph
+        self.nodes = list(graph.keys())
+        self.lookup = {node: i for i, node in enumerate(self.nodes)}
+        self.num_cells = len(self.nodes)
+        self.adjacency = [[self.lookup[n] for n in graph[node] if n in self.lookup] for node in self.nodes]
+
+    def index(self, node):
+        return self.lookup[node]
+
+    def coord(self, idx):
+        return self.nodes[idx]
+
+    def neighbour_indices(self, idx):
+        return self.adjacency[idx]
+
+    def __contains__(self, node):
+        return node in self.lookup
+
+
+# Returns an object exposing index/coord/neighbour_indices/num_cells for any graph
+def indexed(graph):
+    if isinstance(graph, (GridGraph, IndexedGraph)):
+        return graph
+    return IndexedGraph(graph)
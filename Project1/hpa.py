@@ -0,0 +1,270 @@
+import heapq
+import math as m
+from collections import deque
+import gridgraph as gg
+import timing as tm
+import searchstats as ss
+
+# Hierarchical pathfinding (HPA*) over maze clusters
+# The maze is cut into square clusters. Where two neighbouring clusters share a run of open cells along their border
+# one or two transitions (pairs of facing cells) are placed on it, each transition cell being an abstract node.
+# Inside every cluster the distances between its abstract nodes are computed by a BFS restricted to the cluster, once,
+# the first time a search reaches the cluster, and kept until the cluster changes.
+# A query links src and dest to the abstract nodes of their clusters, runs A* on the small abstract graph and then
+# refines only the chosen abstract edges back into cells, each with a BFS inside one cluster.
+# Paths are near optimal (they pass through transitions), the search cost grows with the number of clusters instead
+# of the number of cells. When cells are blocked or opened (fire, thinning) only their clusters and the neighbours
+# sharing a changed border are rebuilt, see HPAGraph.update.
+#
+#     hgraph = HPAGraph(createmaze.create_gridgraph(maze), 16)
+#     hpastar(hgraph, (0, 0), (size - 1, size - 1))     # same tuple as maze_thinning.astar
+
+# Runs shorter than this get one transition in their middle, longer ones one at each end
+ENTRANCE_SPLIT = 6
+
+STEPS = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+
+class HPAGraph(object):
+    # graph is a numpy maze or a 4-connected GridGraph, clustersize the side of the square clusters
+    def __init__(self, graph, clustersize=10):
+        self.graph = graph if isinstance(graph, gg.GridGraph) else gg.GridGraph(graph)
+        if self.graph.diagonal:
+            raise ValueError("HPAGraph only supports 4-connected mazes")
+        self.clustersize = clustersize
+        self.height, self.width = self.graph.shape
+        self.rows = -(-self.height // clustersize)
+        self.cols = -(-self.width // clustersize)
+        self.opened = self.graph.open.tolist()
+        self.transitions = {}  # border (cluster, cluster) -> list of (cell, cell) facing each other
+        self.inter = {}        # abstract node -> set of abstract nodes across a border (cost 1)
+        self.entrances = {}    # cluster -> set of its abstract nodes
+        self.intra = {}        # cluster -> {abstract node: {abstract node: distance inside the cluster}}, lazily
+        for border in self.borders():
+            self.build_border(border)
+        for cluster in self.clusters():
+            self.build_cluster(cluster)
+
+    def clusters(self):
+        return [(ci, cj) for ci in range(self.rows) for cj in range(self.cols)]
+
+    # Pairs of neighbouring clusters, each once
+    def borders(self):
+        result = []
+        for ci, cj in self.clusters():
+            if cj + 1 < self.cols:
+                result.append(((ci, cj), (ci, cj + 1)))
+            if ci + 1 < self.rows:
+                result.append(((ci, cj), (ci + 1, cj)))
+        return result
+
+    def cluster_of(self, node):
+        return node[0] // self.clustersize, node[1] // self.clustersize
+
+    # Row and column ranges of a cluster, end excluded
+    def bounds(self, cluster):
+        i0, j0 = cluster[0] * self.clustersize, cluster[1] * self.clustersize
+        return i0, min(i0 + self.clustersize, self.height), j0, min(j0 + self.clustersize, self.width)
+
+    def isopen(self, node):
+        return 0 <= node[0] < self.height and 0 <= node[1] < self.width and self.opened[node[0]][node[1]]
+
+    # Places the transitions of a border and links them in the abstract graph
+    def build_border(self, border):
+        for a, b in self.transitions.get(border, []):
+            self.inter[a].discard(b)
+            self.inter[b].discard(a)
+        first, second = border
+        i0, i1, j0, j1 = self.bounds(first)
+        if first[0] == second[0]:  # side by side: the border is a column
+            pairs = [((i, j1 - 1), (i, j1)) for i in range(i0, i1)]
+        else:                      # one above the other: the border is a row
+            pairs = [((i1 - 1, j), (i1, j)) for j in range(j0, j1)]
+        transitions = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and self.isopen(a) and self.isopen(b):
+                run.append((a, b))
+                continue
+            if len(run) >= ENTRANCE_SPLIT:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        self.transitions[border] = transitions
+        for a, b in transitions:
+            self.inter.setdefault(a, set()).add(b)
+            self.inter.setdefault(b, set()).add(a)
+
+    # Collects the abstract nodes of a cluster, its distance table is recomputed on the next search
+    def build_cluster(self, cluster):
+        ci, cj = cluster
+        nodes = set()
+        for other in [(ci - 1, cj), (ci, cj - 1), (ci, cj + 1), (ci + 1, cj)]:
+            border = (min(cluster, other), max(cluster, other))
+            for pair in self.transitions.get(border, []):
+                nodes.update(node for node in pair if self.cluster_of(node) == cluster)
+        self.entrances[cluster] = nodes
+        self.intra.pop(cluster, None)
+
+    # Distances from an abstract node to the other abstract nodes of its cluster
+    # The table of a cluster is computed the first time a search reaches it, so building the abstraction only places
+    # transitions and a query pays for the clusters along its corridor.
+    def intra_distances(self, node):
+        cluster = self.cluster_of(node)
+        if cluster not in self.intra:
+            nodes = self.entrances[cluster]
+            self.intra[cluster] = {entrance: self.local_distances(entrance, nodes)[0] for entrance in nodes}
+        return self.intra[cluster].get(node, {})
+
+    # BFS from src restricted to its cluster
+    # Returns ({target: distance} for the reachable targets, parent dict, number of nodes expanded)
+    def local_distances(self, src, targets, stop=None):
+        i0, i1, j0, j1 = self.bounds(self.cluster_of(src))
+        parent = {src: None}
+        dist = {src: 0}
+        queue = deque([src])
+        expanded = 0
+        while queue:
+            node = queue.popleft()
+            expanded += 1
+            if node == stop:
+                break
+            for di, dj in STEPS:
+                i, j = node[0] + di, node[1] + dj
+                if i0 <= i < i1 and j0 <= j < j1 and self.opened[i][j] and (i, j) not in dist:
+                    dist[(i, j)] = dist[node] + 1
+                    parent[(i, j)] = node
+                    queue.append((i, j))
+        found = {target: dist[target] for target in targets if target in dist and target != src}
+        return found, parent, expanded
+
+    # Rebuilds the abstraction after the given cells changed in self.graph (e.g. graph.block(cells) was called)
+    # Only the clusters of the cells, and the clusters across a border one of them lies on, are rebuilt (their
+    # transitions are placed again and their distance tables dropped).
+    # Returns the set of rebuilt clusters.
+    def update(self, cells):
+        borders = set()
+        clusters = set()
+        for node in cells:
+            self.opened[node[0]][node[1]] = bool(self.graph.open[node[0], node[1]])
+            cluster = self.cluster_of(node)
+            clusters.add(cluster)
+            i0, i1, j0, j1 = self.bounds(cluster)
+            ci, cj = cluster
+            across = []
+            if node[0] == i0 and ci > 0:
+                across.append((ci - 1, cj))
+            if node[0] == i1 - 1 and ci + 1 < self.rows:
+                across.append((ci + 1, cj))
+            if node[1] == j0 and cj > 0:
+                across.append((ci, cj - 1))
+            if node[1] == j1 - 1 and cj + 1 < self.cols:
+                across.append((ci, cj + 1))
+            for other in across:
+                borders.add((min(cluster, other), max(cluster, other)))
+        for border in borders:
+            self.build_border(border)
+            clusters.update(border)
+        for cluster in clusters:
+            self.build_cluster(cluster)
+        return clusters
+
+    # Blocks cells of the maze (fire) and rebuilds what they touch
+    def block(self, cells):
+        self.graph.block(cells)
+        return self.update(cells)
+
+    # Opens cells of the maze (thinning) and rebuilds what they touch
+    def unblock(self, cells):
+        self.graph.unblock(cells)
+        return self.update(cells)
+
+
+def manhattan(start, end):
+    return abs(start[0] - end[0]) + abs(start[1] - end[1])
+
+
+# HPA* from src to dest over an HPAGraph
+# Returns the same tuple as maze_thinning.astar: status, dest, path, timetaken (ns), nodes_expended, len(path)
+# 'timer' (timing.Timer) collects the abstract search and refinement phases, 'stats' (searchstats.SearchStats) gets
+# the work of the abstract search, its expansions including the cells expanded by the local searches
+# nodes_expended counts the abstract nodes expanded plus the cells expanded by the local searches.
+def hpastar(hgraph, src, dest, timer=None, stats=None):
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()
+    if not hgraph.isopen(src) or not hgraph.isopen(dest):
+        return "F", None, [], timer.since(start_time), 0, 0
+    srccluster, destcluster = hgraph.cluster_of(src), hgraph.cluster_of(dest)
+    # link src and dest to the abstract nodes of their clusters
+    startedges, _, nodes_expended = hgraph.local_distances(src, hgraph.entrances[srccluster] | {dest})
+    if srccluster != destcluster:
+        startedges.pop(dest, None)
+    destedges, _, expanded = hgraph.local_distances(dest, hgraph.entrances[destcluster])
+    nodes_expended += expanded
+
+    def neighbours(node):
+        if node == src:
+            edges = list(startedges.items())
+        else:
+            edges = list(hgraph.intra_distances(node).items())
+        edges += [(other, 1) for other in hgraph.inter.get(node, ())]
+        if node in destedges:
+            edges.append((dest, destedges[node]))
+        return edges
+
+    # A* on the abstract graph
+    cost = {src: 0}
+    parent = {src: None}
+    closed = set()
+    counter = 0
+    openlist = [(manhattan(src, dest), 0, counter, src)]
+    found = False
+    track, peak = stats is not None, 1
+    while openlist:
+        if track and len(openlist) > peak:
+            peak = len(openlist)
+        f, h, _, node = heapq.heappop(openlist)
+        if node in closed:
+            continue  # stale entry
+        closed.add(node)
+        nodes_expended += 1
+        if node == dest:
+            found = True
+            break
+        for other, weight in neighbours(node):
+            newcost = cost[node] + weight
+            if other not in closed and newcost < cost.get(other, m.inf):
+                cost[other] = newcost
+                parent[other] = node
+                h = manhattan(other, dest)
+                counter += 1
+                heapq.heappush(openlist, (newcost + h, h, counter, other))
+    timer.lap("search")
+    if not found:
+        timetaken = timer.since(start_time)
+        if track:
+            ss.record_heap_search(stats, nodes_expended, counter + 1, (cost, parent, closed), peak)
+        return "F", None, [], timetaken, nodes_expended, 0
+
+    # refinement: every abstract edge is a step across a border or a path inside one cluster
+    abstract = [dest]
+    while parent[abstract[-1]] is not None:
+        abstract.append(parent[abstract[-1]])
+    abstract.reverse()
+    path = [src]
+    for a, b in zip(abstract, abstract[1:]):
+        if manhattan(a, b) == 1 and hgraph.cluster_of(a) != hgraph.cluster_of(b):
+            path.append(b)
+            continue
+        _, localparent, expanded = hgraph.local_distances(a, (), stop=b)
+        nodes_expended += expanded
+        segment = [b]
+        while localparent[segment[-1]] != a:
+            segment.append(localparent[segment[-1]])
+        path += reversed(segment)
+    timer.lap("refinement")
+    timetaken = timer.since(start_time)
+    if track:
+        ss.record_heap_search(stats, nodes_expended, counter + 1, (cost, parent, closed), peak)
+    return "S", dest, path, timetaken, nodes_expended, len(path)
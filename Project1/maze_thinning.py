@@ -1,4 +1,4 @@
-import datetime as t
+import heapq
 import numpy as np
 import createmaze as mz
 import matplotlib.pyplot as plt
@@ -6,39 +6,81 @@ import algorithm as al
 import math as m
 import statistics as st
 import visualisation as vis
-
-
-# This is a minimum priority queue
+import gridgraph as gg
+import distancefield as df
+import seeding as sd
+import timing as tm
+import searchstats as ss
+import jps as jp
+import hpa
+import batchsearch as bs
+from collections import OrderedDict
+
+
+# This is a minimum priority queue backed by a binary heap
+# Ties on priority are broken by the lowest h (heuristic part of the priority) and then by insertion order,
+# so the order nodes come out is deterministic.
+# With indexed=True every item is kept at most once: adding an item again with a better key replaces it
+# (decrease-key, the old heap entry is marked removed and skipped when it reaches the top).
+# Otherwise an item can be queued several times and 'item in queue' counts its entries still in the heap.
 class PriorityQueue(object):
     # initiate the queue
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.pqueue = []
+        self.counter = 0  # insertion order, used as the last tie breaker
+        self.indexed = indexed
+        self.entries = {}  # item -> live heap entry, only used in indexed mode
+        self.counts = {}  # item -> number of its entries in the heap, only used when not indexed
+        self.size = 0  # number of live entries
 
     # display the queue when print as a string
     def __str__(self):
-        return ' '.join([str(i) for i in self.pqueue])
+        return ' '.join([str((entry[3], entry[0])) for entry in sorted(self.pqueue) if entry[4]])
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, item):
+        return item in (self.entries if self.indexed else self.counts)
 
     # for checking if the queue is empty
     def isempty(self):
-        return len(self.pqueue) == 0
-
-    # for inserting an element in the queue. Element involves node and its priority
-    def add(self, item, priority):
-        self.pqueue.append((item, priority))
+        return self.size == 0
+
+    # for inserting an element in the queue. Element involves node and its priority, h is the heuristic part of
+    # the priority used for breaking ties
+    def add(self, item, priority, h=0):
+        if self.indexed:
+            old = self.entries.get(item)
+            if old is not None:
+                if (old[0], old[1]) <= (priority, h):
+                    return  # already queued with a key at least as good
+                old[4] = False  # decrease-key: drop the old entry lazily
+                self.size -= 1
+        entry = [priority, h, self.counter, item, True]
+        self.counter += 1
+        heapq.heappush(self.pqueue, entry)
+        self.size += 1
+        if self.indexed:
+            self.entries[item] = entry
+        else:
+            self.counts[item] = self.counts.get(item, 0) + 1
 
     # for popping an element based on Priority (minimum priority is popped)
     def popmin(self):
-        try:
-            mini = 0
-            for i in range(len(self.pqueue)):
-                if self.pqueue[i][1] < self.pqueue[mini][1]:
-                    mini = i
-            mininode = self.pqueue[mini][0]
-            del self.pqueue[mini]
-            return mininode
-        except IndexError:
-            print()
-            exit()
+        while self.pqueue:
+            entry = heapq.heappop(self.pqueue)
+            if entry[4]:
+                self.size -= 1
+                item = entry[3]
+                if self.indexed:
+                    del self.entries[item]
+                elif self.counts[item] == 1:
+                    del self.counts[item]
+                else:
+                    self.counts[item] -= 1
+                return item
+        raise IndexError("popmin from an empty priority queue")
 
 
 # Manhattan heuristic between 2 nodes
@@ -53,22 +95,82 @@ def euclidean(start, end):
     return val
 
 
+# Heuristic tables for astarthinning and astardiagonal
+# The heuristic of a node is its distance to dest in the thinned / relaxed graph. Instead of a search per
+# neighbour it is computed once for all nodes by a reverse BFS from dest (distancefield) and stored as a numpy array shaped like
+# the maze, so a lookup is table[node]. Nodes that cannot reach dest get 0.
+# Tables of GridGraphs are cached per (graph, dest). An entry is evicted when the graph it was built from changes
+# (GridGraph version) and only the last HEURISTIC_CACHE_SIZE tables are kept. Dict graphs have no version (editing a
+# neighbour list leaves no trace), so their tables are built again on every call.
+HEURISTIC_CACHE_SIZE = 16
+heuristic_cache = OrderedDict()
+
+
+def heuristic_table(graph, dest):
+    key = (id(graph), dest)
+    stamp = getattr(graph, "version", None)
+    cached = heuristic_cache.get(key) if stamp is not None else None
+    if cached is not None and cached[0] is graph and cached[1] == stamp:
+        heuristic_cache.move_to_end(key)
+        return cached[2]
+    if isinstance(graph, gg.GridGraph):
+        table = df.distance_field(graph, dest)[0]
+    else:
+        dist, ig = al.bfs_distances(graph, dest)
+        nodes = np.array(ig.nodes, dtype=np.int32).reshape(-1, 2)
+        table = np.zeros((nodes[:, 0].max() + 1, nodes[:, 1].max() + 1), dtype=np.int32)
+        table[nodes[:, 0], nodes[:, 1]] = dist
+    table[table < 0] = 0
+    if stamp is None:
+        return table
+    heuristic_cache[key] = (graph, stamp, table)
+    heuristic_cache.move_to_end(key)
+    while len(heuristic_cache) > HEURISTIC_CACHE_SIZE:
+        heuristic_cache.popitem(last=False)
+    return table
+
+
+# Drops every cached heuristic table
+def clear_heuristic_cache():
+    heuristic_cache.clear()
+
+
 # A-star
 # This is fn to calculate shortest path. Where heuristic is depending upon the option parameter
-def astar(graph, src, dest, option):
-    start_time = t.datetime.now()  # Noting time taken to complete
-    nodequeue = PriorityQueue()
+# Option J runs Jump Point Search (jps.py) instead, the graph must then be a GridGraph; 'tables' (jps.jump_tables of
+# the maze) makes it JPS+
+# Option H runs HPA* (hpa.py) over 'hgraph', an hpa.HPAGraph of the graph (GridGraph) built once for many searches;
+# without one an HPAGraph with clusters of 10 is built first, outside of the measured time
+# Time is in ns, 'timer' (timing.Timer) collects the search and path phases
+# 'stats' (searchstats.SearchStats) is filled with the work done
+def astar(graph, src, dest, option, timer=None, stats=None, tables=None, hgraph=None):
+    if option in ("J", "H") and not isinstance(graph, gg.GridGraph):
+        raise TypeError("Jump Point Search and HPA* need a GridGraph, use createmaze.create_gridgraph")
+    if option == "J":
+        return jp.jps(graph, src, dest, tables=tables, timer=timer, stats=stats)
+    if option == "H":
+        return hpa.hpastar(hpa.HPAGraph(graph) if hgraph is None else hgraph, src, dest, timer=timer, stats=stats)
+    timer = tm.timer_for(timer)
+    start_time = timer.begin()  # Noting time taken to complete
+    nodequeue = PriorityQueue(indexed=True)
     nodequeue.add(src, 0)
     processedwithcost = {}  # keep the tally of processed nodes with their computed cost
     path = {src: src}
     processedwithcost[src] = 0  # Initializing first node
     nodes_expended = 0
+    track, peak = stats is not None, 1
     while not nodequeue.isempty():
+        if track and len(nodequeue) > peak:
+            peak = len(nodequeue)
         nodes_expended += 1
         currentnode = nodequeue.popmin()
         if currentnode == dest:
-            timetaken = (t.datetime.now() - start_time).microseconds
+            timer.lap("search")
             path = al.get_path(path, src, dest)                         # calling to get the path, algorithm.py
+            timer.lap("path")
+            timetaken = timer.since(start_time)
+            if track:
+                record_astar(stats, nodes_expended, processedwithcost, nodequeue, peak)
             return "S", currentnode, path, timetaken, nodes_expended, len(path)
         # fetch the neighbour of current node
         for neigh in graph.get(currentnode):  # Finding neighbors
@@ -80,32 +182,53 @@ def astar(graph, src, dest, option):
                 # calculate heuristic
                 # if option is M heuristic is Manhattan distance else it is euclidean
                 if option == "M":
-                    calpriority = newcost + manhattan(neigh, dest)  # If manhattan is a heuristic
+                    h = manhattan(neigh, dest)  # If manhattan is a heuristic
                 else:
-                    calpriority = newcost + euclidean(neigh, dest)
+                    h = euclidean(neigh, dest)
 
-                nodequeue.add(neigh, calpriority)
+                nodequeue.add(neigh, newcost + h, h)
                 path[neigh] = currentnode
-    timetaken = (t.datetime.now() - start_time).microseconds
+    timer.lap("search")
+    timetaken = timer.since(start_time)
+    if track:
+        record_astar(stats, nodes_expended, processedwithcost, nodequeue, peak)
     return "F", None, [], timetaken, nodes_expended, 0
 
 
+# Fills 'stats' for the A* searches: every add to the queue is a push, the ones for a node which already had a cost
+# are reopens (its cost improved). The parent dict has the same keys as the cost dict so costs is counted twice.
+def record_astar(stats, expanded, costs, nodequeue, peak):
+    stats.record(expanded, nodequeue.counter, nodequeue.counter - len(costs), peak,
+                 ss.container_bytes((costs, costs, nodequeue.pqueue, nodequeue.entries)))
+
+
 # Thinning function
 # Heuristic is based on solving thinned maze
-def astarthinning(thinnedgraph, graph, src1, dest1):
-    start_time1 = t.datetime.now()  # Noting time
-    nodequeue1 = PriorityQueue()
+# Time is in ns, 'timer' (timing.Timer) collects the heuristic, search and path phases, 'stats' gets the work done
+def astarthinning(thinnedgraph, graph, src1, dest1, timer=None, stats=None):
+    timer = tm.timer_for(timer)
+    start_time1 = timer.begin()  # Noting time
+    nodequeue1 = PriorityQueue(indexed=True)
     nodequeue1.add(src1, 0)
     processedwithcost1 = {}  # keep the tally of processed nodes with their computed cost
     path1 = {src1: src1}
     processedwithcost1[src1] = 0
     nodes_expended1 = 0
+    track, peak = stats is not None, 1
+    htable1 = heuristic_table(thinnedgraph, dest1)  # heuristic of every node, computed once
+    timer.lap("heuristic")
     while not nodequeue1.isempty():
+        if track and len(nodequeue1) > peak:
+            peak = len(nodequeue1)
         nodes_expended1 += 1
         currentnode1 = nodequeue1.popmin()
         if currentnode1 == dest1:
+            timer.lap("search")
             path1 = al.get_path(path1, src1, dest1)                  # getting path from algorithm.py
-            timetaken1 = (t.datetime.now() - start_time1).microseconds
+            timer.lap("path")
+            timetaken1 = timer.since(start_time1)
+            if track:
+                record_astar(stats, nodes_expended1, processedwithcost1, nodequeue1, peak)
             return "S", currentnode1, path1, timetaken1, nodes_expended1, len(path1)
         # fetch the neighbour of current node
         for neigh1 in graph.get(currentnode1):  # Finding neighbors
@@ -115,30 +238,44 @@ def astarthinning(thinnedgraph, graph, src1, dest1):
                 # update cost
                 processedwithcost1[neigh1] = newcost1
                 # calculate heuristic
-                temp1 = astar(thinnedgraph, neigh1, dest1, "M")[5]
+                temp1 = int(htable1[neigh1])
                 calpriority1 = newcost1 + temp1
-                nodequeue1.add(neigh1, calpriority1)
+                nodequeue1.add(neigh1, calpriority1, temp1)
                 path1[neigh1] = currentnode1
-    timetaken1 = (t.datetime.now() - start_time1).microseconds
-    return "F", None, [], timetaken1, nodes_expended1
+    timer.lap("search")
+    timetaken1 = timer.since(start_time1)
+    if track:
+        record_astar(stats, nodes_expended1, processedwithcost1, nodequeue1, peak)
+    return "F", None, [], timetaken1, nodes_expended1, 0
 
 
 # A star Diagonal
 # This heuristic is based on the player travelling extra node as diagonally (Own Implementation)
-def astardiagonal(diagonalgraph, graph, src2, dest2):
-    start_time2 = t.datetime.now()
-    nodequeue2 = PriorityQueue()
+# Time is in ns, 'timer' (timing.Timer) collects the heuristic, search and path phases, 'stats' gets the work done
+def astardiagonal(diagonalgraph, graph, src2, dest2, timer=None, stats=None):
+    timer = tm.timer_for(timer)
+    start_time2 = timer.begin()
+    nodequeue2 = PriorityQueue(indexed=True)
     nodequeue2.add(src2, 0)
     processedwithcost2 = {}
     path2 = {src2: src2}
     processedwithcost2[src2] = 0
     nodes_expended2 = 0
+    track, peak = stats is not None, 1
+    htable2 = heuristic_table(diagonalgraph, dest2)  # heuristic of every node, computed once
+    timer.lap("heuristic")
     while not nodequeue2.isempty():
+        if track and len(nodequeue2) > peak:
+            peak = len(nodequeue2)
         nodes_expended2 += 1
         currentnode2 = nodequeue2.popmin()
         if currentnode2 == dest2:
+            timer.lap("search")
             path2 = al.get_path(path2, src2, dest2)
-            timetaken2 = (t.datetime.now() - start_time2).microseconds
+            timer.lap("path")
+            timetaken2 = timer.since(start_time2)
+            if track:
+                record_astar(stats, nodes_expended2, processedwithcost2, nodequeue2, peak)
             return "S", currentnode2, path2, timetaken2, nodes_expended2, len(path2)
         # fetch the neighbour of current node
         for neigh2 in graph.get(currentnode2):
@@ -148,30 +285,38 @@ def astardiagonal(diagonalgraph, graph, src2, dest2):
                 # update cost
                 processedwithcost2[neigh2] = newcost2
                 # calculate heuristic
-                temp2 = astar(diagonalgraph, neigh2, dest2, "M")[5]
+                temp2 = int(htable2[neigh2])
                 calpriority2 = newcost2 + temp2
-                nodequeue2.add(neigh2, calpriority2)
+                nodequeue2.add(neigh2, calpriority2, temp2)
                 path2[neigh2] = currentnode2
-    timetaken2 = (t.datetime.now() - start_time2).microseconds
-    return "F", None, [], timetaken2, nodes_expended2
+    timer.lap("search")
+    timetaken2 = timer.since(start_time2)
+    if track:
+        record_astar(stats, nodes_expended2, processedwithcost2, nodequeue2, peak)
+    return "F", None, [], timetaken2, nodes_expended2, 0
 
 
 # Function used to generate thin maze with certain probability described in it
-def genrate_thinmaze():
+# seed is the master seed of the maze and its thinnings (seeding.py), None is a new maze each run
+def genrate_thinmaze(seed=None):
     size = 20
     prob = 0.3
     thinninglist = [0.2, 0.4, 0.6, 0.8]
-    maze = mz.create_maze(size, prob)                 # Extracting maze
+    maze = mz.create_maze(size, prob, sd.generator(seed, 0))                 # Extracting maze
     original_maze = maze.copy()
     vis.display_maze(original_maze, size, "Maze with size " + str(size) + " and probability of " + str(prob))
-    for thin in thinninglist:
-        thined_maze = mz.maze_thinning(thin, maze)         # Maze thinned
+    for tindex, thin in enumerate(thinninglist):
+        thined_maze = mz.maze_thinning(thin, maze, sd.generator(seed, 0, tindex))         # Maze thinned
         vis.display_maze(thined_maze, size, "Maze with size " + str(size) + " and probability of " + str(prob)
                          + " :thinned by factor " + str(thin))
 
 
 # FUnction is used to select the size of the maze
-def select_maze_size():
+# seed is the master seed, the mazes of every size come from their own stream
+# By default astar "M" searches the 100 mazes of a size one after another. With batch they are searched together
+# (batchsearch.batch_astar) and the time of a maze is the amortised batch time (batch time over 100), not the time of
+# one search
+def select_maze_size(seed=None, batch=False):
     result = {}
     for size in range(30, 80, 10):
         print("Moving..........")
@@ -179,39 +324,59 @@ def select_maze_size():
         count = 0
         total_nodes = []
         nodes_Expended = []
-        for i in range(0, 100):
-            ma = mz.create_maze(size, 0.3)
-            gr = mz.create_graph(ma)
-            total_nodes.append(len(gr.keys()))
-            answer = astar(gr, (0, 0), (size - 1, size - 1), "M")            # A star method
-            if answer[0] == "S":
-                count += 1
-            time.append(answer[3])
-            nodes_Expended.append(answer[4])
-        result[size] = {"Average_time(microsec)": np.average(time),
+        mazes = mz.create_mazes(100, size, 0.3, sd.generator(seed, size))  # all 100 mazes in one draw
+        if batch:
+            success, _, nodes_Expended, timetaken = bs.batch_astar(mazes)
+            count = int(success.sum())
+            time = [timetaken / len(mazes)]
+            total_nodes = np.count_nonzero(mazes != 1, axis=(1, 2))
+        else:
+            for ma in mazes:
+                gr = mz.create_gridgraph(ma)
+                total_nodes.append(len(gr.keys()))
+                answer = astar(gr, (0, 0), (size - 1, size - 1), "M")        # A star method
+                if answer[0] == "S":
+                    count += 1
+                time.append(answer[3])
+                nodes_Expended.append(answer[4])
+        result[size] = {"Average_time(ns)": np.average(time),
                         "Average_nodes_expended": np.average(nodes_Expended),
                         "Average_nodes": np.average(total_nodes), "Successcount": count}
     vis.dispdata(result, "Average_nodes", list(result.keys()), "Average_nodes vs size 100 iteration")
     vis.dispdata(result, "Average_nodes_expended", list(result.keys()), "Average_nodes_expended vs size 100 iteration")
-    vis.dispdata(result, "Average_time(microsec)", list(result.keys()), "Average_time(microsec) vs size 100 iteration")
-    vis.dispdata(result, "Successcount", list(result.keys()), "Average_time(microsec) vs successcout 100 iteration")
+    vis.dispdata(result, "Average_time(ns)", list(result.keys()), "Average_time(ns) vs size 100 iteration"
+                 + (" (amortised batch time)" if batch else ""))
+    vis.dispdata(result, "Successcount", list(result.keys()), "Average_time(ns) vs successcout 100 iteration")
 
 
 # Method to generate result
-# This function includes Astar Manhattan, Astar Euclidean, Astar Thinning, Astar diagonal
+# This function includes Astar Manhattan, Astar Euclidean, Astar Thinning, Astar diagonal, Jump Point Search, HPA*
 # Running for 100 iterations
-def generate_result():
+# seed is the master seed: maze i comes from stream (i,) and its thinning from stream (i, thinning index), so every
+# thinning factor is measured on the same 100 mazes and a run is replayed by passing the same seed
+# 'corpus' (mazecorpus.MazeCorpus) gives the 100 mazes instead
+# The 100 mazes are first searched together by batchsearch.batch_astar, which tells the solvable ones (the others are
+# not searched) and gives the batched A* series "BA", its time per maze being the amortised batch time (batch time over
+# 100, not the time of one search)
+def generate_result(seed=None, corpus=None):
     # Thinning list
     thinninglist = [0.2, 0.4, 0.6, 0.8]       # Thinning probability
     size = 50                                 # Size of maze
     result = {}                               # Dictionary to store results
-    for thin in thinninglist:
+    if corpus is None:
+        mazes = np.stack([mz.create_maze(size, 0.3, sd.generator(seed, i)) for i in range(0, 100)])
+    else:
+        mazes = np.stack([corpus[record] for record in corpus.take(size, 0.3, 100)])
+    solvable, path_length_batch, nodes_expended_batch, time_batch = bs.batch_astar(mazes)
+    for tindex, thin in enumerate(thinninglist):
         print("Moving..........")
 
         time_m = []                           # Time initialization
         time_e = []
         time_thin = []
         time_diagonal = []
+        time_jps = []
+        time_hpa = []
 
         successcount = 0                      # Initialized success rate count
         total_nodes = []
@@ -220,25 +385,33 @@ def generate_result():
         nodes_expended_e = []
         nodes_expended_thin = []
         nodes_expended_diagonal = []
+        nodes_expended_jps = []
+        nodes_expended_hpa = []
 
         path_length_m = []                    # Path initialization
         path_length_e = []
         path_length_thin = []
         path_length_diagonal = []
+        path_length_jps = []
+        path_length_hpa = []
 
         for i in range(0, 100):               # Running for 100 iterations
-            maze = mz.create_maze(size, 0.3)
+            maze = mazes[i].copy()            # thinning changes the maze in place
+            total_nodes.append(int(np.count_nonzero(maze != 1)))
+            if not solvable[i]:
+                continue  # no path, none of the searches would succeed so do not build graphs or search
             original_maze = maze.copy()
-            thined_maze = mz.maze_thinning(thin, maze)
-            original_graph = mz.create_graph(original_maze)
-            thined_graph = mz.create_graph(thined_maze)
-            diagonal_graph = mz.create_relaxedgraph(original_maze)
-            total_nodes.append(len(original_graph.keys()))
+            thined_maze = mz.maze_thinning(thin, maze, sd.generator(seed, i, tindex))
+            original_graph = mz.create_gridgraph(original_maze)
+            thined_graph = mz.create_gridgraph(thined_maze)
+            diagonal_graph = mz.create_relaxedgridgraph(original_maze)
 
             answer1 = astar(original_graph, (0, 0), (size - 1, size - 1), "M")
             answer2 = astar(original_graph, (0, 0), (size - 1, size - 1), "E")
             answer3 = astarthinning(thined_graph, original_graph, (0, 0), (size - 1, size - 1))
             answer4 = astardiagonal(diagonal_graph, original_graph, (0, 0), (size - 1, size - 1))
+            answer5 = astar(original_graph, (0, 0), (size - 1, size - 1), "J")
+            answer6 = astar(original_graph, (0, 0), (size - 1, size - 1), "H")
 
             if answer1[0] == "S":
                 successcount += 1
@@ -247,32 +420,49 @@ def generate_result():
                 time_e.append(answer2[3])
                 time_thin.append(answer3[3])
                 time_diagonal.append(answer4[3])
+                time_jps.append(answer5[3])
+                time_hpa.append(answer6[3])
 
                 nodes_expended_m.append(answer1[4])
                 nodes_expended_e.append(answer2[4])
                 nodes_expended_thin.append(answer3[4])
                 nodes_expended_diagonal.append(answer4[4])
+                nodes_expended_jps.append(answer5[4])
+                nodes_expended_hpa.append(answer6[4])
 
                 path_length_m.append(answer1[5])
                 path_length_e.append(answer2[5])
                 path_length_thin.append(answer3[5])
                 path_length_diagonal.append(answer4[5])
+                path_length_jps.append(answer5[5])
+                path_length_hpa.append(answer6[5])
 
-        result[thin] = {"M": {"Average_time(microsec)": (st.mean(time_m) if len(time_m) > 0 else 0),
+        result[thin] = {"M": {"Average_time(ns)": (st.mean(time_m) if len(time_m) > 0 else 0),
                               "Average_nodes_expended": (st.mean(nodes_expended_m) if len(nodes_expended_m) > 0 else 0),
                               "Average_path_length": st.mean(path_length_m) if len(path_length_m) > 0 else 0},
-                        "E": {"Average_time(microsec)": st.mean(time_e) if len(time_e) > 0 else 0,
+                        "E": {"Average_time(ns)": st.mean(time_e) if len(time_e) > 0 else 0,
                               "Average_nodes_expended": st.mean(nodes_expended_e) if len(nodes_expended_e) > 0 else 0,
                               "Average_path_length": st.mean(path_length_e) if len(path_length_e) > 0 else 0},
-                        "TH": {"Average_time(microsec)": st.mean(time_thin) if len(time_thin) > 0 else 0,
+                        "TH": {"Average_time(ns)": st.mean(time_thin) if len(time_thin) > 0 else 0,
                                "Average_nodes_expended": st.mean(nodes_expended_thin) if len(
                                    nodes_expended_thin) > 0 else 0,
                                "Average_path_length": st.mean(path_length_thin) if len(path_length_thin) > 0 else 0},
-                        "Dia": {"Average_time(microsec)": st.mean(time_diagonal) if len(time_diagonal) > 0 else 0,
+                        "Dia": {"Average_time(ns)": st.mean(time_diagonal) if len(time_diagonal) > 0 else 0,
                                 "Average_nodes_expended": st.mean(nodes_expended_diagonal) if len(
                                     nodes_expended_diagonal) > 0 else 0,
                                 "Average_path_length": st.mean(path_length_diagonal) if len(
                                     path_length_diagonal) > 0 else 0},
+                        "JPS": {"Average_time(ns)": st.mean(time_jps) if len(time_jps) > 0 else 0,
+                                "Average_nodes_expended": st.mean(nodes_expended_jps) if len(
+                                    nodes_expended_jps) > 0 else 0,
+                                "Average_path_length": st.mean(path_length_jps) if len(path_length_jps) > 0 else 0},
+                        "HPA": {"Average_time(ns)": st.mean(time_hpa) if len(time_hpa) > 0 else 0,
+                                "Average_nodes_expended": st.mean(nodes_expended_hpa) if len(
+                                    nodes_expended_hpa) > 0 else 0,
+                                "Average_path_length": st.mean(path_length_hpa) if len(path_length_hpa) > 0 else 0},
+                        "BA": {"Average_time(ns)": time_batch / len(mazes),            # amortised over the batch
+                               "Average_nodes_expended": np.mean(nodes_expended_batch[solvable]) if solvable.any() else 0,
+                               "Average_path_length": np.mean(path_length_batch[solvable]) if solvable.any() else 0},
                         "Average_Number_of_Nodes": st.mean(total_nodes),
                         "Success_count": successcount
                         }
@@ -287,11 +477,11 @@ def generate_result():
                + "count in different iteration")
     vis.disp_data2(result, "Average_Number_of_Nodes", "Average Number of Nodes", "Iteration(corresponds to each thinning "
                + "factor)", " Average number of nodes in each iteration")
-    vis.disp_data(result, "Average_time(microsec)", "Thinning Factor", "Time(micro sec)",
+    vis.disp_data(result, "Average_time(ns)", "Thinning Factor", "Time(ns)",
                   "Average Time vs Thinning Factor")
 
 
+if __name__ == '__main__':
+    generate_result()
 
-generate_result()
-
-plt.show()
+    plt.show()
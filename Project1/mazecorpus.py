@@ -0,0 +1,106 @@
+import os
+import numpy as np
+import createmaze as mz
+import distancefield as df
+import seeding as sd
+
+# On-disk maze corpus
+# A corpus is one file holding many mazes, so every algorithm and every run is measured on the same instances and
+# mazes too big to keep in RAM together are read one at a time. The file is memory-mapped:
+#
+#     header   magic, number of mazes, offset of the maze data
+#     index    one record per maze: size, density, seed, solvable, optimal path length (nodes, 0 if unsolvable)
+#              and the offset of its bits
+#     data     the mazes, one bit per cell (1 is blockage), row after row, each padded to a whole byte
+#
+# The index is a numpy view of the mapped file (no copy), a maze is unpacked from its bits when it is read. Mazes are
+# made from their own seed (seeding.int_seed of the master seed, the size, the density index and the maze number),
+# so a corpus is rebuilt identically from the same arguments.
+# A MazeCorpus pickles as its path: workers of a process pool map the same file and share its pages instead of
+# receiving copies of the mazes.
+#
+#     build_corpus("mazes.corpus", [100, 200], [0.2, 0.3], 50, seed=0)
+#     corpus = MazeCorpus("mazes.corpus")
+#     for record in corpus.take(100, 0.3, 10, solvable=True):
+#         maze = corpus[record]
+
+MAGIC = b"MAZECRP1"
+HEADER = np.dtype([("magic", "S8"), ("count", "<u8"), ("dataoffset", "<u8")])
+INDEX = np.dtype([("size", "<u4"), ("density", "<f8"), ("seed", "<u8"), ("solvable", "?"), ("optimal", "<i8"),
+                  ("offset", "<u8")])
+
+
+# Bytes taken by the bits of a maze of the given size
+def packed_bytes(size):
+    return -(-size * size // 8)
+
+
+# Writes a corpus of 'count' mazes for every size and density to 'path', one maze in memory at a time
+# Returns the number of mazes written
+def build_corpus(path, sizes, densities, count, seed=None):
+    specs = [(size, dindex, density, k) for size in sizes for dindex, density in enumerate(densities)
+             for k in range(count)]
+    index = np.zeros(len(specs), dtype=INDEX)
+    dataoffset = HEADER.itemsize + INDEX.itemsize * len(specs)
+    offset = dataoffset
+    with open(path, "wb") as f:
+        f.write(np.array([(MAGIC, len(specs), dataoffset)], dtype=HEADER).tobytes())
+        f.write(index.tobytes())  # placeholder, written again once the mazes are known
+        for record, (size, dindex, density, k) in enumerate(specs):
+            mazeseed = sd.int_seed(seed, size, dindex, k)
+            maze = mz.create_maze(size, density, mazeseed)
+            dist = df.distance_field(maze, [(0, 0)])[0][size - 1, size - 1]
+            index[record] = (size, density, mazeseed, dist >= 0, dist + 1 if dist >= 0 else 0, offset)
+            f.write(np.packbits(maze).tobytes())
+            offset += packed_bytes(size)
+        f.seek(HEADER.itemsize)
+        f.write(index.tobytes())
+    return len(specs)
+
+
+class MazeCorpus(object):
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.data = np.memmap(self.path, dtype=np.uint8, mode="r")
+        header = self.data[:HEADER.itemsize].view(HEADER)[0]
+        if header["magic"] != MAGIC:
+            raise ValueError("%s is not a maze corpus" % path)
+        self.index = self.data[HEADER.itemsize:HEADER.itemsize + INDEX.itemsize * int(header["count"])].view(INDEX)
+
+    def __len__(self):
+        return len(self.index)
+
+    # Bits of a maze as a view of the mapped file
+    def packed(self, record):
+        offset, size = int(self.index[record]["offset"]), int(self.index[record]["size"])
+        return self.data[offset:offset + packed_bytes(size)]
+
+    # Maze of a record, a (size, size) uint8 array like createmaze.create_maze gives
+    def __getitem__(self, record):
+        size = int(self.index[record]["size"])
+        return np.unpackbits(self.packed(record), count=size * size).reshape(size, size)
+
+    # Record numbers of the mazes of a size and density (and solvability when given), in corpus order
+    # Raises ValueError if the corpus holds fewer than 'count' of them (None takes them all, at least one)
+    def take(self, size, density, count=None, solvable=None):
+        match = (self.index["size"] == size) & np.isclose(self.index["density"], density)
+        if solvable is not None:
+            match &= self.index["solvable"] == solvable
+        records = np.flatnonzero(match)
+        needed = 1 if count is None else count
+        if len(records) < needed:
+            raise ValueError("corpus %s has %d mazes of size %d and density %s, %d needed"
+                             % (self.path, len(records), size, density, needed))
+        return records if count is None else records[:count]
+
+    # Yields (record, maze) for the given records (default all), one maze unpacked at a time
+    def stream(self, records=None):
+        for record in range(len(self)) if records is None else records:
+            yield int(record), self[record]
+
+    # Pickled as its path, the file is mapped again where it is unpickled
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
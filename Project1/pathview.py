@@ -0,0 +1,171 @@
+# Paths of the searches as views over their predecessor buffers
+# A search over node indices finds its path by walking the parent list from dest back to src. A PathView keeps the
+# parent list itself with the src and dest indices and walks it only when it is read: nothing is collected when the
+# search returns, the length is counted once (a walk without storing anything) and path[k] walks back from dest.
+# Iterating walks the chain once into a buffer of the path length made up front (no list growing node by node),
+# reversed(path) walks from dest without any buffer. A PathView behaves like the list of nodes the searches used to
+# return:
+#
+#     path = algorithm.bfs(graph, src, dest)[2]
+#     len(path), path[0], path[-1], path[2:5]     # slices are plain lists
+#     for node in path: ...                       # nodes are made one at a time
+#     path.pop(0), path.pop()                     # move a cursor, nothing is shifted
+#     path.pop(k)                                 # any other position turns the view into a list first (O(n), once)
+#
+# A path can go on along a second parent list read forwards (bibfs: src -> meeting node, then meeting node -> dest).
+
+
+class PathView(object):
+    # The path is src -> ... -> node read backwards along 'parent' ('node' is the last node of this part), then
+    # 'tail' nodes along 'tailparent' starting at index 'tail' and ending at index 'taildest' (-1 is no tail).
+    # 'coord' turns an index into a node.
+    def __init__(self, parent, srci, node, coord, tailparent=None, tail=-1, taildest=-1):
+        self.parent = parent
+        self.srci = srci
+        self.node = node
+        self.coord = coord
+        self.tailparent = tailparent
+        self.tail = tail
+        self.taildest = taildest
+        self.nodes = None                 # list of the nodes once a pop in the middle needed one
+        self.start = 0                    # cursor moved by pop(0)
+        self.end = None                   # cursor moved by pop(), the whole length until counted
+
+    # Number of nodes of the two parts, counted by walking both chains once
+    def total(self):
+        parent, srci, node, size = self.parent, self.srci, self.node, 1
+        while node != srci:
+            node = parent[node]
+            size += 1
+        self.backsize = size
+        if self.tail != -1:
+            tailparent, node, size = self.tailparent, self.tail, size + 1
+            while node != self.taildest:
+                node = tailparent[node]
+                size += 1
+        return size
+
+    # Node index at position k of the whole path, cursors ignored
+    def index_at(self, k):
+        if self.end is None:
+            self.end = self.total()
+        if k < self.backsize:
+            parent, node = self.parent, self.node
+            for _ in range(self.backsize - 1 - k):
+                node = parent[node]
+            return node
+        tailparent, node = self.tailparent, self.tail
+        for _ in range(k - self.backsize):
+            node = tailparent[node]
+        return node
+
+    # Node indices of the path in order, parent chain walked once into a preallocated list
+    def indices(self):
+        if self.end is None:
+            self.end = self.total()
+        chain = [0] * self.backsize
+        parent, node = self.parent, self.node
+        for k in range(self.backsize - 1, -1, -1):
+            chain[k] = node
+            if k:
+                node = parent[node]
+        if self.tail != -1:
+            node, tailparent = self.tail, self.tailparent
+            chain += [0] * (self.end - self.backsize)
+            for k in range(self.backsize, self.end):
+                chain[k] = node
+                if node != self.taildest:
+                    node = tailparent[node]
+        return chain[self.start:self.end]
+
+    def __len__(self):
+        if self.nodes is not None:
+            return len(self.nodes)
+        if self.end is None:
+            self.end = self.total()
+        return self.end - self.start
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __getitem__(self, k):
+        if self.nodes is not None:
+            return self.nodes[k]
+        if isinstance(k, slice):
+            return list(self)[k]
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("path index out of range")
+        return self.coord(self.index_at(self.start + k))
+
+    def __iter__(self):
+        if self.nodes is not None:
+            return iter(self.nodes)
+        return map(self.coord, self.indices())
+
+    def __reversed__(self):
+        if self.nodes is not None:
+            return reversed(self.nodes)
+        return map(self.coord, self.walk_back())
+
+    # Node indices from the last node to the first, the parent chain is walked without a buffer (a bibfs tail is
+    # read forwards, so its nodes are collected first)
+    def walk_back(self):
+        if self.end is None:
+            self.end = self.total()
+        if self.end > self.backsize:
+            tail, node = [0] * (self.end - self.backsize), self.tail
+            for k in range(len(tail)):
+                tail[k] = node
+                if k < len(tail) - 1:
+                    node = self.tailparent[node]
+            for node in reversed(tail[max(0, self.start - self.backsize):]):
+                yield node
+        parent, node = self.parent, self.node
+        for _ in range(self.backsize - min(self.end, self.backsize)):
+            node = parent[node]
+        for k in range(min(self.end, self.backsize) - 1, self.start - 1, -1):
+            yield node
+            if k > self.start:
+                node = parent[node]
+
+    # Removes and returns the node at position k, the first and last ones only move a cursor
+    def pop(self, k=-1):
+        size = len(self)
+        if not size:
+            raise IndexError("pop from empty path")
+        if self.nodes is None:
+            if k < 0:
+                k += size
+            if k == 0:
+                self.start += 1
+                return self.coord(self.index_at(self.start - 1))
+            if k == size - 1:
+                self.end -= 1
+                return self.coord(self.index_at(self.end))
+            self.nodes = list(self)
+        return self.nodes.pop(k)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __repr__(self):
+        return "PathView(%r)" % list(self)
+
+
+# Path of a single node, src == dest
+def single(node):
+    return PathView(None, 0, 0, lambda idx: node)
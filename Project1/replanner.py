@@ -0,0 +1,146 @@
+import heapq
+import math as m
+import gridgraph as gg
+
+# Incremental replanning with D* Lite (Koenig and Likhachev)
+# The search runs backwards from dest to the agent, so when cells get blocked (fire) only the part of the previous
+# search that depended on them is repaired instead of searching again from scratch. The graph itself is never
+# rebuilt: blocked cells are kept in a bytearray over node indices and every step into or out of a blocked cell
+# costs infinity.
+#
+#     planner = DStarLite(graph, src, dest)
+#     step = planner.next_step()        # best next node from the current position, None if cut off
+#     planner.move(step)                # agent moved
+#     planner.block(cells)              # cells caught fire, the next next_step() repairs the plan
+#
+# 'expansions' counts every node expanded and 'reexpansions' the ones which had already been expanded before.
+
+
+class DStarLite(object):
+    def __init__(self, graph, src, dest):
+        self.ig = gg.indexed(graph)
+        n = self.ig.num_cells
+        self.coords = [self.ig.coord(i) for i in range(n)]
+        self.diagonal = getattr(graph, "diagonal", False)
+        self.blocked = bytearray(n)
+        self.g = [m.inf] * n
+        self.rhs = [m.inf] * n
+        self.queued = {}  # node -> key it is queued with, heap entries with another key are stale
+        self.pqueue = []
+        self.km = 0
+        self.start = self.ig.index(src)
+        self.last = self.start
+        self.goal = self.ig.index(dest)
+        self.expanded = bytearray(n)
+        self.expansions = 0
+        self.reexpansions = 0
+        self.rhs[self.goal] = 0
+        self.push(self.goal, self.calculatekey(self.goal))
+
+    # Manhattan distance for 4-connected graphs, Chebyshev when diagonal moves are allowed
+    def h(self, a, b):
+        (ai, aj), (bi, bj) = self.coords[a], self.coords[b]
+        if self.diagonal:
+            return max(abs(ai - bi), abs(aj - bj))
+        return abs(ai - bi) + abs(aj - bj)
+
+    def cost(self, a, b):
+        return m.inf if self.blocked[a] or self.blocked[b] else 1
+
+    def calculatekey(self, u):
+        best = min(self.g[u], self.rhs[u])
+        return best + self.h(self.start, u) + self.km, best
+
+    def push(self, u, key):
+        self.queued[u] = key
+        heapq.heappush(self.pqueue, (key, u))
+
+    # Smallest valid key in the queue, stale entries are dropped on the way
+    def topkey(self):
+        while self.pqueue:
+            key, u = self.pqueue[0]
+            if self.queued.get(u) == key:
+                return key
+            heapq.heappop(self.pqueue)
+        return m.inf, m.inf
+
+    def updatevertex(self, u):
+        if u != self.goal:
+            best = m.inf
+            g = self.g
+            for s in self.ig.neighbour_indices(u):
+                c = self.cost(u, s) + g[s]
+                if c < best:
+                    best = c
+            self.rhs[u] = best
+        self.queued.pop(u, None)
+        if self.g[u] != self.rhs[u]:
+            self.push(u, self.calculatekey(u))
+
+    def computeshortestpath(self):
+        start = self.start
+        while self.topkey() < self.calculatekey(start) or self.rhs[start] != self.g[start]:
+            kold, u = heapq.heappop(self.pqueue)
+            del self.queued[u]
+            knew = self.calculatekey(u)
+            if kold < knew:
+                self.push(u, knew)
+                continue
+            self.expansions += 1
+            if self.expanded[u]:
+                self.reexpansions += 1
+            self.expanded[u] = 1
+            if self.g[u] > self.rhs[u]:
+                self.g[u] = self.rhs[u]
+                for s in self.ig.neighbour_indices(u):
+                    self.updatevertex(s)
+            else:
+                self.g[u] = m.inf
+                self.updatevertex(u)
+                for s in self.ig.neighbour_indices(u):
+                    self.updatevertex(s)
+
+    # Agent moved to node
+    def move(self, node):
+        self.start = self.ig.index(node)
+
+    # Nodes which became impassable (e.g. caught fire)
+    def block(self, nodes):
+        changed = [self.ig.index(node) for node in nodes if node in self.ig]
+        changed = [u for u in changed if not self.blocked[u]]
+        if not changed:
+            return
+        self.km += self.h(self.last, self.start)
+        self.last = self.start
+        for u in changed:
+            self.blocked[u] = 1
+        for u in changed:
+            self.updatevertex(u)
+            for s in self.ig.neighbour_indices(u):
+                self.updatevertex(s)
+
+    # Best next node from the current position after repairing the plan, None when dest cannot be reached
+    def next_step(self):
+        self.computeshortestpath()
+        if self.start == self.goal:
+            return self.coords[self.goal]
+        best, bestnode = m.inf, None
+        for s in self.ig.neighbour_indices(self.start):
+            c = self.cost(self.start, s) + self.g[s]
+            if c < best:
+                best, bestnode = c, s
+        if bestnode is None:
+            return None
+        return self.coords[bestnode]
+
+    # Whole current plan from the agent to dest, [] when dest cannot be reached
+    def plan(self):
+        self.computeshortestpath()
+        if self.g[self.start] == m.inf:
+            return []
+        path = [self.start]
+        node = self.start
+        while node != self.goal:
+            node = min(self.ig.neighbour_indices(node), key=lambda s: self.cost(node, s) + self.g[s])
+            path.append(node)
+        return [self.coords[i] for i in path]
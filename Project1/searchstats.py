@@ -0,0 +1,84 @@
+import sys
+
+# Work counters of the searches
+# Every search takes an optional 'stats' argument. When a SearchStats is passed the search fills it before returning
+# (one call at the end, the counters are kept in local variables or derived from the search's own structures), when
+# it is None nothing is counted and the search runs as before:
+#
+#     stats = SearchStats()
+#     algorithm.bfs(graph, src, dest, stats=stats)
+#     stats.expansions, stats.peak_frontier, stats.peak_memory
+#
+# expansions     nodes taken out of the frontier and expanded
+# pushes         nodes put into the frontier (src included)
+# reopens        pushes of a node which had already been reached, with a better cost (decrease-key or re-expansion)
+# peak_frontier  largest number of live entries in the frontier
+# peak_memory    estimate in bytes of the search's own containers at their largest (their shallow size, plus one
+#                pointer per frontier entry), the nodes themselves are shared with the graph and not counted
+# iterations     deepening iterations of the iterative searches, 1 for the others
+#
+# StatsAggregate sums the stats of many runs (thousands of mazes) and gives totals, means and maxima.
+
+FIELDS = ("expansions", "pushes", "reopens", "peak_frontier", "peak_memory", "iterations")
+
+POINTER = 8  # bytes of one slot of a list, deque or heap
+
+
+class SearchStats(object):
+    def __init__(self):
+        self.expansions = 0
+        self.pushes = 0
+        self.reopens = 0
+        self.peak_frontier = 0
+        self.peak_memory = 0
+        self.iterations = 0
+
+    # Adds the work of one search (or one iteration), peaks are kept as maxima
+    def record(self, expansions=0, pushes=0, reopens=0, frontier=0, memory=0, iterations=1):
+        self.expansions += expansions
+        self.pushes += pushes
+        self.reopens += reopens
+        self.peak_frontier = max(self.peak_frontier, frontier)
+        self.peak_memory = max(self.peak_memory, memory)
+        self.iterations += iterations
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __repr__(self):
+        return "SearchStats(%s)" % ", ".join("%s=%d" % item for item in self.as_dict().items())
+
+
+# Shallow size in bytes of the given containers plus 'slots' pointers, the memory estimate of a search
+def container_bytes(containers, slots=0):
+    return sum(sys.getsizeof(container) for container in containers) + POINTER * slots
+
+
+# Fills 'stats' for a heap search with lazy deletion (jps, hpa): a push of a node which already had a cost is a
+# reopen. containers are (cost dict, parent dict, closed set), peak is the largest heap.
+def record_heap_search(stats, expanded, pushes, containers, peak):
+    stats.record(expanded, pushes, pushes - len(containers[0]), peak, container_bytes(containers, peak))
+
+
+# Stats of many runs of a search
+class StatsAggregate(object):
+    def __init__(self):
+        self.runs = 0
+        self.totals = dict.fromkeys(FIELDS, 0)
+        self.maxima = dict.fromkeys(FIELDS, 0)
+
+    def add(self, stats):
+        self.runs += 1
+        for field, value in stats.as_dict().items():
+            self.totals[field] += value
+            self.maxima[field] = max(self.maxima[field], value)
+
+    def mean(self, field):
+        return self.totals[field] / self.runs if self.runs else 0
+
+    # {field: {"total", "mean", "max"}} and the number of runs
+    def summary(self):
+        result = {field: {"total": self.totals[field], "mean": self.mean(field), "max": self.maxima[field]}
+                  for field in FIELDS}
+        result["runs"] = self.runs
+        return result
@@ -0,0 +1,23 @@
+import numpy as np
+
+# Seed streams for the experiments
+# An entry point takes one master seed. Every trial component (a maze, the fire of a maze for a flamability, ...) is
+# identified by a key of integers and gets its own stream from the master seed and that key (SeedSequence spawn key).
+# Streams of different keys are independent, and a component sees the same numbers whatever order the trials run in
+# or which process runs them, so a run is replayed exactly by passing the same master seed again.
+# A master seed of None draws fresh entropy: runs are then independent but not reproducible.
+
+
+# Seed stream of a trial component, 'key' identifies it (e.g. (maze,) or (maze, flamability index))
+def stream(seed, *key):
+    return np.random.SeedSequence(seed, spawn_key=key)
+
+
+# numpy Generator of a trial component
+def generator(seed, *key):
+    return np.random.default_rng(stream(seed, *key))
+
+
+# Integer seed of a trial component, for APIs taking a plain int (mazecorpus.build_corpus stores one per maze)
+def int_seed(seed, *key):
+    return int(stream(seed, *key).generate_state(1, np.uint64)[0])
@@ -1,114 +1,127 @@
 import matplotlib.pyplot as plt
 import numpy as np
-import datetime as t
 import algorithm as al
 import createmaze as mz
+import distancefield as df
+import gridgraph as gg
+import firemodel as fm
+import fireplanner as fp
+import replanner as rp
+import seeding as sd
+import timing as tm
 import visualisation as vis
 import statistics as st
 
 
-# Function to start a fire node in the maze
-def let_there_be_fire(graph, src, dest):
-    # Extract the keys (nodes) of the graph
-    graph_keys = list(graph.keys())
-    length = len(graph_keys)
-    indexlist = np.random.choice(np.arange(length), length, replace=False)
-    for num in indexlist:
-        if num != 0 and num != length - 1 and al.dfs(graph, src, graph_keys[num])[0] == 'S' and num is not None:
-            firenode = graph_keys[num]
-            return firenode
-
-
-# Function to spread the fire in the maze with specified probability
-# 'flamability' is probability, 'a' is source and 'b' is destination thses, 'onfire' is nodes on fire
-# 'a' and 'b' are added to avoid fire at src and destination
-def spread_fire(graph, onfire, flamability, a, b):
-    loc = onfire.copy()
-    for node in graph.keys():
-        if node not in loc and node not in [a, b]:
-            neighbours = graph.get(node)
-            n_onfire = 0  # variable to count the nodes on fire
-            for n in neighbours:
-                if n in loc:
-                    n_onfire = n_onfire + 1  # Incrementing the count for each node on fire
-            if n_onfire > 0:  # Spreading fire on the given probability
-                prob = 1 - ((1 - flamability) ** n_onfire)
-                if np.random.choice(np.arange(2), 1, p=[1 - prob, prob])[0] == 1:
-                    onfire.append(node)  # adding the new nodes on fire to the previous fire node list
+# Function to start fire nodes in the maze
+# The component of the maze reachable from src is computed once with a single BFS and the fire starts are drawn
+# uniformly from it, src and dest excluded.
+# 'k' is the number of distinct fire starts, 'mindist' the minimum number of steps between the agent (src) and a
+# fire start, 'rng' a numpy Generator or seed (None uses the global np.random state)
+# Returns the list of fire starts, None when fewer than k cells qualify
+def let_there_be_fires(graph, src, dest, k=1, mindist=1, rng=None):
+    if isinstance(graph, gg.GridGraph):
+        dist, ig = df.distance_field(graph, src)[0].reshape(-1), graph
+    else:
+        dist, ig = al.bfs_distances(graph, src)
+        dist = np.array(dist)
+    candidates = np.flatnonzero(dist >= max(mindist, 1))  # reachable and not src
+    candidates = candidates[candidates != ig.index(dest)]
+    if len(candidates) < k:
+        return None
+    rng = np.random if rng is None else np.random.default_rng(rng)
+    # distinct starts, sampled without replacement
+    chosen = rng.choice(candidates, k, replace=False)
+    return [ig.coord(int(i)) for i in chosen]
+
+
+# Function to start a fire node in the maze, see let_there_be_fires
+def let_there_be_fire(graph, src, dest, mindist=1, rng=None):
+    firenodes = let_there_be_fires(graph, src, dest, 1, mindist, rng)
+    return None if firenodes is None else firenodes[0]
+
+
+# Fire starts of a solution, 'f' is a node or a list of nodes
+# Always a new list: the solutions extend it, the caller's list is shared by the other solutions
+def fire_starts(f):
+    return list(f) if isinstance(f, list) else [f]
 
 
 # foolhardy
 # Solution 1
 # Agent follows the searched path without changing or recomputing it.
-# 'f1' is the starting point of fire
+# 'f1' is the starting point of fire (or a list of them)
 # Using Bidirectional BFS to find the shortest path from Algorithm class
 # 'q1' is flamability
 # 'dsflag' this is display flag to diplay mazes if required
-def sol1(maze1, size1, graph1, src1, dest1, f1, q1, dsflag):
-    start1 = t.datetime.now()
+# 'rng' is the numpy Generator or seed driving the fire (firemodel.FireModel)
+def sol1(maze1, size1, graph1, src1, dest1, f1, q1, dsflag, rng=None):
+    start1 = tm.now()
     result1 = al.bibfs(graph1, src1, dest1)
     maze1[0][0] = 2  # mark starting point
     maze1[size1 - 1][size1 - 1] = 5  # mark ending point
-    nodes_on_fire = []
-    maze1[f1[0]][f1[1]] = 3
-    nodes_on_fire.append(f1)
-    result1[2].pop(0)
-    for i in range(len(result1[2])):
-        step1 = result1[2].pop(0)
+    fire = fm.FireModel(maze1, q1, [src1, dest1], rng)
+    fire.ignite(fire_starts(f1))
+    maze1[fire.burning] = 3
+    steps = iter(result1[2])  # the path is a view, its nodes are made one step at a time
+    next(steps, None)         # src
+    for step1 in steps:
         maze1[step1[0]][step1[1]] = 2
         if step1 == dest1:  # If step is equal to destination
             if dsflag:
                 vis.display_maze_onfire(maze1, size1, q1, "SOLUTION 1")
-            return True, (t.datetime.now() - start1).microseconds
-        spread_fire(graph1, nodes_on_fire, q1, src1, dest1)
-        for j in nodes_on_fire:
-            maze1[j[0]][j[1]] = 3
-        if step1 in nodes_on_fire:
+            return True, tm.now() - start1
+        fire.spread()
+        maze1[fire.burning] = 3
+        if fire.isburning(step1):
             maze1[step1[0]][step1[1]] = 4
-            nodes_on_fire.remove(step1)
             if dsflag:  # This is display flag to display mazes if required
                 vis.display_maze_onfire(maze1, size1, q1, "SOLUTION 1")
             return False, 0
+    return False, 0  # no path to dest
 
 
 # intelligent but cheater
 # Solution 2
 # Agent follows the searched path and changes path by recomputing.
 # Recomputing takes places when any of the given path node is on fire
-# 'f2' is the starting point of fire
+# 'f2' is the starting point of fire (or a list of them)
 # 'q2' is flamability
 # 'dsflag' this is display flag to diplay mazes if required
-# Using Bidirectional BFS to find the shortest path from Algorithm class
-def sol2(maze2, size2, graph2, src2, dest2, f2, q2, dsflag):
+# 'rng' is the numpy Generator or seed driving the fire (firemodel.FireModel)
+# The plan is kept by a D* Lite replanner (replanner.py) which is told about every cell catching fire and repairs
+# the previous plan instead of searching again from scratch.
+# Returns success, time taken and the number of nodes the replanner re-expanded
+def sol2(maze2, size2, graph2, src2, dest2, f2, q2, dsflag, rng=None):
     success2 = False
     totaltime2 = 0
-    start2 = t.datetime.now()  # Noting time
+    start2 = tm.now()  # Noting time
     maze2[0][0] = 2
     maze2[size2 - 1][size2 - 1] = 5
-    nodes_on_fire = []
-    maze2[f2[0]][f2[1]] = 3
-    nodes_on_fire.append(f2)
-    step2 = src2
+    fire = fm.FireModel(maze2, q2, [src2, dest2], rng)
+    fire.ignite(fire_starts(f2))
+    maze2[fire.burning] = 3
+    planner = rp.DStarLite(graph2, src2, dest2)
+    planner.block(fire.cells())
     while True:
-        result2 = al.bibfs(mz.create_graph(maze2), step2, dest2)  # calling bi-bfs to get result
-        if not result2[2]:
+        step2 = planner.next_step()  # repairs the plan with the fire seen so far
+        if step2 is None:
             break
-        step2 = result2[2].pop(1)
+        planner.move(step2)
         maze2[step2[0]][step2[1]] = 2
         if step2 == dest2:  # Checking Destination
             success2 = True
-            totaltime2 = (t.datetime.now() - start2).microseconds
+            totaltime2 = tm.now() - start2
             break
-        spread_fire(graph2, nodes_on_fire, q2, src2, dest2)
-        for i in nodes_on_fire:  # Nodes on fire
-            maze2[i[0]][i[1]] = 3
-        if step2 in nodes_on_fire:
+        newfire = fire.spread()
+        maze2[fire.burning] = 3  # Nodes on fire
+        if fire.isburning(step2):
             maze2[step2[0]][step2[1]] = 4
-            nodes_on_fire.remove(step2)
             break
+        planner.block(fm.mask_nodes(newfire))
     if dsflag:  # This is display flag to display mazes if required
         vis.display_maze_onfire(maze2, size2, q2, "SOLUTION 2")
-    return success2, totaltime2
+    return success2, totaltime2, planner.reexpansions
 
 
 # realistically intelligent
@@ -116,73 +129,109 @@ def sol2(maze2, size2, graph2, src2, dest2, f2, q2, dsflag):
 # Agent follows the searched path and senses the neighbors for fire of every node of the path to take each step
 # If the neighbor of the shortest path nodes are or fire or the path nodes are on fire it recomputes a
 # different path
-# 'f3' is the starting point of fire
+# 'f3' is the starting point of fire (or a list of them)
 # 'q3' is flamability
 # 'dsflag' this is display flag to display mazes if required
-# Using Bidirectional BFS to find the shortest path from Algorithm class
-def sol3(maze3, size3, graph3, src3, dest3, f3, q3, dsflag):
-    def feelthefire(gr, st, fire, level):  # gr =  graph, src = source, fire = nodes on fire, level = depth
-        currentnode = st
-        if currentnode in fire:
-            return True
-
-        # If reached the maximum depth, stop recursing.
-        elif level <= 0:
-            return False
-        else:
-            if currentnode not in ff:
-                for neigh in gr[st]:
-                    if neigh not in ff:
-                        ff.add(currentnode)
-                        if feelthefire(gr, neigh, fire, level - 1):
-                            return True
-        return False
-
-    start3 = t.datetime.now()
+# 'rng' is the numpy Generator or seed driving the fire (firemodel.FireModel)
+# Like sol2 the plan is kept by the D* Lite replanner, which only learns about the fire when it is sensed.
+# The fire is sensed when a burning cell is within 'radius' steps of the agent, read from the distance to the fire
+# kept by the fire model (FireModel.track_distance), so sensing costs the same however much of the maze burns.
+# Returns success, time taken and the number of nodes the replanner re-expanded
+def sol3(maze3, size3, graph3, src3, dest3, f3, q3, dsflag, rng=None, radius=3):
+    start3 = tm.now()
     success3 = False
     totaltime3 = 0
-    result3 = al.bibfs(graph3, src3, dest3)
     maze3[0][0] = 2  # mark starting point
     maze3[size3 - 1][size3 - 1] = 5  # mark ending point
-    nodes_on_fire = []
-    maze3[f3[0]][f3[1]] = 3
-    nodes_on_fire.append(f3)
+    fire = fm.FireModel(maze3, q3, [src3, dest3], rng)
+    fire.ignite(fire_starts(f3))
+    fire.track_distance(radius)
+    maze3[fire.burning] = 3
+    planner = rp.DStarLite(graph3, src3, dest3)
+    unseen = fire_starts(f3)  # cells on fire the planner has not been told about yet
     prevnode = src3
     while True:
-        step3 = result3[2].pop(1)
+        if fire.near_fire(prevnode):  # CHeck if there is fire
+            planner.block(unseen)  # the plan is only repaired once the fire is sensed
+            unseen = []
+        step3 = planner.next_step()
+        if step3 is None:
+            break
+        planner.move(step3)
+        maze3[step3[0]][step3[1]] = 2
         if step3 == dest3:
-            maze3[step3[0]][step3[1]] = 2
             success3 = True
-            totaltime3 = (t.datetime.now() - start3).microseconds
+            totaltime3 = tm.now() - start3
             break
-        ff = set([])
-        check = feelthefire(graph3, prevnode, nodes_on_fire, 3)  # CHeck if there is fire
-        if check:
-            result3 = al.bibfs(mz.create_graph(maze3), prevnode, dest3)
-            if not result3[2]:
-                break
-            step3 = result3[2].pop(1)
         prevnode = step3
-        maze3[step3[0]][step3[1]] = 2
-        spread_fire(graph3, nodes_on_fire, q3, src3, dest3)  # Spread fire calling
-        for i in nodes_on_fire:
-            maze3[i[0]][i[1]] = 3
-        if step3 in nodes_on_fire:
+        newfire = fire.spread()  # Spread fire calling
+        maze3[fire.burning] = 3
+        if fire.isburning(step3):
             maze3[step3[0]][step3[1]] = 4
             break
+        unseen.extend(fm.mask_nodes(newfire))
 
     if dsflag:
         vis.display_maze_onfire(maze3, size3, q3, "SOLUTION 3")
-    return success3, totaltime3
+    return success3, totaltime3, planner.reexpansions
+
+
+# fire aware
+# Solution 4
+# The fire arrival time (ETA) of every cell is estimated once for the episode (fireplanner.py), then one A* plans a
+# path which never enters a cell the fire is expected to reach before the agent is gone, and keeps its distance from
+# the fire front when that costs little. The agent follows the path without replanning, as in sol1, and takes the
+# shortest path when every path meets the fire.
+# 'f4' is the starting point of fire (or a list of them)
+# 'q4' is flamability
+# 'dsflag' this is display flag to display mazes if required
+# 'rng' is the numpy Generator or seed driving the fire (firemodel.FireModel)
+# 'eta' is "analytic" or "montecarlo", the simulated fires of the latter are drawn from 'simrng'
+def sol4(maze4, size4, graph4, src4, dest4, f4, q4, dsflag, rng=None, eta="analytic", simrng=None):
+    start4 = tm.now()
+    maze4[0][0] = 2  # mark starting point
+    maze4[size4 - 1][size4 - 1] = 5  # mark ending point
+    fire = fm.FireModel(maze4, q4, [src4, dest4], rng)
+    fire.ignite(fire_starts(f4))
+    maze4[fire.burning] = 3
+    if eta == "montecarlo":
+        field = fp.montecarlo_eta(maze4, fire.cells(), q4, [src4, dest4], rng=simrng)
+    else:
+        field = fp.analytic_eta(maze4, fire.cells(), q4, [src4, dest4])
+    path = fp.plan(graph4, src4, dest4, field)
+    if path is None:  # no path keeps clear of the fire
+        path = al.bibfs(graph4, src4, dest4)[2]
+    steps = iter(path)
+    next(steps, None)  # src
+    for step4 in steps:
+        maze4[step4[0]][step4[1]] = 2
+        if step4 == dest4:
+            if dsflag:
+                vis.display_maze_onfire(maze4, size4, q4, "SOLUTION 4")
+            return True, tm.now() - start4
+        fire.spread()
+        maze4[fire.burning] = 3
+        if fire.isburning(step4):
+            maze4[step4[0]][step4[1]] = 4
+            if dsflag:
+                vis.display_maze_onfire(maze4, size4, q4, "SOLUTION 4")
+            return False, 0
+    return False, 0  # no path to dest
 
 
 # Generating Total time taken and Success Rate for flame probability
-def generate_result():
+# seed is the master seed (seeding.py): the maze and fire start of an iteration come from stream
+# (run, flamability index, iteration) and its fire from that key followed by 1, so the four solutions face the same
+# fire and a run is replayed by passing the same seed
+# 'corpus' (mazecorpus.MazeCorpus) gives the mazes instead: its solvable mazes of size 70 are taken in order, run
+# 'inter' starting at the (10 * inter)th, and the fire start is drawn from the iteration's stream
+def generate_result(seed=None, corpus=None):
     resultstore = {}
-    timelist = ["Totaltimetaken_Sol_1", "Totaltimetaken_Sol_2", "Totaltimetaken_Sol_3"]
+    timelist = ["Totaltimetaken_Sol_1", "Totaltimetaken_Sol_2", "Totaltimetaken_Sol_3", "Totaltimetaken_Sol_4"]
     timetitle = "Flamability vs Average Time Taken"
     succestitle = "Flamability vs Average Number of Success"
-    successratelist = ["TotalSuccessRate_Sol_1", "TotalSuccessRate_Sol_2", "TotalSuccessRate_Sol_3"]
+    successratelist = ["TotalSuccessRate_Sol_1", "TotalSuccessRate_Sol_2", "TotalSuccessRate_Sol_3",
+                       "TotalSuccessRate_Sol_4"]
     for inter in range(0, 2):
         flamabilityList = [0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.5]
         s = 70  # Selected Maze size
@@ -190,37 +239,55 @@ def generate_result():
         des = (s - 1, s - 1)
         print("Moving............")
         result = {}
-        for q in flamabilityList:
-            successcount1, successcount2, successcount3 = 0, 0, 0
-            timetakenS1, timetakenS2, timetakenS3 = [], [], []
+        records = None if corpus is None else corpus.take(s, 0.3, solvable=True)
+        for qindex, q in enumerate(flamabilityList):
+            successcount1, successcount2, successcount3, successcount4 = 0, 0, 0, 0
+            timetakenS1, timetakenS2, timetakenS3, timetakenS4 = [], [], [], []
             counter = 0
+            rejected = 0  # unsolvable mazes thrown away before building a graph
+            position = 10 * inter  # next corpus maze
             while counter < 10:  # Total 10 iterations
-                m1 = mz.create_maze(s, 0.3)  # Create maze function
-                gr1 = mz.create_graph(m1)  # Then create graph
+                mazerng = sd.generator(seed, inter, qindex, counter)
+                if corpus is None:
+                    m1, r = mz.sample_solvable_maze(s, 0.3, mazerng)  # Create a maze with a path from start to goal
+                    rejected += r
+                else:
+                    m1 = corpus[records[position % len(records)]]
+                    position += 1
+                gr1 = mz.create_gridgraph(m1)  # Then create graph
                 m2 = m1.copy()  # maze
                 gr2 = gr1.copy()  # graph
                 m3 = m1.copy()  # maze
                 gr3 = gr1.copy()  # graph
-                fireStart = let_there_be_fire(gr1, sr, des)  # initializes fire
-                if al.bibfs(gr1, sr, des)[0] == 'S' and fireStart is not None:
+                m4 = m1.copy()  # maze
+                gr4 = gr1.copy()  # graph
+                fireStart = let_there_be_fire(gr1, sr, des, rng=mazerng)  # initializes fire
+                if fireStart is not None:
+                    firekey = (seed, inter, qindex, counter, 1)
 
                     # Solution 1
-                    rs1 = sol1(m1, s, gr1, sr, des, fireStart, q, False)  # m1 and gr1 used
+                    rs1 = sol1(m1, s, gr1, sr, des, fireStart, q, False, sd.generator(*firekey))  # m1 and gr1 used
                     if rs1[0]:
                         successcount1 += 1
                         timetakenS1.append(rs1[1])
 
                     # Solution 2
-                    rs2 = sol2(m2, s, gr2, sr, des, fireStart, q, False)  # m2 and gr2 used
+                    rs2 = sol2(m2, s, gr2, sr, des, fireStart, q, False, sd.generator(*firekey))  # m2 and gr2 used
                     if rs2[0]:
                         successcount2 += 1
                         timetakenS2.append(rs2[1])
 
                     # Solution 3
-                    rs3 = sol3(m3, s, gr3, sr, des, fireStart, q, False)  # m3 and gr3 used
+                    rs3 = sol3(m3, s, gr3, sr, des, fireStart, q, False, sd.generator(*firekey))  # m3 and gr3 used
                     if rs3[0]:
                         successcount3 += 1
                         timetakenS3.append(rs3[1])
+
+                    # Solution 4
+                    rs4 = sol4(m4, s, gr4, sr, des, fireStart, q, False, sd.generator(*firekey))  # m4 and gr4 used
+                    if rs4[0]:
+                        successcount4 += 1
+                        timetakenS4.append(rs4[1])
                     counter += 1
 
             result[q] = {"TotalSuccessRate_Sol_1": successcount1,
@@ -228,50 +295,61 @@ def generate_result():
                          "TotalSuccessRate_Sol_2": successcount2,
                          "Totaltimetaken_Sol_2": st.mean(timetakenS2) if len(timetakenS2) > 0 else 0,
                          "TotalSuccessRate_Sol_3": successcount3,
-                         "Totaltimetaken_Sol_3": st.mean(timetakenS3) if len(timetakenS3) > 0 else 0}
+                         "Totaltimetaken_Sol_3": st.mean(timetakenS3) if len(timetakenS3) > 0 else 0,
+                         "TotalSuccessRate_Sol_4": successcount4,
+                         "Totaltimetaken_Sol_4": st.mean(timetakenS4) if len(timetakenS4) > 0 else 0}
+            print("Flamability " + str(q) + " rejection rate " + str(rejected / (rejected + counter)))
 
         # Flamability vs Average Number of Success
         vis.disp_graph_maze_onfire(result, flamabilityList, "Flamability", "Number of Success", succestitle,
                                    successratelist)
         # Flamability vs Average Time Taken
-        vis.disp_graph_maze_onfire(result, flamabilityList, "Flamability", "Time Taken (micro sec)", timetitle,
+        vis.disp_graph_maze_onfire(result, flamabilityList, "Flamability", "Time Taken (ns)", timetitle,
                                    timelist)
 
 
 # Generating sample mazes for specific flamability and sizes
-def generate_sample():
+# seed is the master seed, None draws a new sample each run
+def generate_sample(seed=None):
     flamability = 0.3
     s = 10  # Selected Maze size
     sr = (0, 0)
     des = (s - 1, s - 1)
     num = 0
+    mazerng = sd.generator(seed, 0)
     while num != 1:
-        m1 = mz.create_maze(s, 0.3)  # Create maze function
-        gr1 = mz.create_graph(m1)  # Then create graph
+        m1 = mz.sample_solvable_maze(s, 0.3, mazerng)[0]  # Create a maze with a path from start to goal
+        gr1 = mz.create_gridgraph(m1)  # Then create graph
         m2 = m1.copy()  # maze
         gr2 = gr1.copy()  # graph
         m3 = m1.copy()  # maze
         gr3 = gr1.copy()  # graph
-        fire_St = let_there_be_fire(gr1, sr, des)  # initializes fire
-        if al.bibfs(gr1, sr, des)[0] == 'S' and fire_St is not None:
+        m4 = m1.copy()  # maze
+        gr4 = gr1.copy()  # graph
+        fire_St = let_there_be_fire(gr1, sr, des, rng=mazerng)  # initializes fire
+        if fire_St is not None:
             # Solution 1
-            sol1(m1, s, gr1, sr, des, fire_St, flamability, True)  # m1 and gr1 used
+            sol1(m1, s, gr1, sr, des, fire_St, flamability, True, sd.generator(seed, 1))  # m1 and gr1 used
 
             # Solution 2
-            sol2(m2, s, gr2, sr, des, fire_St, flamability, True)  # m2 and gr2 used
+            sol2(m2, s, gr2, sr, des, fire_St, flamability, True, sd.generator(seed, 1))  # m2 and gr2 used
 
             # Solution 3
-            sol3(m3, s, gr3, sr, des, fire_St, flamability, True)  # m3 and gr3 used
+            sol3(m3, s, gr3, sr, des, fire_St, flamability, True, sd.generator(seed, 1))  # m3 and gr3 used
+
+            # Solution 4
+            sol4(m4, s, gr4, sr, des, fire_St, flamability, True, sd.generator(seed, 1))  # m4 and gr4 used
             num = 1
 
     # Show maze
     plt.show()
 
 
-# generate_result()
-# generate_result()
+if __name__ == '__main__':
+    # generate_result()
+    # generate_result()
 
-# Generating samples
-generate_sample()
+    # Generating samples
+    generate_sample()
 
-plt.show()
+    plt.show()
@@ -0,0 +1,52 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))  # the modules of Project1
+os.environ.setdefault("MPLBACKEND", "Agg")  # the modules under test import pyplot, never open a figure
+
+import numpy as np
+import pytest
+import createmaze as mz
+import algorithm as al
+import gridgraph as gg
+
+# Fixtures and helpers of the tests (python -m pytest -q from Project1)
+# The mazes are drawn from fixed seeds, every search is checked against the shortest path length given by bfs.
+
+SIZES = (8, 15, 30)
+DENSITIES = (0.1, 0.3)
+
+
+# src and dest of a maze, the top left and bottom right corners
+def corners(maze):
+    return (0, 0), (len(maze) - 1, len(maze) - 1)
+
+
+# Solvable mazes as (maze, graph, shortest path length in nodes), corners to corners
+@pytest.fixture(scope="session")
+def mazes():
+    cases = []
+    for size in SIZES:
+        for dindex, density in enumerate(DENSITIES):
+            np.random.seed(size * 100 + dindex)
+            found = []
+            while len(found) < 3:
+                maze = np.asarray(mz.create_maze(size, density)).reshape(size, size)
+                graph = mz.create_gridgraph(maze)
+                result = al.bfs(graph, *corners(maze))
+                if result[0] == "S":
+                    found.append((maze, graph, len(result[2])))
+            cases += found
+    return cases
+
+
+# Asserts that 'path' goes from src to dest over open cells, one 4-connected step at a time
+@pytest.fixture(scope="session")
+def check_path():
+    def check(maze, path, src, dest):
+        path = list(path)
+        assert path[0] == src and path[-1] == dest
+        opened = gg.open_cells(maze)
+        for (i, j), (k, l) in zip(path, path[1:]):
+            assert abs(i - k) + abs(j - l) == 1
+            assert opened[k, l]
+    return check
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+import algorithm as al
+import batchsearch as bs
+import createmaze as mz
+
+
+# Every maze of the batch gets the success and path length of a BFS over it alone, solvable or not
+@pytest.mark.parametrize("search", [bs.batch_bfs, bs.batch_astar])
+@pytest.mark.parametrize("size, density", [(10, 0.2), (20, 0.3), (25, 0.35)])
+def test_matches_bfs(search, size, density):
+    mazes = mz.create_mazes(40, size, density, size)
+    success, pathlength, expansions, timetaken = search(mazes)
+    for k, maze in enumerate(mazes):
+        result = al.bfs(mz.create_gridgraph(maze), (0, 0), (size - 1, size - 1))
+        assert success[k] == (result[0] == "S")
+        assert pathlength[k] == (len(result[2]) if success[k] else 0)
+    assert (expansions[success] > 0).all()
+
+
+# A* never expands more cells than the BFS wavefront
+def test_astar_expands_less():
+    mazes = mz.create_mazes(30, 30, 0.2, 1)
+    bfsexpansions = bs.batch_bfs(mazes)[2]
+    astarexpansions = bs.batch_astar(mazes)[2]
+    assert (astarexpansions <= bfsexpansions).all()
+
+
+def test_other_endpoints():
+    mazes = mz.create_mazes(10, 12, 0.25, 3)
+    mazes[:, 2, 3] = 0
+    mazes[:, 9, 1] = 0
+    success, pathlength = bs.batch_astar(mazes, (2, 3), (9, 1))[:2]
+    for k, maze in enumerate(mazes):
+        result = al.bfs(mz.create_gridgraph(maze), (2, 3), (9, 1))
+        assert pathlength[k] == (len(result[2]) if result[0] == "S" else 0)
+    assert np.array_equal(success, pathlength > 0)
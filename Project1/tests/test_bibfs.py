@@ -0,0 +1,18 @@
+import algorithm as al
+import createmaze as mz
+from conftest import corners
+
+
+# Bidirectional BFS returns a shortest path, also from a node to itself and when dest is walled off
+def test_bibfs(mazes, check_path):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        for target in (graph, mz.create_graph(maze)):
+            result = al.bibfs(target, src, dest)
+            assert result[0] == "S"
+            check_path(maze, result[2], src, dest)
+            assert len(result[2]) == length
+        assert list(al.bibfs(graph, src, src)[2]) == [src]
+        walled = graph.copy()
+        walled.block([node for node in graph[dest]])
+        assert al.bibfs(walled, src, dest)[0] == "F"
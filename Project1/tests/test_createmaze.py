@@ -0,0 +1,71 @@
+from collections import deque
+import numpy as np
+import pytest
+import algorithm as al
+import createmaze as mz
+
+
+# Components of the open cells by flood fill over a dict graph, a list of sets of nodes
+def flood_components(graph):
+    seen, components = set(), []
+    for start in graph.keys():
+        if start in seen:
+            continue
+        component, queue = {start}, deque([start])
+        while queue:
+            for neighbour in graph[queue.popleft()]:
+                if neighbour not in component:
+                    component.add(neighbour)
+                    queue.append(neighbour)
+        seen |= component
+        components.append(component)
+    return components
+
+
+# Cells share a label exactly when they are connected, blocked cells are -1
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_labels_are_the_components(diagonal):
+    for seed in range(12):
+        maze = mz.create_maze(12, 0.2 + 0.04 * seed, seed)
+        labels = mz.label_maze(maze, diagonal)
+        graph = mz.create_relaxedgraph(maze) if diagonal else mz.create_graph(maze)
+        components = flood_components(graph)
+        assert sum(len(component) for component in components) == np.count_nonzero(labels >= 0)
+        seen = set()
+        for component in components:
+            values = {int(labels[node]) for node in component}
+            assert len(values) == 1 and not values & seen
+            seen |= values
+
+
+# A batch is labelled like its mazes one by one (labels are flat indices over the batch)
+def test_batch_labels():
+    mazes = mz.create_mazes(6, 10, 0.35, 1)
+    labels = mz.label_maze(mazes)
+    for k, maze in enumerate(mazes):
+        alone = mz.label_maze(maze)
+        assert np.array_equal(labels[k], np.where(alone >= 0, alone + k * maze.size, -1))
+
+
+def test_is_solvable_agrees_with_bfs():
+    mazes = mz.create_mazes(60, 12, 0.35, 2)
+    batch = mz.is_solvable(mazes)
+    assert 0 < batch.sum() < len(mazes)
+    for k, maze in enumerate(mazes):
+        solvable = al.bfs(mz.create_gridgraph(maze), (0, 0), (11, 11))[0] == "S"
+        assert bool(mz.is_solvable(maze)) == bool(batch[k]) == solvable
+        assert bool(mz.is_solvable(maze, (0, 11), (11, 0))) == (
+            al.bfs(mz.create_gridgraph(maze), (0, 11), (11, 0))[0] == "S")
+
+
+# Sampled mazes are all solvable and a seed gives the same mazes again
+def test_sample_solvable_mazes():
+    mazes, rejection = mz.sample_solvable_mazes(25, 15, 0.35, 3)
+    assert mazes.shape == (25, 15, 15) and mz.is_solvable(mazes).all()
+    assert 0 <= rejection < 1
+    again = mz.sample_solvable_mazes(25, 15, 0.35, 3)
+    assert np.array_equal(mazes, again[0]) and rejection == again[1]
+    maze, rejected = mz.sample_solvable_maze(15, 0.35, 4)
+    assert mz.is_solvable(maze)
+    again = mz.sample_solvable_maze(15, 0.35, 4)
+    assert np.array_equal(maze, again[0]) and rejected == again[1]
@@ -0,0 +1,17 @@
+import pytest
+import algorithm as al
+from conftest import corners
+
+
+# Iterative deepening, blind (iddfs) or with the manhattan estimate (idastar), returns a shortest path
+@pytest.mark.parametrize("search", [al.iddfs, al.idastar])
+def test_deepening(mazes, check_path, search):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        result = search(graph, src, dest)
+        assert result[0] == "S"
+        check_path(maze, result[2], src, dest)
+        assert len(result[2]) == length
+        walled = graph.copy()
+        walled.block([node for node in graph[dest]])
+        assert search(walled, src, dest)[0] == "F"
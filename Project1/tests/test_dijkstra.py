@@ -0,0 +1,37 @@
+import numpy as np
+import algorithm as al
+import createmaze as mz
+from conftest import corners
+
+
+# Unit costs, given or not, give a shortest path over either kind of graph
+def test_dijkstra_unit_cost(mazes, check_path):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        for result in (al.dijkstra(graph, src, dest), al.dijkstra(mz.create_graph(maze), src, dest),
+                       al.dijkstra(graph, src, dest, cost=np.ones(maze.shape)),
+                       al.dijkstra(graph, src, dest, cost=lambda a, b: 1)):
+            assert result[0] == "S"
+            check_path(maze, result[2], src, dest)
+            assert len(result[2]) == length
+
+
+# With a per cell cost the path cost is the one of Bellman-Ford relaxation over the maze
+def test_dijkstra_cell_cost(mazes):
+    rng = np.random.default_rng(0)
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        cost = rng.integers(1, 5, maze.shape).astype(float)
+        path = al.dijkstra(graph, src, dest, cost=cost)[2]
+        best = {node: np.inf for node in graph.keys()}
+        best[src] = 0
+        for _ in range(len(best)):
+            changed = False
+            for node in best:
+                for neighbour in graph[node]:
+                    if best[node] + cost[neighbour] < best[neighbour]:
+                        best[neighbour] = best[node] + cost[neighbour]
+                        changed = True
+            if not changed:
+                break
+        assert sum(cost[node] for node in list(path)[1:]) == best[dest]
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+import algorithm as al
+import createmaze as mz
+import distancefield as df
+import gridgraph as gg
+
+
+# BFS distances from src shaped like the maze, -1 where src cannot be reached
+def bfs_field(graph, src):
+    dist, ig = al.bfs_distances(graph, src)
+    field = np.full(graph.shape, -1)
+    for idx, d in enumerate(dist):
+        field[ig.coord(idx)] = d
+    return field
+
+
+# One source gives the BFS distances, many sources the smallest of their distances
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_distance_field_is_bfs(mazes, diagonal):
+    for maze, _, _ in mazes:
+        graph = gg.GridGraph(maze, diagonal)
+        sources = graph.keys()[::max(1, len(graph) // 3)][:3]
+        fields = [bfs_field(graph, source) for source in sources]
+        assert np.array_equal(df.distance_field(graph, sources[0])[0], fields[0])
+        stacked = np.stack(fields).astype(float)
+        stacked[stacked < 0] = np.inf
+        nearest = stacked.min(axis=0)
+        assert np.array_equal(df.distance_field(graph, sources)[0], np.where(np.isinf(nearest), -1, nearest))
+
+
+# distance_fields gives one BFS field per source
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_distance_fields(mazes, diagonal):
+    for maze, _, _ in mazes:
+        graph = gg.GridGraph(maze, diagonal)
+        sources = graph.keys()[::max(1, len(graph) // 5)]
+        fields = df.distance_fields(maze, sources, diagonal)
+        assert fields.shape == (len(sources),) + graph.shape and fields.dtype == np.int32
+        for source, field in zip(sources, fields):
+            assert np.array_equal(field, bfs_field(graph, source))
+
+
+# A blocked source reaches nothing
+def test_blocked_source():
+    maze = mz.create_maze(6, 0, 0)
+    maze[2, 2] = 1
+    assert (df.distance_fields(maze, [(2, 2), (0, 0)])[0] == -1).all()
+    assert (df.distance_field(maze, [(2, 2)])[0] == -1).all()
+
+
+# field_path walks from the nearest source to the node in dist + 1 valid steps, None when unreachable
+def test_field_path(mazes, check_path):
+    for maze, graph, _ in mazes:
+        sources = [(0, 0), (len(maze) - 1, 0)]
+        dist, pred = df.distance_field(maze, [node for node in sources if graph.isopen(node)])
+        for node in graph.keys()[::7]:
+            path = df.field_path(dist, pred, node)
+            if dist[node] < 0:
+                assert path is None
+                continue
+            check_path(maze, path, path[0], node)
+            assert path[0] in sources and len(path) == dist[node] + 1
+        walled = maze.copy()
+        walled[0, 1] = walled[1, 0] = 1
+        dist, pred = df.distance_field(walled, [(0, 0)])
+        assert df.field_path(dist, pred, (len(maze) - 1, len(maze) - 1)) is None
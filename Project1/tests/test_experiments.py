@@ -0,0 +1,47 @@
+import pytest
+import experiments as ex
+import mazecorpus as mc
+
+
+# Runs a few trials of 12x12 mazes into 'path'
+def run(path, mazes, corpus=None):
+    ex.run_experiment(path, mazes=mazes, flamabilities=(0.2,), strategies=(1, 2), size=12, density=0.2, workers=2,
+                      corpus=corpus)
+
+
+# A results file resumes with the corpus it was started with and no other
+def test_resume_with_corpus(tmp_path):
+    mc.build_corpus(str(tmp_path / "mazes.corpus"), [12], [0.2], 8, seed=1)
+    corpus = mc.MazeCorpus(str(tmp_path / "mazes.corpus"))
+    path = str(tmp_path / "results.csv")
+    run(path, 1, corpus)
+    run(path, 2, corpus)
+    results = ex.load_results(path)
+    assert sorted(results["trial"]) == [0, 1, 2, 3]
+    assert set(results["corpus"]) == {corpus.path}
+    with pytest.raises(ValueError):
+        run(path, 3)
+
+
+# Files without the corpus column are read, but not resumed
+def test_older_layout(tmp_path):
+    path = tmp_path / "old.csv"
+    path.write_text("trial,maze,flamability,strategy,seed,size,density,success,time,reexpansions\n"
+                    "0,0,0.2,1,0,12,0.2,1,5,0\n")
+    results = ex.load_results(str(path))
+    assert len(results) == 1 and results["corpus"][0] == ""
+    with pytest.raises(ValueError):
+        ex.completed_trials(str(path))
+
+
+# Other strategies renumber the trials: resuming would skip trials never run, so the file is refused
+def test_resume_with_other_trials(tmp_path):
+    path = str(tmp_path / "results.csv")
+    run(path, 2)
+    with pytest.raises(ValueError):
+        ex.run_experiment(path, mazes=2, flamabilities=(0.2,), strategies=(1, 2, 3), size=12, density=0.2, workers=2)
+    with pytest.raises(ValueError):
+        run(path, 1)
+    with pytest.raises(ValueError):
+        ex.completed_trials(path, trials=ex.make_trials(1, 2, (0.2,), (1, 2), 12, 0.2))
+    assert ex.completed_trials(path, trials=ex.make_trials(0, 3, (0.2,), (1, 2), 12, 0.2)) == {0, 1, 2, 3}
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+import createmaze as mz
+import distancefield as df
+import firemodel as fm
+import solutions as so
+from conftest import corners
+
+
+# One tick of the per cell rule solutions.spread_fire used, over a dict graph: every node not on fire and not protected
+# catches fire with probability 1 - (1 - q)^k, k its neighbours on fire. 'draw' decides a node from its probability.
+def old_spread(graph, onfire, q, protected, draw):
+    caught = []
+    for node in graph.keys():
+        if node not in onfire and node not in protected:
+            burning = sum(1 for neighbour in graph.get(node) if neighbour in onfire)
+            if burning > 0 and draw(1 - ((1 - q) ** burning)):
+                caught.append(node)
+    return onfire | set(caught)
+
+
+# The same seed gives the same fire, tick after tick
+def test_spread_is_reproducible(mazes):
+    for k, (maze, graph, _) in enumerate(mazes):
+        models = [fm.FireModel(maze, 0.3, [(0, 0)], k) for _ in range(2)]
+        for model in models:
+            model.ignite([graph.keys()[len(graph) // 2]])
+        for tick in range(10):
+            assert np.array_equal(models[0].spread(), models[1].spread())
+            assert np.array_equal(models[0].burning, models[1].burning)
+
+
+# At q = 0 and q = 1 the old rule is deterministic (probability 0, or 1 with a burning neighbour): the model spreads
+# exactly like it, and the probabilities it samples from are the old ones for every q
+@pytest.mark.parametrize("q", [0.0, 1.0])
+def test_spread_matches_old_rule(mazes, q):
+    for maze, graph, _ in mazes:
+        src, dest = corners(maze)
+        start = graph.keys()[len(graph) // 2]
+        model = fm.FireModel(maze, q, [src, dest], 0)
+        model.ignite([start])
+        dictgraph = mz.create_graph(maze)
+        onfire = {start}
+        for tick in range(8):
+            model.spread()
+            onfire = old_spread(dictgraph, onfire, q, (src, dest), lambda prob: prob >= 1)
+            assert set(model.cells()) == onfire
+
+
+def test_spread_probabilities():
+    for q in (0.0, 0.15, 0.5, 1.0):
+        model = fm.FireModel(np.zeros((3, 3), dtype=np.uint8), q)
+        assert np.allclose(model.probability, [1 - (1 - q) ** k for k in range(5)])
+
+
+# Distance to the fire computed from scratch, capped like FireModel.distance
+def expected_distance(model, radius):
+    dist = df.distance_field(np.where(model.open, 0, 1), fm.mask_nodes(model.burning))[0].reshape(-1)
+    return np.where((dist < 0) | (dist > radius), radius + 1, dist)
+
+
+# The incremental distance grid matches a distance field from every burning cell after each tick
+@pytest.mark.parametrize("radius", [1, 3, 6])
+def test_track_distance_matches_distance_field(radius):
+    for seed in range(4):
+        maze = mz.sample_solvable_maze(25, 0.25, seed)[0]
+        graph = mz.create_gridgraph(maze)
+        model = fm.FireModel(maze, 0.3, [(0, 0), (24, 24)], seed)
+        model.ignite(so.let_there_be_fires(graph, (0, 0), (24, 24), 2, rng=seed))
+        model.track_distance(radius)
+        assert np.array_equal(model.distance, expected_distance(model, radius))
+        for tick in range(15):
+            model.spread()
+            assert np.array_equal(model.distance, expected_distance(model, radius))
+
+
+# Cells ignited by hand after tracking started are taken into account, and near_fire reads the grid
+def test_ignite_and_near_fire():
+    maze = mz.create_maze(12, 0, 0)
+    model = fm.FireModel(maze, 0.0)
+    model.track_distance(2)
+    assert model.distance_to_fire((5, 5)) == 3 and not model.near_fire((5, 5))
+    model.ignite([(5, 7)])
+    assert model.distance_to_fire((5, 5)) == 2 and model.near_fire((5, 5))
+    assert model.distance_to_fire((5, 7)) == 0
+    assert np.array_equal(model.distance, expected_distance(model, 2))
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+import createmaze as mz
+import fireplanner as fp
+from conftest import corners
+
+
+def test_analytic_eta():
+    maze = mz.create_maze(6, 0, 0)
+    maze[2, :5] = 1
+    eta = fp.analytic_eta(maze, [(0, 0)], 0.5)
+    assert eta[0, 0] == 0 and eta[0, 3] == 6 and eta[3, 0] == 2 * 13
+    assert eta[2, 0] == np.inf  # blockage
+    still = fp.analytic_eta(maze, [(0, 0)], 0)
+    assert still[0, 0] == 0 and np.isinf(still[0, 1])
+
+
+# Earliest arrival at dest over the cells the agent may enter at that time (None if dest cannot be reached)
+# Arriving earlier is never worse, so a BFS keeping the first arrival at every cell decides whether a path exists
+def earliest_arrival(graph, src, dest, eta, margin):
+    arrival = {src: 0}
+    frontier = [src]
+    while frontier:
+        following = []
+        for node in frontier:
+            for neighbour in graph[node]:
+                t = arrival[node] + 1
+                if neighbour not in arrival and eta[neighbour] - t > margin:
+                    arrival[neighbour] = t
+                    following.append(neighbour)
+        frontier = following
+    return arrival.get(dest)
+
+
+# The plan exists exactly when a path keeping ahead of the fire does, and keeps ahead of it at every step
+@pytest.mark.parametrize("weight", [0.0, 2.0, 20.0])
+def test_plan_keeps_ahead_of_the_fire(weight):
+    rng = np.random.default_rng(1)
+    found = 0
+    for k in range(150):
+        size = 8
+        maze = mz.create_maze(size, 0.2, rng)
+        maze[0, 0] = maze[size - 1, size - 1] = 0
+        graph = mz.create_gridgraph(maze)
+        src, dest = (0, 0), (size - 1, size - 1)
+        eta = np.where(rng.random(maze.shape) < 0.5, rng.integers(2, 20, maze.shape), np.inf)
+        eta[src] = np.inf
+        path = fp.plan(graph, src, dest, eta, margin=1, weight=weight)
+        if earliest_arrival(graph, src, dest, eta, 1) is None:
+            assert path is None
+            continue
+        found += 1
+        assert path is not None and path[0] == src and path[-1] == dest
+        for t, (a, b) in enumerate(zip(path, path[1:]), 1):
+            assert b in graph[a] and eta[b] - t > 1
+    assert found > 10
+
+
+# (0, 2) is reached cheaply at t = 4 around the bottom row, or dearly at t = 2 past the fire at (0, 1), and only the
+# early arrival gets through (0, 3) before it burns: the search must not settle for the first arrival it expands
+def test_plan_takes_the_early_arrival():
+    maze = np.zeros((2, 5), dtype=np.uint8)
+    maze[1, 3:] = 1
+    eta = np.full(maze.shape, np.inf)
+    eta[0, 1], eta[0, 3] = 3, 5
+    path = fp.plan(mz.create_gridgraph(maze), (0, 0), (0, 4), eta, margin=1, weight=20.0)
+    assert path == [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4)]
+
+
+# Without fire the plan is a shortest path
+def test_plan_without_fire(mazes):
+    for maze, graph, length in mazes:
+        assert len(fp.plan(graph, *corners(maze), eta=np.full(maze.shape, np.inf))) == length
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+import createmaze as mz
+import gridgraph as gg
+
+
+# The CSR arrays hold the same neighbours as neighbour_indices, cell by cell and in the same order
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_csr_matches_neighbour_indices(mazes, diagonal):
+    for maze, _, _ in mazes:
+        graph = gg.GridGraph(maze, diagonal)
+        indptr, indices = graph.csr()
+        assert len(indptr) == graph.num_cells + 1
+        for idx in range(graph.num_cells):
+            assert indices[indptr[idx]:indptr[idx + 1]].tolist() == graph.neighbour_indices(idx)
+
+
+# The dict interface gives the neighbours of create_graph and create_relaxedgraph
+def test_same_neighbours_as_dict_graphs(mazes):
+    for maze, graph, _ in mazes:
+        for gridgraph, dictgraph in ((graph, mz.create_graph(maze)),
+                                     (gg.GridGraph(maze, diagonal=True), mz.create_relaxedgraph(maze))):
+            assert sorted(gridgraph.keys()) == sorted(dictgraph.keys())
+            for node in dictgraph:
+                assert sorted(gridgraph[node]) == sorted(dictgraph[node])
+
+
+# Blocking cells of a copy leaves the original as it was
+def test_copy_is_independent(mazes):
+    graph = mazes[-1][1]
+    opened, bits, bitbytes, version = graph.open.copy(), graph.bits.copy(), graph._bitbytes, graph.version
+    other = graph.copy()
+    cells = graph.keys()[1:4]
+    other.block(cells)
+    assert not any(other.isopen(node) for node in cells)
+    assert np.array_equal(graph.open, opened) and np.array_equal(graph.bits, bits)
+    assert graph._bitbytes == bitbytes and graph.version == version
+    assert all(graph.isopen(node) for node in cells)
+    other.unblock(cells)
+    assert np.array_equal(other.bits, graph.bits) and other.version == version + 2
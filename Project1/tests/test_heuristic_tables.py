@@ -0,0 +1,55 @@
+import numpy as np
+import algorithm as al
+import createmaze as mz
+import gridgraph as gg
+import maze_thinning as mt
+from conftest import corners
+
+
+# The thinned and relaxed mazes give admissible heuristics, so both searches return a shortest path
+def test_heuristic_searches_are_shortest(mazes, check_path):
+    for k, (maze, graph, length) in enumerate(mazes):
+        src, dest = corners(maze)
+        np.random.seed(k)
+        thinned = mz.create_gridgraph(mz.maze_thinning(0.5, maze.copy()))
+        for result in (mt.astarthinning(thinned, graph, src, dest),
+                       mt.astardiagonal(gg.GridGraph(maze, diagonal=True), graph, src, dest),
+                       mt.astardiagonal(mz.create_relaxedgraph(maze), mz.create_graph(maze), src, dest)):
+            assert result[0] == "S"
+            check_path(maze, result[2], src, dest)
+            assert len(result[2]) == length
+
+
+# A cached table is used again for the same graph and dest, and rebuilt once the graph changed
+def test_heuristic_cache(mazes):
+    mt.clear_heuristic_cache()
+    maze, graph = mazes[-1][0], mazes[-1][1].copy()
+    src, dest = corners(maze)
+    table = mt.heuristic_table(graph, dest)
+    assert mt.heuristic_table(graph, dest) is table
+    graph.block([graph.keys()[len(graph) // 2]])
+    rebuilt = mt.heuristic_table(graph, dest)
+    assert rebuilt is not table
+    dist, ig = al.bfs_distances(graph, dest)
+    expected = np.zeros(graph.shape, dtype=int)
+    for idx, d in enumerate(dist):
+        expected[ig.coord(idx)] = max(d, 0)
+    assert np.array_equal(rebuilt, expected)
+    mt.clear_heuristic_cache()
+
+
+# Dict graphs are not cached: a change which keeps the number of nodes still gives the new table
+def test_dict_graph_not_cached(mazes):
+    mt.clear_heuristic_cache()
+    maze = mazes[-1][0]
+    graph = mz.create_graph(maze)
+    src, dest = corners(maze)
+    table = mt.heuristic_table(graph, dest)
+    assert len(mt.heuristic_cache) == 0
+    neighbour = graph[dest][0]
+    graph[dest].remove(neighbour)
+    graph[neighbour].remove(dest)
+    rebuilt = mt.heuristic_table(graph, dest)
+    assert rebuilt is not table
+    dist, ig = al.bfs_distances(graph, dest)
+    assert all(rebuilt[ig.coord(idx)] == max(d, 0) for idx, d in enumerate(dist))
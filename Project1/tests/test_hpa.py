@@ -0,0 +1,54 @@
+import pytest
+import algorithm as al
+import createmaze as mz
+import hpa
+import maze_thinning as mt
+from conftest import corners
+
+
+# Paths are valid and near optimal: never shorter than the shortest path
+@pytest.mark.parametrize("clustersize", [3, 5, 10])
+def test_path_is_valid(mazes, check_path, clustersize):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        result = hpa.hpastar(hpa.HPAGraph(graph.copy(), clustersize), src, dest)
+        assert result[0] == "S"
+        check_path(maze, result[2], src, dest)
+        assert len(result[2]) >= length
+
+
+# With one cluster over the whole maze the refined path is a shortest path
+def test_single_cluster_is_shortest(mazes):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        result = hpa.hpastar(hpa.HPAGraph(graph.copy(), len(maze)), src, dest)
+        assert len(result[2]) == length
+
+
+# Blocking cells rebuilds the abstraction: the search succeeds exactly when BFS does over the blocked maze
+def test_block(mazes, check_path):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        hgraph = hpa.HPAGraph(graph.copy(), 4)
+        path = hpa.hpastar(hgraph, src, dest)[2]
+        blocked = [cell for cell in path[len(path) // 2:len(path) // 2 + 2] if cell != dest]
+        hgraph.block(blocked)
+        result = hpa.hpastar(hgraph, src, dest)
+        assert result[0] == al.bfs(hgraph.graph, src, dest)[0]
+        if result[0] == "S":
+            maze = maze.copy()
+            for cell in blocked:
+                maze[cell] = 1
+            check_path(maze, result[2], src, dest)
+
+
+# Option "H" of maze_thinning.astar runs HPA*, over the given HPAGraph or one with clusters of 10
+def test_astar_option(mazes):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        result = mt.astar(graph, src, dest, "H")
+        assert result[0] == "S" and result[2] == hpa.hpastar(hpa.HPAGraph(graph), src, dest)[2]
+        hgraph = hpa.HPAGraph(graph, 4)
+        assert mt.astar(graph, src, dest, "H", hgraph=hgraph)[2] == hpa.hpastar(hgraph, src, dest)[2]
+    with pytest.raises(TypeError):
+        mt.astar(mz.create_graph(maze), src, dest, "H")
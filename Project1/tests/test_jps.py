@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+import algorithm as al
+import createmaze as mz
+import jps
+import maze_thinning as mt
+from conftest import corners
+
+
+# JPS and JPS+ find a shortest path, over the maze or its GridGraph
+@pytest.mark.parametrize("plus", [False, True])
+def test_straight_is_shortest(mazes, check_path, plus):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        tables = jps.jump_tables(maze) if plus else None
+        for target in (maze, graph):
+            result = jps.jps(target, src, dest, tables=tables)
+            assert result[0] == "S"
+            check_path(maze, result[2], src, dest)
+            assert len(result[2]) == length == result[5]
+
+
+# On 8-connected mazes the path is as short as the bfs path over the relaxed graph, also between random cells
+def test_diagonal_is_shortest(mazes, check_path):
+    rng = np.random.RandomState(3)
+    for maze, graph, length in mazes:
+        relaxed = mz.create_relaxedgridgraph(maze)
+        cells = relaxed.keys()
+        pairs = [corners(maze)] + [(cells[a], cells[b]) for a, b in rng.randint(len(cells), size=(5, 2))]
+        for src, dest in pairs:
+            best = al.bfs(relaxed, src, dest)
+            for target in (maze, relaxed):
+                result = jps.jps(target, src, dest, diagonal=True)
+                assert result[0] == best[0]
+                if result[0] == "S":
+                    assert result[2][0] == src and result[2][-1] == dest
+                    assert all(b in relaxed[a] for a, b in zip(result[2], result[2][1:]))
+                    assert len(result[2]) == len(best[2]) == result[5]
+
+
+# option "J" of maze_thinning.astar hands the jump tables over (JPS+)
+def test_astar_option(mazes, monkeypatch):
+    maze, graph, length = mazes[0]
+    src, dest = corners(maze)
+    tables = jps.jump_tables(maze)
+    seen = []
+    monkeypatch.setattr(jps, "table_jumper", lambda *args: seen.append(args[0]) or jps.straight_jumper(*args[1:]))
+    assert mt.astar(graph, src, dest, "J", tables=tables)[5] == length
+    assert seen == [tables]
+
+
+def test_unreachable():
+    maze = mz.create_maze(6, 0, 0)
+    maze[1, :] = 1
+    assert jps.jps(maze, (0, 0), (5, 5))[0] == "F"
+    assert jps.jps(maze, (0, 0), (5, 5), tables=jps.jump_tables(maze))[0] == "F"
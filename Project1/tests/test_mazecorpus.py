@@ -0,0 +1,65 @@
+import pickle
+import numpy as np
+import pytest
+import createmaze as mz
+import distancefield as df
+import mazecorpus as mc
+import seeding as sd
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = str(tmp_path / "mazes.corpus")
+    assert mc.build_corpus(path, [9, 16], [0.2, 0.4], 4, seed=7) == 16
+    return mc.MazeCorpus(path)
+
+
+# Every maze reads back as the maze its seed gives, with the index telling its size, density and solvability
+def test_round_trip(corpus):
+    assert len(corpus) == 16
+    for record, maze in corpus.stream():
+        entry = corpus.index[record]
+        size = int(entry["size"])
+        assert maze.shape == (size, size) and maze.dtype == np.uint8
+        assert np.array_equal(maze, mz.create_maze(size, float(entry["density"]), int(entry["seed"])))
+        dist = df.distance_field(maze, [(0, 0)])[0][size - 1, size - 1]
+        assert bool(entry["solvable"]) == (dist >= 0)
+        assert entry["optimal"] == (dist + 1 if dist >= 0 else 0)
+
+
+# The same arguments build the same file
+def test_rebuild_is_identical(corpus, tmp_path):
+    other = str(tmp_path / "again.corpus")
+    mc.build_corpus(other, [9, 16], [0.2, 0.4], 4, seed=7)
+    with open(corpus.path, "rb") as a, open(other, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_seeds_follow_int_seed(corpus):
+    records = corpus.take(16, 0.4)
+    assert [int(corpus.index[r]["seed"]) for r in records] == [sd.int_seed(7, 16, 1, k) for k in range(4)]
+
+
+def test_take(corpus):
+    assert list(corpus.take(9, 0.2)) == [0, 1, 2, 3]
+    assert list(corpus.take(16, 0.2, 2)) == [8, 9]
+    assert list(corpus.take(9, 0.2, solvable=True)) == [0, 2]
+    assert list(corpus.take(9, 0.2, solvable=False)) == [1, 3]
+    with pytest.raises(ValueError):
+        corpus.take(9, 0.2, 5)
+    with pytest.raises(ValueError):
+        corpus.take(12, 0.2)
+
+
+# A corpus pickles as its path and maps the file again
+def test_pickle(corpus):
+    again = pickle.loads(pickle.dumps(corpus))
+    assert again.path == corpus.path
+    assert np.array_equal(again[5], corpus[5])
+
+
+def test_not_a_corpus(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        mc.MazeCorpus(str(path))
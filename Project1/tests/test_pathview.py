@@ -0,0 +1,96 @@
+import pytest
+import algorithm as al
+import createmaze as mz
+import gridgraph as gg
+import pathview as pv
+from conftest import corners
+
+
+# The list of nodes the searches returned before the views: parent walk from dest, reversed
+def old_path(parent, srci, desti, coord):
+    chain = [desti]
+    while chain[-1] != srci:
+        chain.append(parent[chain[-1]])
+    return [coord(idx) for idx in reversed(chain)]
+
+
+# A chain 0 <- 1 <- ... <- 9 over a parent list, index k is node (k, 0); the tail goes on 10 -> 11 -> 12
+CHAIN = [-1] + list(range(9))
+TAIL = [-1] * 10 + [11, 12, -1]
+
+
+def coord(idx):
+    return idx, 0
+
+
+def chain_view(tail=False):
+    if tail:
+        return pv.PathView(CHAIN, 0, 9, coord, TAIL, 10, 12)
+    return pv.PathView(CHAIN, 0, 9, coord)
+
+
+@pytest.mark.parametrize("tail", [False, True])
+def test_view_reads_like_a_list(tail):
+    view = chain_view(tail)
+    nodes = [coord(k) for k in range(13 if tail else 10)]
+    assert len(view) == len(nodes) and view
+    assert list(view) == nodes and view == nodes and list(reversed(view)) == nodes[::-1]
+    for k in range(-len(nodes), len(nodes)):
+        assert view[k] == nodes[k]
+    assert view[2:5] == nodes[2:5] and view[::-3] == nodes[::-3]
+    with pytest.raises(IndexError):
+        view[len(nodes)]
+    assert view + [(99, 0)] == nodes + [(99, 0)]
+
+
+# pop at the ends moves the cursors, anywhere else the view becomes a list and goes on like one
+@pytest.mark.parametrize("tail", [False, True])
+def test_pop(tail):
+    view = chain_view(tail)
+    nodes = [coord(k) for k in range(13 if tail else 10)]
+    for k in (0, -1, 0, len(nodes) - 4):
+        assert view.pop(k) == nodes.pop(k)
+        assert view == nodes and list(reversed(view)) == nodes[::-1] and view[-1] == nodes[-1]
+    assert view.nodes is None
+    for k in (2, -2, 0, -1):
+        assert view.pop(k) == nodes.pop(k)
+        assert view == nodes and len(view) == len(nodes)
+    while nodes:
+        assert view.pop() == nodes.pop()
+    assert not view and list(view) == []
+    with pytest.raises(IndexError):
+        view.pop()
+
+
+# Every search returns a view equal to the list the old code walked out of the same parent buffers (the bibfs tail
+# collected forwards after it), src == dest included
+def test_searches_match_old_paths(mazes):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        for target in (graph, mz.create_graph(maze)):
+            for search in (al.bfs, al.dfs, al.dijkstra, al.bibfs):
+                path = search(target, src, dest)[2]
+                assert isinstance(path, pv.PathView)
+                nodes = old_path(path.parent, path.srci, path.node, path.coord)
+                tail = path.tail
+                while tail != -1:
+                    nodes.append(path.coord(tail))
+                    tail = path.tailparent[tail] if tail != path.taildest else -1
+                assert path == nodes and list(path) == nodes and len(path) == len(nodes)
+                if search is not al.dfs:
+                    assert len(path) == length
+                single = search(target, src, src)[2]
+                assert isinstance(single, pv.PathView) and single == [src] and len(single) == 1
+
+
+# get_index_path reads the parent list in place and gives the old list, None when dest was not reached
+def test_get_index_path():
+    maze = mz.create_maze(4, 0, 0)
+    ig = gg.indexed(mz.create_gridgraph(maze))
+    parent = [-1] * 16
+    for idx in range(1, 16):
+        parent[idx] = idx - 1
+    assert al.get_index_path(parent, 0, 15, ig) == old_path(parent, 0, 15, ig.coord)
+    assert len(al.get_index_path(parent, 5, 9, ig)) == 5
+    parent[15] = -1
+    assert al.get_index_path(parent, 0, 15, ig) is None
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+import maze_thinning as mt
+from conftest import corners
+
+
+# Items come out by priority, then lowest h, then insertion order
+def test_queue_order():
+    queue = mt.PriorityQueue()
+    for item, priority, h in [("a", 3, 0), ("b", 1, 2), ("c", 1, 1), ("d", 1, 1), ("e", 0, 5)]:
+        queue.add(item, priority, h)
+    assert len(queue) == 5
+    assert [queue.popmin() for _ in range(5)] == ["e", "c", "d", "b", "a"]
+    assert queue.isempty()
+    with pytest.raises(IndexError):
+        queue.popmin()
+
+
+# An indexed queue keeps every item once, with its best key
+def test_indexed_queue_decrease_key():
+    queue = mt.PriorityQueue(indexed=True)
+    queue.add("a", 5)
+    queue.add("b", 3)
+    queue.add("a", 1)
+    queue.add("b", 4)
+    assert len(queue) == 2 and "a" in queue
+    assert [queue.popmin(), queue.popmin()] == ["a", "b"]
+    assert queue.isempty() and "a" not in queue
+
+
+# Without index an item is queued once per add and stays 'in' the queue until its last entry is popped
+def test_queue_membership():
+    queue = mt.PriorityQueue()
+    assert "a" not in queue
+    queue.add("a", 2)
+    queue.add("b", 3)
+    queue.add("a", 1)
+    assert "a" in queue and "b" in queue and len(queue) == 3
+    assert queue.popmin() == "a" and "a" in queue
+    assert queue.popmin() == "a" and "a" not in queue and "b" in queue
+    assert queue.popmin() == "b" and "b" not in queue and queue.isempty()
+
+
+def test_queue_sorts_random_priorities():
+    priorities = np.random.default_rng(0).integers(0, 50, 500).tolist()
+    queue = mt.PriorityQueue(indexed=True)
+    for item, priority in enumerate(priorities):
+        queue.add(item, priority)
+    popped = [queue.popmin() for _ in range(len(priorities))]
+    assert [priorities[item] for item in popped] == sorted(priorities)
+
+
+# A* with the manhattan or euclidean heuristic returns a shortest path
+@pytest.mark.parametrize("option", ["M", "E"])
+def test_astar_is_shortest(mazes, check_path, option):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        result = mt.astar(graph, src, dest, option)
+        assert result[0] == "S"
+        check_path(maze, result[2], src, dest)
+        assert len(result[2]) == length == result[5]
@@ -0,0 +1,49 @@
+import algorithm as al
+import replanner as rp
+from conftest import corners
+
+
+# The first plan is a shortest path
+def test_plan_is_shortest(mazes, check_path):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        path = rp.DStarLite(graph, src, dest).plan()
+        check_path(maze, path, src, dest)
+        assert len(path) == length
+
+
+# Following next_step reaches dest in as many steps as the shortest path
+def test_next_step_walk(mazes):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        planner = rp.DStarLite(graph, src, dest)
+        node, steps = src, 1
+        while node != dest:
+            node = planner.next_step()
+            planner.move(node)
+            steps += 1
+        assert steps == length
+
+
+# After blocking cells of the plan the repaired plan is as short as a search from scratch over the blocked graph
+def test_repair_after_block(mazes, check_path):
+    for maze, graph, length in mazes:
+        src, dest = corners(maze)
+        planner = rp.DStarLite(graph, src, dest)
+        path = planner.plan()
+        node = path[1]
+        planner.move(node)
+        blocked = [cell for cell in path[len(path) // 2:len(path) // 2 + 2] if cell != dest]
+        planner.block(blocked)
+        after = graph.copy()
+        after.block(blocked)
+        fresh = al.bfs(after, node, dest)
+        repaired = planner.plan()
+        if fresh[0] == "F":
+            assert repaired == [] and planner.next_step() is None
+        else:
+            maze = maze.copy()
+            for cell in blocked:
+                maze[cell] = 1
+            check_path(maze, repaired, node, dest)
+            assert len(repaired) == len(fresh[2])
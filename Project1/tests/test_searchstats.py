@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import algorithm as al
+import createmaze as mz
+import maze_thinning as mt
+import searchstats as ss
+
+# 3x3 ring around a blocked centre, (0, 0) to (2, 2) is 4 steps either way
+RING = np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]], dtype=np.uint8)
+# 2x3 corridor, a single path from (0, 0) to (1, 2)
+CORRIDOR = np.array([[0, 0, 0], [1, 1, 0]], dtype=np.uint8)
+
+
+def run(search, maze, dest):
+    stats = ss.SearchStats()
+    result = search(mz.create_gridgraph(maze), (0, 0), dest, stats)
+    assert result[0] == "S"
+    return stats.expansions, stats.pushes, stats.reopens, stats.peak_frontier, stats.iterations
+
+
+# (expansions, pushes, reopens, peak frontier, iterations), traced by hand:
+# bfs and dijkstra reach dest last on the ring and expand all 8 cells, at most 2 of them queued at once. A* takes the
+# top side (ties go to the lowest h, then to the first pushed) and only pushes (1, 0) from the bottom side.
+@pytest.mark.parametrize("search, ring, corridor", [
+    (lambda g, s, d, stats: al.bfs(g, s, d, stats=stats), (8, 8, 0, 2, 1), (4, 4, 0, 1, 1)),
+    (lambda g, s, d, stats: al.dijkstra(g, s, d, stats=stats), (8, 8, 0, 2, 1), (4, 4, 0, 1, 1)),
+    (lambda g, s, d, stats: mt.astar(g, s, d, "M", stats=stats), (5, 6, 0, 2, 1), (4, 4, 0, 1, 1)),
+])
+def test_counts(search, ring, corridor):
+    assert run(search, RING, (2, 2)) == ring
+    assert run(search, CORRIDOR, (1, 2)) == corridor
+
+
+# (1, 2) is first reached over the dear edge from (0, 2) (cost 12), then at cost 5 from (2, 2): one decrease-key
+def test_dijkstra_reopen():
+    def cost(a, b):
+        return 10 if (a, b) == ((0, 2), (1, 2)) else 1
+    stats = ss.SearchStats()
+    result = al.dijkstra(mz.create_gridgraph(RING), (0, 0), (1, 2), cost=cost, stats=stats)
+    assert list(result[2]) == [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2)]
+    assert (stats.expansions, stats.pushes, stats.reopens) == (8, 9, 1)
+    assert stats.peak_memory > 0
+
+
+# Peaks are maxima, the other counters add up
+def test_record():
+    stats = ss.SearchStats()
+    stats.record(3, 4, 1, 5, 100)
+    stats.record(2, 2, 0, 3, 400)
+    assert stats.as_dict() == {"expansions": 5, "pushes": 6, "reopens": 1, "peak_frontier": 5, "peak_memory": 400,
+                               "iterations": 2}
+
+
+def test_aggregate():
+    aggregate = ss.StatsAggregate()
+    assert aggregate.mean("expansions") == 0
+    for expansions, peak in [(4, 2), (8, 1), (9, 6)]:
+        stats = ss.SearchStats()
+        stats.record(expansions, expansions + 1, 0, peak, 10 * expansions)
+        aggregate.add(stats)
+    assert aggregate.runs == 3
+    assert aggregate.mean("expansions") == 7 and aggregate.mean("pushes") == 8 and aggregate.mean("peak_frontier") == 3
+    summary = aggregate.summary()
+    assert summary["runs"] == 3
+    assert summary["peak_memory"] == {"total": 210, "mean": 70, "max": 90}
+    assert summary["iterations"] == {"total": 3, "mean": 1, "max": 1}
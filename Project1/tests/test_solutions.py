@@ -0,0 +1,40 @@
+import numpy as np
+import algorithm as al
+import createmaze as mz
+import solutions as so
+from conftest import corners
+
+
+# Fire starts are distinct, reachable from src, at least mindist from it and never dest, over either kind of graph
+def test_let_there_be_fires(mazes):
+    for k, (maze, graph, length) in enumerate(mazes):
+        src, dest = corners(maze)
+        dist = al.bfs_distances(graph, src)[0]
+        for target in (graph, mz.create_graph(maze)):
+            for count, mindist in [(1, 1), (4, 1), (6, 3)]:
+                starts = so.let_there_be_fires(target, src, dest, count, mindist, rng=k)
+                assert len(starts) == len(set(starts)) == count
+                for node in starts:
+                    assert node != dest and dist[graph.index(node)] >= mindist
+
+
+# Every qualifying cell can be drawn, and asking for more cells than qualify gives None
+def test_let_there_be_fires_all_cells():
+    maze = np.zeros((4, 4), dtype=np.uint8)
+    graph = mz.create_gridgraph(maze)
+    starts = so.let_there_be_fires(graph, (0, 0), (3, 3), 14, rng=0)
+    assert sorted(starts) == sorted(node for node in graph.keys() if node not in ((0, 0), (3, 3)))
+    assert so.let_there_be_fires(graph, (0, 0), (3, 3), 15, rng=0) is None
+
+
+def test_same_seed_same_starts(mazes):
+    graph = mazes[-1][1]
+    dest = (graph.height - 1, graph.width - 1)
+    assert so.let_there_be_fires(graph, (0, 0), dest, 3, rng=5) == so.let_there_be_fires(graph, (0, 0), dest, 3, rng=5)
+
+
+# The solutions work on their own copy of the fire starts
+def test_fire_starts_copy():
+    starts = [(1, 2)]
+    assert so.fire_starts(starts) == starts and so.fire_starts(starts) is not starts
+    assert so.fire_starts((1, 2)) == [(1, 2)]
@@ -0,0 +1,41 @@
+import pytest
+import algorithm as al
+import maze_thinning as mt
+import timing as tm
+from conftest import corners
+
+
+# perf_counter_ns replaced by a clock reading 100, 250, 400, ... ns
+@pytest.fixture
+def clock(monkeypatch):
+    readings = iter(range(100, 10 ** 6, 150))
+    monkeypatch.setattr(tm.time, "perf_counter_ns", lambda: next(readings))
+
+
+# Readings are perf_counter_ns values, laps and since are differences between them
+def test_timer_deltas(clock):
+    timer = tm.Timer()                       # 100
+    assert timer.begin() == 250
+    assert timer.lap("graph") == 400
+    assert timer.lap("search") == 550
+    assert timer.lap("graph") == 700
+    assert timer.phases == {"graph": 300, "search": 150}
+    assert timer.since(550) == 300           # 850 - 550
+    assert timer.total() == 900              # 1000 - 100
+    assert tm.timer_for(timer) is timer and isinstance(tm.timer_for(None), tm.Timer)
+
+
+# With ENABLED = False the clock is never read and the searches report 0 ns
+def test_disabled(mazes, monkeypatch):
+    def unexpected():
+        raise AssertionError("the clock was read")
+    monkeypatch.setattr(tm.time, "perf_counter_ns", unexpected)
+    monkeypatch.setattr(tm, "ENABLED", False)
+    maze, graph, length = mazes[0]
+    src, dest = corners(maze)
+    for result in (al.bfs(graph, src, dest), al.dfs(graph, src, dest), al.bibfs(graph, src, dest),
+                   al.dijkstra(graph, src, dest), mt.astar(graph, src, dest, "M")):
+        assert result[0] == "S" and result[3] == 0
+    timer = tm.Timer()
+    timer.lap("search")
+    assert timer.phases == {"search": 0} and timer.total() == 0
@@ -0,0 +1,52 @@
+import time
+
+# Timing of the searches and experiments
+# Times are integer nanoseconds from time.perf_counter_ns, which is monotonic and does not wrap (the previous
+# (datetime.now() - start).microseconds dropped the whole seconds). A Timer measures a total and optionally splits it
+# into named phases (graph build, search, path reconstruction...):
+#
+#     timer = Timer()
+#     graph = createmaze.create_gridgraph(maze)
+#     timer.lap("graph")                          # time since the timer started, or since the previous lap
+#     result = algorithm.bfs(graph, src, dest, timer=timer)
+#     timer.phases                                # {"graph": ns, "search": ns, "path": ns}
+#
+# Setting ENABLED = False turns the clock off: every reading is 0, so timing costs one flag test per reading.
+
+ENABLED = True
+
+
+def now():
+    return time.perf_counter_ns() if ENABLED else 0
+
+
+class Timer(object):
+    def __init__(self):
+        self.start = now()
+        self.mark = self.start  # end of the last phase
+        self.phases = {}        # phase name -> ns, phases with the same name add up
+
+    # Starts a measured section (a search) here and returns its start reading, the time since the last lap is dropped
+    def begin(self):
+        self.mark = now()
+        return self.mark
+
+    # Ends the current phase under 'name' and returns the reading
+    def lap(self, name):
+        stamp = now()
+        self.phases[name] = self.phases.get(name, 0) + stamp - self.mark
+        self.mark = stamp
+        return stamp
+
+    # ns elapsed since a reading returned by begin or lap
+    def since(self, stamp):
+        return now() - stamp
+
+    # ns elapsed since the timer was created
+    def total(self):
+        return now() - self.start
+
+
+# Timer of a search: the one passed by the caller (to collect the phases), else a new one
+def timer_for(timer):
+    return Timer() if timer is None else timer
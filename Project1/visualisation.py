@@ -33,7 +33,7 @@ def disp_path_for_probab3(data, startsize, endsize, step):
     size_list = []                                              # List to append the sizes of maze
     for size in range(startsize, endsize + step, step):
         size_list.append(size)
-    algo_list = ["bfs", "dfs", "dijk", "bibfs"]                 # List of search algorithms
+    algo_list = ["bfs", "dfs", "dijk", "bibfs", "iddfs", "idastar"]                 # List of search algorithms
     for algo in algo_list:
         d = data.get(0.3)                                       # Fixed probability of 0.3 and getting graphs
         path = list(map(lambda key: (d.get(key)).get(algo + "_path"), d.keys()))
@@ -48,12 +48,12 @@ def disp_time_for_probab3(data, startsize, endsize, step):
     fig = plt.figure()                                      # Initializing figure
     ax1 = fig.add_subplot()
     ax1.set_xlabel("Size")
-    ax1.set_ylabel("Time (micro sec)")
+    ax1.set_ylabel("Time (ns)")
     ax1.set_title("Size vs Time with probability 0.3")
     size_list = []                                          # List to append the sizes of maze
     for size in range(startsize, endsize + step, step):
         size_list.append(size)
-    algo_list = ["bfs", "dfs", "dijk", "bibfs"]
+    algo_list = ["bfs", "dfs", "dijk", "bibfs", "iddfs", "idastar"]
     for algo in algo_list:
         d = data.get(0.3)                                   # Fixed probability of 0.3 and getting graphs
         time = list(map(lambda key: (d.get(key)).get(algo + "_time"), d.keys()))
@@ -143,7 +143,8 @@ def disp_data(data, varname, xlable, ylabel, title):
     ax1.set_ylabel(ylabel)
     ax1.set_title(title)
     thiningfactors = list(data.keys())
-    processmap = {"Manhattan": "M", "Euclidean": "E", "Thining": "TH", "Diagonal": "Dia"}
+    processmap = {"Manhattan": "M", "Euclidean": "E", "Thining": "TH", "Diagonal": "Dia", "Jump Point Search": "JPS",
+                  "HPA*": "HPA", "Batched A* (amortised batch time)": "BA"}
 
     for process in list(processmap.keys()):
         pr = processmap.get(process)
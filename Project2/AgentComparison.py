@@ -1,11 +1,23 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import MineSweeper1 as ms1
 import MineSweeper2 as ms2
 import MineSweeper3 as ms3
 
 
+# Seed of one trial derived from the master seed (SeedSequence spawn key), None when there is no master seed
+# The key is (size, mine density in thousandths, iteration): a trial plays the same board in every comparison and all
+# agents of a trial play the same board. Same derivation as seeding.int_seed of Project1, which runs from its own
+# directory and cannot be imported here
+def trial_seed(seed, size, minedensity, iteration):
+    if seed is None:
+        return None
+    key = (size, int(round(minedensity * 1000)), iteration)
+    return int(np.random.SeedSequence(seed, spawn_key=key).generate_state(1, np.uint64)[0])
+
+
 # Compare Agent 1 and Agent2
-def comparison2(sizes, minedensities, iterations):
+def comparison2(sizes, minedensities, iterations, seed=None):
     sizeData = {}
     for size in sizes:
         minedensitydata = {}
@@ -15,15 +27,16 @@ def comparison2(sizes, minedensities, iterations):
             scorefor2 = 0
             time2 = 0
             for iter in range(iterations):
-                agent1 = ms1.MineSweeperPlay(size, minedensity, "A")
+                gameseed = trial_seed(seed, size, minedensity, iter)
+                agent1 = ms1.MineSweeperPlay(size, minedensity, "A", gameseed)
                 result1 = agent1.letsplay()
 
                 scorefor1 = scorefor1 + result1[1] / result1[0]
-                time1 = time1 + result1[3] / (10 ** 3)
-                agent2 = ms2.MineSweeper2Play(size, minedensity, "A")
+                time1 = time1 + result1[3] / (10 ** 6)
+                agent2 = ms2.MineSweeper2Play(size, minedensity, "A", gameseed)
                 result2 = agent2.letsplay()
                 scorefor2 = scorefor2 + result2[1] / result2[0]
-                time2 = time2 + result2[3] / (10 ** 3)
+                time2 = time2 + result2[3] / (10 ** 6)
             minedensitydata[minedensity] = {"Basic": [round(scorefor1 / iterations, 3), round(time1 / iterations, 2)],
                                             "KnowledgeBased": [round(scorefor2 / iterations, 3),
                                                                round(time2 / iterations, 2)]}
@@ -32,7 +45,7 @@ def comparison2(sizes, minedensities, iterations):
 
 
 # Compare Agent 1,Agent2, Agent3 and Agent4
-def comparison4(sizes, minedensities, iterations):
+def comparison4(sizes, minedensities, iterations, seed=None):
     print("Compare2")
     sizeData = {}
     for size in sizes:
@@ -47,22 +60,23 @@ def comparison4(sizes, minedensities, iterations):
             scorefor4 = 0
             time4 = 0
             for iter in range(iterations):
-                agent1 = ms1.MineSweeperPlay(size, minedensity, "A")
+                gameseed = trial_seed(seed, size, minedensity, iter)
+                agent1 = ms1.MineSweeperPlay(size, minedensity, "A", gameseed)
                 result1 = agent1.letsplay()
                 scorefor1 = scorefor1 + result1[1] / result1[0]
-                time1 = time1 + result1[3] / (10 ** 3)
-                agent2 = ms2.MineSweeper2Play(size, minedensity, "A")
+                time1 = time1 + result1[3] / (10 ** 6)
+                agent2 = ms2.MineSweeper2Play(size, minedensity, "A", gameseed)
                 result2 = agent2.letsplay()
                 scorefor2 = scorefor2 + result2[1] / result2[0]
-                time2 = time2 + result2[3] / (10 ** 3)
-                agent3 = ms3.MineSweeper3Play(size, minedensity, "P", "A")
+                time2 = time2 + result2[3] / (10 ** 6)
+                agent3 = ms3.MineSweeper3Play(size, minedensity, "P", "A", gameseed)
                 result3 = agent3.letsplay()
                 scorefor3 = scorefor3 + result3[1] / result3[0]
-                time3 = time3 + result3[3] / (10 ** 3)
-                agent4 = ms3.MineSweeper3Play(size, minedensity, "IP", "A")
+                time3 = time3 + result3[3] / (10 ** 6)
+                agent4 = ms3.MineSweeper3Play(size, minedensity, "IP", "A", gameseed)
                 result4 = agent4.letsplay()
                 scorefor4 = scorefor4 + result4[1] / result4[0]
-                time4 = time4 + result4[3] / (10 ** 3)
+                time4 = time4 + result4[3] / (10 ** 6)
             minedensitydata[minedensity] = {"Basic": [round(scorefor1 / iterations, 3), round(time1 / iterations, 2)],
                                             "KnowledgeBased": [round(scorefor2 / iterations, 3),
                                                                round(time2 / iterations, 2)],
@@ -113,8 +127,8 @@ def reducedata(data, sizes, minedensities):
     return dataToPlot
 
 
-# Generate and Plot data for given sizes and mine density
-def plotdata():
+# Generate and Plot data for given sizes and mine density, seed is the master seed of all comparisons
+def plotdata(seed=None):
     s1 = [20, 30, 40, 50, 60]
     m1 = [0.4]
     s2 = [50]
@@ -123,28 +137,28 @@ def plotdata():
     s4 = [12]
     iter = 10
 
-    data1 = comparison2(s1, m1, iter)
+    data1 = comparison2(s1, m1, iter, seed)
     data1 = reducedata(data1, s1, m1)
     disp_data(data1, ["Basic", "KnowledgeBased"], "Sizes", "Score",
               "Size vs Score for mine density 0.4", 0)
     disp_data(data1, ["Basic", "KnowledgeBased"], "Sizes", "Time(ms)",
               "Size vs time for mine density 0.4", 1)
 
-    data2 = comparison2(s2, m2, iter)
+    data2 = comparison2(s2, m2, iter, seed)
     data2 = reducedata(data2, s2, m2)
     disp_data(data2, ["Basic", "KnowledgeBased"], "Mine Density", "Score",
               "Mine Density vs Score for size 50", 0)
     disp_data(data2, ["Basic", "KnowledgeBased"], "Mine Density", "Time(ms)",
               "Mine Density vs time for size 50", 1)
 
-    data3 = comparison4(s3, m1, iter)
+    data3 = comparison4(s3, m1, iter, seed)
     data3 = reducedata(data3, s1, m1)
     disp_data(data3, ["Basic", "KnowledgeBased", "Probabilistic", "Improved Probabilistic"], "Mine Density", "Score",
               "Size vs Score for mine density 0.4", 0)
     disp_data(data3, ["Basic", "KnowledgeBased", "Probabilistic", "Improved Probabilistic"], "Mine Density", "Time(ms)",
               "Size vs time for mine density 0.4", 1)
 
-    data4 = comparison4(s4, m2, iter)
+    data4 = comparison4(s4, m2, iter, seed)
     data4 = reducedata(data4, s4, m2)
     disp_data(data4, ["Basic", "KnowledgeBased", "Probabilistic", "Improved Probabilistic"], "Sizes", "Score",
               "Mine Density vs Score for size 12", 0)
@@ -153,4 +167,5 @@ def plotdata():
     plt.show()
 
 
-plotdata()
+if __name__ == '__main__':
+    plotdata()
@@ -4,7 +4,7 @@ import sys
 import tkinter as tk
 import math
 import matplotlib.pyplot as plt
-import datetime as t
+import time
 
 # increasing recusrion limit
 sys.setrecursionlimit(100000)
@@ -18,8 +18,10 @@ class MineSweeper2(object):
     """
 
     # Constructor with 3 arguments, size of minesweeper, mine density and the mode to play in
-    def __init__(self, size, mdensity, mode):
+    # seed makes the board and the random guesses reproducible (random.Random(seed)), None is a new game each time
+    def __init__(self, size, mdensity, mode, seed=None):
         self.size = size
+        self.random = random.Random(seed)  # own generator, games never share the global random state
         self.mode = mode
         self.mdensity = mdensity
 
@@ -33,8 +35,8 @@ class MineSweeper2(object):
         self._mines = set()
         # Setting mines at random location
         while len(self._mines) < mines_number:
-            self._mines.add((random.randrange(size),
-                             random.randrange(size)))
+            self._mines.add((self.random.randrange(size),
+                             self.random.randrange(size)))
 
         # For each square, gives the set of its neighbours
         # ni = not identified
@@ -257,7 +259,7 @@ class MineSweeper2(object):
         else:
             # get remaining cells excluding the opened and flagged cells
             permittedsteps = self.cells - self.opened - self.flagged  # get remaining cells excluding the opened and flagged cells
-            step = random.choice(list(permittedsteps))  # from these cells, choose one randomly
+            step = self.random.choice(list(permittedsteps))  # from these cells, choose one randomly
 
         return step     # return the next step to follow, the hint
 
@@ -285,13 +287,13 @@ class MineSweeper2Play(MineSweeper2):
 
     def letsplay(self):
         """
-        plays the game; starts timer and runs until all cells are opened and returns the time taken in microseconds
+        plays the game; starts timer and runs until all cells are opened and returns the time taken in nanoseconds
         """
-        start_time = t.datetime.now()  # Noting time taken to complete
+        start_time = time.perf_counter_ns()  # Noting time taken to complete
         while self.empty_remaining > 0:  # until all cells are opened
             step = self.constraintsolver()
             self.open(step)
-        return len(self._mines), len(self.flagged), len(self.mines_busted), (t.datetime.now() - start_time).microseconds
+        return len(self._mines), len(self.flagged), len(self.mines_busted), time.perf_counter_ns() - start_time
 
     def display(self):
         """
@@ -424,7 +426,7 @@ def main(cls):
                 meanmines += tmines
                 meanflagged += tflagged
                 meanbusted += tbusted
-                meantimetaken += round(timetaken / (10 ** 3), 4)
+                meantimetaken += round(timetaken / (10 ** 6), 4)
             result[size] = {"meanmines": math.floor(meanmines / iterations),
                             "meanflagged": math.floor(meanflagged / iterations),
                             "meanbusted": math.floor(meanbusted / iterations),
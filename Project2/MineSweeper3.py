@@ -3,7 +3,7 @@ import sys
 import tkinter as tk
 import math
 import matplotlib.pyplot as plt
-import datetime as t
+import time
 import copy as cp
 import numpy as np
 
@@ -19,8 +19,10 @@ class MineSweeper3(object):
     """
 
     # Constructor with 4 arguments, size of minesweeper board, mine density, agent to be used and the mode of play
-    def __init__(self, size, mdensity, agent, mode):
+    # seed makes the board and the random guesses reproducible (random.Random(seed)), None is a new game each time
+    def __init__(self, size, mdensity, agent, mode, seed=None):
         self.size = size
+        self.random = random.Random(seed)  # own generator, games never share the global random state
         self.mode = mode
         self.agent = agent
         self.mdensity = mdensity
@@ -39,8 +41,8 @@ class MineSweeper3(object):
         self._mines = set()
         # Setting mines at random location
         while len(self._mines) < mines_number:
-            self._mines.add((random.randrange(size),
-                             random.randrange(size)))
+            self._mines.add((self.random.randrange(size),
+                             self.random.randrange(size)))
 
         # For each square, gives the set of its neighbours
         # ni = not identified
@@ -279,7 +281,7 @@ class MineSweeper3(object):
             else:
                 # otherwise, get the permitted steps by chekcing the remaining covered (hidden) cells
                 permittedsteps = self.cells - self.opened - self.flagged
-                step = random.choice(list(permittedsteps))  # from these cells, choose one randomly
+                step = self.random.choice(list(permittedsteps))  # from these cells, choose one randomly
         return step
 
     def probabilisticsolver(self):
@@ -365,13 +367,13 @@ class MineSweeper3Play(MineSweeper3):
 
     def letsplay(self):
         """
-        plays the game; starts timer and runs until all cells are opened and returns the time taken in microseconds
+        plays the game; starts timer and runs until all cells are opened and returns the time taken in nanoseconds
         """
-        start_time = t.datetime.now()  # Noting time taken to complete
+        start_time = time.perf_counter_ns()  # Noting time taken to complete
         while self.empty_remaining > 0:  # until all cells are opened
             step = self.probabilisticsolver()
             self.open(step)
-        return len(self._mines), len(self.flagged), len(self.mines_busted), (t.datetime.now() - start_time).microseconds
+        return len(self._mines), len(self.flagged), len(self.mines_busted), time.perf_counter_ns() - start_time
 
     def display(self):
         """
@@ -507,7 +509,7 @@ def main(cls):
                 meanmines += tmines
                 meanflagged += tflagged
                 meanbusted += tbusted
-                meantimetaken += round(timetaken / (10 ** 3), 4)
+                meantimetaken += round(timetaken / (10 ** 6), 4)
             result[size] = {"meanmines": math.floor(meanmines / iterations),
                             "meanflagged": math.floor(meanflagged / iterations),
                             "meanbusted": math.floor(meanbusted / iterations),
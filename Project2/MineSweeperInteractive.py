@@ -23,8 +23,10 @@ class MineSweeperInteractive:
     """
 
     # Constructor with 1 argument, size of minesweeper
-    def __init__(self, size, mode):
+    # seed makes the board and the suggestions reproducible (random.Random(seed)), None is a new game each time
+    def __init__(self, size, mode, seed=None):
         self.size = size
+        self.random = random.Random(seed)  # own generator, games never share the global random state
         self.mode = mode
         self.variables = set()
         self.variabledic = {}
@@ -41,8 +43,8 @@ class MineSweeperInteractive:
         self._mines = set()
         # Setting mines at random location
         while len(self._mines) < mines_number:
-            self._mines.add((random.randrange(size),
-                             random.randrange(size)))
+            self._mines.add((self.random.randrange(size),
+                             self.random.randrange(size)))
 
         # For each square, gives the set of its neighbours
         # ni = not identified
@@ -338,7 +340,7 @@ class MineSweeperInteractive:
         else:
             # get remaining cells excluding the opened and flagged cells
             permittedsteps = self.cells - self.opened - self.flagged
-            step = random.choice(list(permittedsteps))  # from these cells, choose one randomly
+            step = self.random.choice(list(permittedsteps))  # from these cells, choose one randomly
             # Marking that this hint is a random suggestion
             rand = 1
         self.suggestedstep = (step, rand)
@@ -502,7 +504,7 @@ class MineSweeperInteractive:
                 rand = 2
             else:  # otherwise
                 permittedsteps = self.cells - self.opened - self.flagged  # get the remaining cells
-                step = random.choice(list(permittedsteps))  # and from these cells, choose one randomly
+                step = self.random.choice(list(permittedsteps))  # and from these cells, choose one randomly
                 rand = 1  # implies that the agent has to take a random step
         self.suggestedstep = (step, rand)  # defines the step that the agent has to take
         return step, rand  # and return the step
@@ -609,7 +611,7 @@ class MineSweeperInteractiveGUI(MineSweeperInteractive):
             self.refresh(xy)
         # Starting point suggestion
 
-        self.suggestedstep = (random.choice(list(self.cells)), 1)
+        self.suggestedstep = (self.random.choice(list(self.cells)), 1)
         self.displayhint(self.suggestedstep)
 
     # Update GUI for given square